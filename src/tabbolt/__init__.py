@@ -3,12 +3,23 @@ from __future__ import annotations
 
 from importlib import metadata
 
-from .api import extract
-from .models import Cell, DocResult, Table
+from .api import extract, extract_partial, iter_extract, merge_partial_results, parse
+from .models import Cell, DocResult, PartialResult, Table
 
 try:
     __version__ = metadata.version("tabbolt")
 except metadata.PackageNotFoundError:  # pragma: no cover
     __version__ = "0.1.0"
 
-__all__ = ["extract", "Cell", "Table", "DocResult", "__version__"]
+__all__ = [
+    "extract",
+    "iter_extract",
+    "extract_partial",
+    "merge_partial_results",
+    "parse",
+    "Cell",
+    "Table",
+    "DocResult",
+    "PartialResult",
+    "__version__",
+]
@@ -1,36 +1,337 @@
 """Public API for TabBolt."""
 from __future__ import annotations
 
-from pathlib import Path
-from typing import Sequence
+import os
+from typing import Any, BinaryIO, Iterable, Iterator, Sequence
 
-import pdfplumber
+import numpy as np
 
-from .detect.base import Detector
-from .geometry import snap_epsilon
-from .models import DocResult, Table
+from .artifact import ParsedPage, write_parsed
+from .detect.base import DetectedRegion, Detector
+from .detect.consolidate import consolidate_regions
+from .detect.prescreen import screen_page
+from .geometry import as_bbox_array, bbox_envelope, expand_bbox, overlap_mask, snap_epsilon
+from .models import DocResult, PartialResult, Table
 from .plugins.entrypoints import get_detector
-from .resolve import apply_merges, build_grid, stitch_tables
+from .resolve import (
+    TemplateCache,
+    apply_merges,
+    build_grid,
+    iter_stitched,
+    split_open_head,
+    stitch_shards,
+    stitch_tables,
+)
+from .source import PDFSource, open_pdf, shared_source
+
+_WORD_OPTIONS: dict[str, Any] = {
+    "extra_attrs": ["size"],
+    "keep_blank_chars": False,
+    "x_tolerance": 3,
+    "y_tolerance": 3,
+}
 
 
 def extract(
-    pdf_path: str | Path,
+    source: PDFSource,
     *,
     pages: Sequence[int] | None = None,
     detector: str | Detector | None = None,
     stitch_aggressiveness: str = "med",
+    stitch_mode: str = "sequential",
+    stitch_lookback: int = 1,
+    crop_words: bool = False,
+    crop_padding: float = 24.0,
+    prescreen: float | None = None,
+    epsilon: float | None = None,
+    grid_mode: str = "auto",
+    templates: TemplateCache | None = None,
 ) -> DocResult:
-    """Extract tables from ``pdf_path``."""
+    """Extract tables from ``source``.
+
+    ``source`` may be a filesystem path, a bytes-like object, a memory-mapped
+    file or a binary file object. In-memory inputs are shared between the
+    detector and the resolution pass without copying. ``stitch_mode`` and
+    ``stitch_lookback`` are passed to :func:`~tabbolt.resolve.stitch_tables`.
+
+    With ``crop_words`` words are extracted only from the page area covered by
+    the detected regions, padded by ``crop_padding`` points. Pages where text
+    outside the crop shares a line with region words fall back to full-page
+    extraction, so the output never changes; the saving is limited to word
+    grouping, as the page is parsed in full either way.
+
+    ``prescreen`` enables a cheap page classifier before detection: pages
+    scoring below the threshold (see :func:`~tabbolt.detect.screen_page`) are
+    skipped entirely. The screen reads each page's content stream rather than
+    its chars, so skipped pages are never parsed. Lower values favour recall,
+    higher values speed. The number of skipped pages is reported in
+    ``stats["pages_skipped"]``.
+
+    ``epsilon`` overrides the adaptive row/column snapping tolerance that is
+    otherwise derived from the word heights of each region.
+
+    ``grid_mode`` is passed to :func:`~tabbolt.resolve.build_grid`: ``"auto"``
+    resolves fully ruled regions from their ruling-line lattice and all others
+    by word snapping; ``"words"`` and ``"lattice"`` force one or the other.
+
+    ``templates`` is a :class:`~tabbolt.resolve.TemplateCache`; regions whose
+    layout matches a cached template reuse its grid, and the number of such
+    regions is reported in ``stats["template_hits"]``.
+
+    ``source`` may also be a ``.tbz`` parse artifact written by :func:`parse`,
+    in which case no PDF parsing happens at all.
+
+    ``extract`` keeps no module-level state and may run concurrently on a
+    thread pool. A detector passed by name is shared between threads unless
+    it declares ``reentrant = False``; see
+    :func:`~tabbolt.plugins.entrypoints.get_detector`.
+    """
 
-    pdf_path = str(Path(pdf_path))
     detector_obj = _resolve_detector(detector)
-    page_filter = sorted(set(int(p) for p in pages)) if pages else None
-    detections = detector_obj.detect(pdf_path, pages=page_filter)
+    tables, run_stats, warnings = _extract_tables(
+        source,
+        pages,
+        detector_obj,
+        crop_words=crop_words,
+        crop_padding=crop_padding,
+        prescreen=prescreen,
+        epsilon=epsilon,
+        grid_mode=grid_mode,
+        templates=templates,
+    )
+    stitched = stitch_tables(
+        tables,
+        aggressiveness=stitch_aggressiveness,
+        mode=stitch_mode,
+        lookback=stitch_lookback,
+    )
+    stats = {
+        "detector": detector_obj.name,
+        **run_stats,
+        "tables": len(stitched),
+    }
+    return DocResult(tables=stitched, stats=stats, warnings=warnings)
+
+
+class TableStream:
+    """Iterator over the stitched tables of one document.
+
+    ``stats`` and ``warnings`` fill in as iteration proceeds and are complete
+    once the stream is exhausted.
+    """
+
+    def __init__(self, tables: Iterator[Table], stats: dict[str, Any], warnings: list[str]) -> None:
+        self._tables = tables
+        self.stats = stats
+        self.warnings = warnings
+
+    def __iter__(self) -> TableStream:
+        return self
 
-    tables: list[Table] = []
+    def __next__(self) -> Table:
+        table = next(self._tables)
+        self.stats["tables"] = self.stats.get("tables", 0) + 1
+        return table
+
+
+def iter_extract(
+    source: PDFSource,
+    *,
+    pages: Sequence[int] | None = None,
+    detector: str | Detector | None = None,
+    stitch_aggressiveness: str = "med",
+    crop_words: bool = False,
+    crop_padding: float = 24.0,
+    prescreen: float | None = None,
+    epsilon: float | None = None,
+    grid_mode: str = "auto",
+    templates: TemplateCache | None = None,
+) -> TableStream:
+    """Extract tables from ``source``, yielding each as soon as it is final.
+
+    Produces the same tables as :func:`extract` in sequential stitch mode, but
+    a table is handed out once the next table fails to continue it, so
+    consumers can write output while later pages are still being resolved.
+    """
+
+    detector_obj = _resolve_detector(detector)
+    stats: dict[str, Any] = {"detector": detector_obj.name}
     warnings: list[str] = []
+    regions = _iter_region_tables(
+        source,
+        pages,
+        detector_obj,
+        stats=stats,
+        warnings=warnings,
+        crop_words=crop_words,
+        crop_padding=crop_padding,
+        prescreen=prescreen,
+        epsilon=epsilon,
+        grid_mode=grid_mode,
+        templates=templates,
+    )
+    return TableStream(
+        iter_stitched(regions, aggressiveness=stitch_aggressiveness), stats, warnings
+    )
 
-    with pdfplumber.open(pdf_path) as pdf:
+
+def extract_partial(
+    source: PDFSource,
+    *,
+    pages: Sequence[int] | None = None,
+    detector: str | Detector | None = None,
+    stitch_aggressiveness: str = "med",
+    crop_words: bool = False,
+    crop_padding: float = 24.0,
+    prescreen: float | None = None,
+) -> PartialResult:
+    """Extract one page-range shard of ``source`` for a later merge.
+
+    Shards of the same document are combined with :func:`merge_partial_results`,
+    which yields the same tables as a single sequential-mode :func:`extract` run.
+    """
+
+    detector_obj = _resolve_detector(detector)
+    tables, run_stats, warnings = _extract_tables(
+        source,
+        pages,
+        detector_obj,
+        crop_words=crop_words,
+        crop_padding=crop_padding,
+        prescreen=prescreen,
+    )
+    head, closed = split_open_head(tables, aggressiveness=stitch_aggressiveness)
+    stats = {
+        "detector": detector_obj.name,
+        **run_stats,
+    }
+    return PartialResult(
+        pages=sorted(set(int(p) for p in pages)) if pages else [],
+        head=head,
+        tables=closed,
+        stitch_aggressiveness=stitch_aggressiveness,
+        stats=stats,
+        warnings=warnings,
+    )
+
+
+def merge_partial_results(partials: Iterable[PartialResult]) -> DocResult:
+    """Merge shard results into the document result.
+
+    Shards are ordered by their first page and must share a stitch setting.
+    """
+
+    ordered = sorted(partials, key=lambda part: part.first_page)
+    if not ordered:
+        return DocResult(tables=[])
+    aggressiveness = {part.stitch_aggressiveness for part in ordered}
+    if len(aggressiveness) > 1:
+        raise ValueError(f"Partial results use different stitch settings: {sorted(aggressiveness)}")
+    stitched = stitch_shards(
+        ((part.head, part.tables) for part in ordered),
+        aggressiveness=ordered[0].stitch_aggressiveness,
+    )
+    stats: dict[str, Any] = {
+        "detector": ordered[0].stats.get("detector"),
+        "regions": sum(int(part.stats.get("regions", 0)) for part in ordered),
+    }
+    for key in ("pages_screened", "pages_skipped"):
+        if any(key in part.stats for part in ordered):
+            stats[key] = sum(int(part.stats.get(key, 0)) for part in ordered)
+    stats["tables"] = len(stitched)
+    stats["shards"] = len(ordered)
+    warnings = [warning for part in ordered for warning in part.warnings]
+    return DocResult(tables=stitched, stats=stats, warnings=warnings)
+
+
+def parse(
+    source: PDFSource,
+    out: str | os.PathLike[str] | BinaryIO,
+    *,
+    pages: Sequence[int] | None = None,
+) -> None:
+    """Parse ``source`` once and write a reusable ``.tbz`` artifact to ``out``.
+
+    The artifact can be passed anywhere a PDF source is accepted. Its arrays
+    are memory mapped, so repeated runs skip PDF parsing. With ``pages`` only
+    those pages are parsed; the others keep their geometry but no content.
+    """
+
+    with shared_source(source) as shared, open_pdf(shared) as pdf:
+        write_parsed(pdf, out, word_options=_WORD_OPTIONS, pages=pages)
+
+
+def _extract_tables(
+    source: PDFSource,
+    pages: Sequence[int] | None,
+    detector_obj: Detector,
+    *,
+    crop_words: bool,
+    crop_padding: float,
+    prescreen: float | None,
+    epsilon: float | None = None,
+    grid_mode: str = "auto",
+    templates: TemplateCache | None = None,
+) -> tuple[list[Table], dict[str, Any], list[str]]:
+    stats: dict[str, Any] = {}
+    warnings: list[str] = []
+    tables = list(
+        _iter_region_tables(
+            source,
+            pages,
+            detector_obj,
+            stats=stats,
+            warnings=warnings,
+            crop_words=crop_words,
+            crop_padding=crop_padding,
+            prescreen=prescreen,
+            epsilon=epsilon,
+            grid_mode=grid_mode,
+            templates=templates,
+        )
+    )
+    return tables, stats, warnings
+
+
+def _iter_region_tables(
+    source: PDFSource,
+    pages: Sequence[int] | None,
+    detector_obj: Detector,
+    *,
+    stats: dict[str, Any],
+    warnings: list[str],
+    crop_words: bool,
+    crop_padding: float,
+    prescreen: float | None,
+    epsilon: float | None,
+    grid_mode: str = "auto",
+    templates: TemplateCache | None = None,
+) -> Iterator[Table]:
+    """Yield one unstitched table per detected region, in page order.
+
+    ``stats`` and ``warnings`` are filled in as the document is processed.
+    """
+
+    page_filter = sorted(set(int(p) for p in pages)) if pages else None
+
+    with shared_source(source) as shared, open_pdf(shared) as pdf:
+        skipped: int | None = None
+        if prescreen is not None:
+            page_filter, skipped = _prescreen_pages(pdf, page_filter, prescreen)
+        detections = detector_obj.detect(shared, pages=page_filter) if page_filter != [] else []
+        detected = len(detections)
+        # overlapping proposals would otherwise be resolved and emitted twice
+        detections = sorted(consolidate_regions(detections), key=lambda region: region.page)
+        stats["regions"] = len(detections)
+        stats["regions_merged"] = detected - len(detections)
+        if skipped is not None:
+            stats["pages_screened"] = len(page_filter or []) + skipped
+            stats["pages_skipped"] = skipped
+        page_regions: dict[int, list[DetectedRegion]] = {}
+        for region in detections:
+            page_regions.setdefault(region.page, []).append(region)
+        words_page: int | None = None
+        words: list[dict[str, Any]] = []
         for region in detections:
             page_index = region.page - 1
             if page_index < 0 or page_index >= len(pdf.pages):
@@ -39,31 +340,114 @@ def extract(
             page = pdf.pages[page_index]
             if getattr(page, "rotation", 0):
                 page = page.rotate(-page.rotation)
-            words = page.extract_words(extra_attrs=["size"], keep_blank_chars=False)
+            if region.page != words_page:
+                # artifact pages hold their words already; cropping would only add work
+                if crop_words and not isinstance(page, ParsedPage):
+                    words = _region_words(page, page_regions[region.page], crop_padding)
+                else:
+                    words = page.extract_words(**_WORD_OPTIONS)
+                words_page = region.page
             region_words = [word for word in words if _overlaps(_word_bbox(word), region.bbox)]
             heights = [float(word["bottom"]) - float(word["top"]) for word in region_words]
-            epsilon = snap_epsilon(heights)
-            grid, candidate_cells = build_grid(region_words, region.bbox, region.lines, epsilon)
-            cells = apply_merges(grid, candidate_cells)
+            snap = epsilon if epsilon is not None else snap_epsilon(heights)
+            if templates is not None:
+                grid, cells, hit = templates.resolve(
+                    region_words, region.bbox, region.line_array, snap, mode=grid_mode
+                )
+                stats["template_hits"] = stats.get("template_hits", 0) + int(hit)
+            else:
+                grid, candidate_cells = build_grid(
+                    region_words, region.bbox, region.line_array, snap, mode=grid_mode
+                )
+                cells = apply_merges(grid, candidate_cells)
             table = Table(
                 page=[region.page],
                 cells=cells,
                 n_rows=grid.n_rows,
                 n_cols=grid.n_cols,
                 conf=region.conf,
-                meta={"detector_version": region.detector_version, "epsilon": epsilon},
+                meta={"detector_version": region.detector_version, "epsilon": snap},
                 page_size=(page.width, page.height),
             )
             table.sort_cells()
-            tables.append(table)
+            yield table
 
-    stitched = stitch_tables(tables, aggressiveness=stitch_aggressiveness)
-    stats = {
-        "detector": detector_obj.name,
-        "regions": len(detections),
-        "tables": len(stitched),
-    }
-    return DocResult(tables=stitched, stats=stats, warnings=warnings)
+
+def _prescreen_pages(
+    pdf: Any, page_filter: list[int] | None, threshold: float
+) -> tuple[list[int], int]:
+    """Return the pages scoring at least ``threshold`` and the skipped count."""
+
+    candidates: list[int] = []
+    skipped = 0
+    for index in page_filter or range(1, len(pdf.pages) + 1):
+        if index < 1 or index > len(pdf.pages):
+            candidates.append(index)
+            continue
+        page = pdf.pages[index - 1]
+        if screen_page(page, index).score >= threshold:
+            candidates.append(index)
+        else:
+            skipped += 1
+            page.close()
+    return candidates, skipped
+
+
+def _region_words(
+    page: Any, regions: Sequence[DetectedRegion], padding: float
+) -> list[dict[str, Any]]:
+    """Extract words from the padded union of ``regions`` on ``page``.
+
+    Only chars fully inside the crop are kept. pdfplumber clusters a page's
+    chars into text lines by ``top`` before splitting words, so a char
+    anywhere outside the crop can change the words inside it when it shares
+    a line cluster with them, or when dropping it merges two runs of chars
+    that pdfplumber groups separately. In those cases the whole page is
+    extracted instead, so region words always match a full-page extraction.
+    """
+
+    page_x0, page_y0, page_x1, page_y1 = (float(v) for v in page.bbox)
+    x0, y0, x1, y1 = expand_bbox(bbox_envelope([r.bbox for r in regions]), padding)
+    crop = (max(x0, page_x0), max(y0, page_y0), min(x1, page_x1), min(y1, page_y1))
+    if crop[0] >= crop[2] or crop[1] >= crop[3]:
+        return []
+    if crop == (page_x0, page_y0, page_x1, page_y1):
+        return page.extract_words(**_WORD_OPTIONS)
+    words = page.within_bbox(crop).extract_words(**_WORD_OPTIONS)
+    if not words:
+        return words
+    chars = page.chars
+    boxes = as_bbox_array([_word_bbox(char) for char in chars])
+    inside = (
+        (boxes[:, 0] >= crop[0])
+        & (boxes[:, 1] >= crop[1])
+        & (boxes[:, 2] <= crop[2])
+        & (boxes[:, 3] <= crop[3])
+    )
+    if inside.all():
+        return words
+    # chars are grouped into runs of equal upright and extra attributes, in
+    # stream order; dropping the chars between two runs would merge them
+    group_keys = ["upright", *_WORD_OPTIONS["extra_attrs"]]
+    keys = [tuple(char.get(key) for key in group_keys) for char in chars]
+    runs = np.cumsum([0] + [a != b for a, b in zip(keys, keys[1:])])
+    kept = np.flatnonzero(inside)
+    kept_keys = [keys[i] for i in kept.tolist()]
+    kept_breaks = np.array([a != b for a, b in zip(kept_keys, kept_keys[1:])], dtype=bool)
+    if not np.array_equal(kept_breaks, np.diff(runs[kept]) != 0):
+        return page.extract_words(**_WORD_OPTIONS)
+    word_boxes = as_bbox_array([_word_bbox(word) for word in words])
+    in_region = overlap_mask(word_boxes, [r.bbox for r in regions]).any(axis=1)
+    region_chars = inside & overlap_mask(boxes, word_boxes[in_region]).any(axis=1)
+    # the same chaining of tops within y_tolerance that pdfplumber clusters lines by
+    order = np.argsort(boxes[:, 1], kind="stable")
+    cluster = np.empty(len(boxes), dtype=np.int64)
+    cluster[order] = np.concatenate(
+        [[0], np.cumsum(np.diff(boxes[order, 1]) > _WORD_OPTIONS["y_tolerance"])]
+    )
+    if np.isin(cluster[~inside], cluster[region_chars]).any():
+        return page.extract_words(**_WORD_OPTIONS)
+    return words
 
 
 def _word_bbox(word: dict[str, float]) -> tuple[float, float, float, float]:
@@ -89,4 +473,11 @@ def _resolve_detector(detector: str | Detector | None) -> Detector:
     return detector
 
 
-__all__ = ["extract"]
+__all__ = [
+    "extract",
+    "iter_extract",
+    "TableStream",
+    "extract_partial",
+    "merge_partial_results",
+    "parse",
+]
@@ -0,0 +1,487 @@
+"""Reusable parse artifacts (``.tbz``).
+
+A parse artifact stores what tabbolt reads from a PDF page - chars, words,
+ruling lines, rects and the page geometry - as packed NumPy arrays plus a
+string table. Parse once with :func:`write_parsed` (or ``tabbolt parse``),
+then hand the artifact to :func:`tabbolt.extract`, any detector or
+:func:`tabbolt.debug.render_overlay` as often as needed; the arrays are memory
+mapped, not re-parsed.
+
+Layout: ``MAGIC``, a little-endian ``uint64`` header length, a JSON header
+describing every array (dtype, shape, offset), then the array data, each
+aligned to 64 bytes.
+"""
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import threading
+import warnings
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Sequence
+
+import numpy as np
+
+MAGIC = b"TBZ1"
+SUFFIX = ".tbz"
+_ALIGN = 64
+_HEADER = struct.Struct("<4sQ")
+
+
+class ParsedPage:
+    """A page read from a parse artifact.
+
+    Implements the subset of the pdfplumber page interface tabbolt uses:
+    ``chars``, ``lines``, ``rects``, ``extract_words``, ``close`` and the page
+    geometry (``page_number``, ``width``, ``height``, ``bbox``, ``rotation``).
+    Chars and words carry ``text``, ``x0``, ``x1``, ``top``, ``bottom``,
+    ``doctop``, ``width``, ``height`` and ``size`` only; font names, advances
+    and text direction are not stored. Other pdfplumber page attributes, such
+    as ``crop`` or ``within_bbox``, raise ``AttributeError`` naming this
+    subset. Dict views are built lazily from the packed arrays and cached.
+    """
+
+    def __init__(
+        self, doc: ParsedDocument, index: int, meta: dict[str, Any], doctop: float = 0.0
+    ) -> None:
+        self._doc = doc
+        self._doctop = doctop
+        self.page_number = index + 1
+        self.width = float(meta["width"])
+        self.height = float(meta["height"])
+        self.bbox = tuple(float(v) for v in meta["bbox"])
+        self.rotation = int(meta.get("rotation", 0))
+        self.parsed = bool(meta.get("parsed", True))
+        self._index = index
+        self._cache: dict[str, list[dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    # array slices are taken on access, so a page never pins the mapping itself
+    @property
+    def char_boxes(self) -> np.ndarray:
+        return self._doc._slice("chars", self._index)[0]
+
+    @property
+    def word_boxes(self) -> np.ndarray:
+        return self._doc._slice("words", self._index)[0]
+
+    @property
+    def line_boxes(self) -> np.ndarray:
+        return self._doc._slice("lines", self._index)[0]
+
+    @property
+    def rect_boxes(self) -> np.ndarray:
+        return self._doc._slice("rects", self._index)[0]
+
+    @property
+    def chars(self) -> list[dict[str, Any]]:
+        return self._cached("chars", lambda: self._text_objects("chars", "char"))
+
+    @property
+    def lines(self) -> list[dict[str, Any]]:
+        return self._cached("lines", lambda: _edge_objects(self.line_boxes, "line"))
+
+    @property
+    def rects(self) -> list[dict[str, Any]]:
+        return self._cached("rects", lambda: _edge_objects(self.rect_boxes, "rect"))
+
+    def extract_words(self, **options: Any) -> list[dict[str, Any]]:
+        """Return the words stored at parse time.
+
+        Raises ``ValueError`` when ``options`` differ from the options the
+        artifact was parsed with.
+        """
+
+        if options and _normalize_options(options) != self._doc.word_options:
+            raise ValueError(
+                f"Artifact words were parsed with {self._doc.word_options}, not {options}"
+            )
+        return list(
+            self._cached("words", lambda: self._text_objects("words", "word"))
+        )
+
+    def close(self) -> None:
+        """Drop the cached dict views, unless the document has been borrowed.
+
+        Borrowed views share these pages, so their caches stay until the
+        owning document and its views are closed.
+        """
+
+        if not self._doc._shared:
+            self._drop_cache()
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        raise AttributeError(
+            f"ParsedPage has no {name!r}: parse artifacts only provide chars, lines, rects, "
+            "extract_words and the page geometry; open the PDF for the full pdfplumber page"
+        )
+
+    def _drop_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def _cached(self, key: str, build: Callable[[], list[dict[str, Any]]]) -> list[dict[str, Any]]:
+        objects = self._cache.get(key)
+        if objects is None:
+            # one build per page and kind, even with many threads asking at once
+            with self._lock:
+                objects = self._cache.get(key)
+                if objects is None:
+                    objects = self._cache[key] = build()
+        return objects
+
+    def _text_objects(self, array: str, kind: str) -> list[dict[str, Any]]:
+        boxes, text_ids = self._doc._slice(array, self._index)
+        strings = self._doc.strings
+        objects = []
+        for (x0, top, x1, bottom, size), text_id in zip(boxes.tolist(), text_ids.tolist()):
+            obj = {
+                "text": strings[text_id],
+                "x0": x0,
+                "x1": x1,
+                "top": top,
+                "bottom": bottom,
+                "doctop": top + self._doctop,
+                "width": x1 - x0,
+                "height": bottom - top,
+                "size": size,
+            }
+            if kind == "char":
+                obj["object_type"] = "char"
+            objects.append(obj)
+        return objects
+
+
+class ParsedDocument:
+    """Memory-mapped parse artifact.
+
+    Usable as a context manager like ``pdfplumber.PDF``. Instances created by
+    :meth:`borrow` share the arrays; the mapping is closed once the document
+    and all of its views are closed.
+    """
+
+    def __init__(
+        self,
+        buffer: memoryview,
+        header: dict[str, Any],
+        data_offset: int,
+        *,
+        mapping: mmap.mmap | None = None,
+    ) -> None:
+        self._shared = False
+        self._closed = False
+        self._header = header
+        self._data_offset = data_offset
+        self.word_options: dict[str, Any] = header["word_options"]
+        self._arrays = {
+            name: _array_view(buffer, spec, data_offset) for name, spec in header["arrays"].items()
+        }
+        blob = self._arrays["string_blob"].tobytes()
+        offsets = self._arrays["string_offsets"].tolist()
+        self.strings = [blob[a:b].decode("utf-8") for a, b in zip(offsets, offsets[1:])]
+        heights = [0.0, *(float(meta["height"]) for meta in header["pages"])]
+        doctops = np.cumsum(heights[:-1]).tolist()
+        self.pages = [
+            ParsedPage(self, idx, meta, doctops[idx]) for idx, meta in enumerate(header["pages"])
+        ]
+        self._holders = _Holders(buffer, mapping, self._arrays, self.pages)
+
+    @classmethod
+    def open(cls, source: str | os.PathLike[str] | memoryview | bytes | BinaryIO) -> ParsedDocument:
+        """Open an artifact from a path, a buffer or a binary file object."""
+
+        mapping = None
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, "rb") as handle:
+                mapping = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            buffer = memoryview(mapping)
+        elif isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+            buffer = memoryview(source)
+        else:
+            source.seek(0)
+            buffer = memoryview(source.read())
+        header, data_offset = _read_header(buffer, MAGIC, "Not a tabbolt parse artifact")
+        return cls(buffer, header, data_offset, mapping=mapping)
+
+    def borrow(self) -> ParsedDocument:
+        """Return a view of this document whose ``close`` leaves it open.
+
+        Views share the pages, including the dict views cached on them, so
+        concurrent runs on one document build each page's chars and words
+        once. From the first borrow on, page caches are only dropped, and the
+        mapping closed, when this document and every view have been closed.
+        """
+
+        if self._closed:
+            raise ValueError("Parse artifact is closed")
+        self._shared = True
+        self._holders.acquire()
+        view = object.__new__(ParsedDocument)
+        view.__dict__.update(self.__dict__)
+        return view
+
+    def close(self) -> None:
+        """Release this document or view.
+
+        The page caches are dropped and the mapping closed when the last of
+        the document and its views is closed.
+        """
+
+        if self._closed:
+            return
+        self._closed = True
+        self.pages = []
+        self._holders.release()
+
+    def __enter__(self) -> ParsedDocument:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _slice(self, kind: str, index: int) -> tuple[np.ndarray, np.ndarray]:
+        if not self._arrays:
+            raise ValueError("Parse artifact is closed")
+        offsets = self._arrays[f"{kind}_offsets"]
+        start, stop = int(offsets[index]), int(offsets[index + 1])
+        boxes = self._arrays[f"{kind}_boxes"][start:stop]
+        text = self._arrays.get(f"{kind}_text")
+        return boxes, (text[start:stop] if text is not None else np.empty(0, dtype=np.int32))
+
+
+class _Holders:
+    """Counts the document and views sharing one artifact buffer."""
+
+    def __init__(
+        self,
+        buffer: memoryview,
+        mapping: mmap.mmap | None,
+        arrays: dict[str, np.ndarray],
+        pages: list[ParsedPage],
+    ) -> None:
+        self._buffer = buffer
+        self._mapping = mapping
+        self._arrays = arrays
+        self._pages = pages
+        self._count = 1
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            self._count += 1
+
+    def release(self) -> None:
+        with self._lock:
+            self._count -= 1
+            if self._count:
+                return
+        for page in self._pages:
+            page._drop_cache()
+        self._pages = []
+        self._arrays.clear()
+        if self._mapping is not None:
+            mapping, self._mapping = self._mapping, None
+            try:
+                self._buffer.release()
+                mapping.close()
+            except BufferError:
+                warnings.warn(
+                    "Parse artifact arrays are still referenced; the file stays mapped "
+                    "until they are released",
+                    ResourceWarning,
+                    stacklevel=3,
+                )
+
+
+def is_parsed_artifact(source: Any) -> bool:
+    """Return whether ``source`` (path, buffer or file object) holds an artifact."""
+
+    if isinstance(source, ParsedDocument):
+        return True
+    if isinstance(source, (str, os.PathLike)):
+        try:
+            with open(source, "rb") as handle:
+                return handle.read(len(MAGIC)) == MAGIC
+        except OSError:
+            return False
+    if isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+        return bytes(memoryview(source)[: len(MAGIC)]) == MAGIC
+    if hasattr(source, "read") and hasattr(source, "seek"):
+        position = source.tell()
+        try:
+            return source.read(len(MAGIC)) == MAGIC
+        finally:
+            source.seek(position)
+    return False
+
+
+def write_parsed(
+    pdf: Any,
+    out: str | os.PathLike[str] | BinaryIO,
+    *,
+    word_options: dict[str, Any],
+    pages: Sequence[int] | None = None,
+) -> None:
+    """Parse an open pdfplumber ``pdf`` and write the artifact to ``out``.
+
+    Pages outside ``pages`` keep their geometry but no content. Page caches
+    are released as soon as each page is packed.
+    """
+
+    selected = set(pages or [])
+    strings: dict[str, int] = {}
+    packed: dict[str, list[list[Any]]] = {kind: [] for kind in ("chars", "words", "lines", "rects")}
+    texts: dict[str, list[int]] = {"chars": [], "words": []}
+    offsets: dict[str, list[int]] = {kind: [0] for kind in packed}
+    page_meta: list[dict[str, Any]] = []
+    for index, page in enumerate(pdf.pages, start=1):
+        parsed = not selected or index in selected
+        page_meta.append(
+            {
+                "width": float(page.width),
+                "height": float(page.height),
+                "bbox": [float(v) for v in page.bbox],
+                "rotation": int(getattr(page, "rotation", 0) or 0),
+                "parsed": parsed,
+            }
+        )
+        if parsed:
+            for kind, objects in (
+                ("chars", page.chars),
+                ("words", page.extract_words(**word_options)),
+            ):
+                for obj in objects:
+                    packed[kind].append(_text_row(obj))
+                    texts[kind].append(strings.setdefault(str(obj["text"]), len(strings)))
+            for kind, objects in (("lines", page.lines), ("rects", page.rects)):
+                packed[kind].extend(_edge_row(obj) for obj in objects)
+            page.close()
+        for kind in packed:
+            offsets[kind].append(len(packed[kind]))
+
+    encoded = [text.encode("utf-8") for text in strings]
+    string_offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    string_offsets[1:] = np.cumsum([len(chunk) for chunk in encoded], dtype=np.int64)
+    arrays: dict[str, np.ndarray] = {
+        "string_blob": np.frombuffer(b"".join(encoded), dtype=np.uint8),
+        "string_offsets": string_offsets,
+    }
+    for kind, rows in packed.items():
+        width = 5 if kind in texts else 4
+        arrays[f"{kind}_boxes"] = np.asarray(rows, dtype=np.float64).reshape(-1, width)
+        arrays[f"{kind}_offsets"] = np.asarray(offsets[kind], dtype=np.int64)
+        if kind in texts:
+            arrays[f"{kind}_text"] = np.asarray(texts[kind], dtype=np.int32)
+    _write_arrays(out, arrays, {"word_options": _normalize_options(word_options), "pages": page_meta})
+
+
+def _write_arrays(
+    out: str | os.PathLike[str] | BinaryIO,
+    arrays: dict[str, np.ndarray],
+    meta: dict[str, Any],
+    *,
+    magic: bytes = MAGIC,
+) -> None:
+    specs: dict[str, dict[str, Any]] = {}
+    position = 0
+    for name, array in arrays.items():
+        position = _aligned(position)
+        specs[name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": position}
+        position += array.nbytes
+    header = json.dumps({"version": 1, **meta, "arrays": specs}).encode("utf-8")
+    handle: BinaryIO
+    if isinstance(out, (str, os.PathLike)):
+        handle = open(out, "wb")
+    else:
+        handle = out
+    try:
+        handle.write(_HEADER.pack(magic, len(header)))
+        handle.write(header)
+        start = _HEADER.size + len(header)
+        handle.write(b"\0" * (_aligned(start) - start))
+        written = 0
+        for name, array in arrays.items():
+            offset = specs[name]["offset"]
+            handle.write(b"\0" * (offset - written))
+            handle.write(np.ascontiguousarray(array).tobytes())
+            written = offset + array.nbytes
+    finally:
+        if handle is not out:
+            handle.close()
+
+
+def _read_header(buffer: memoryview, magic: bytes, error: str) -> tuple[dict[str, Any], int]:
+    """Return the JSON header of a file written by :func:`_write_arrays` and its data offset."""
+
+    if len(buffer) < _HEADER.size:
+        raise ValueError(error)
+    found, header_len = _HEADER.unpack_from(buffer, 0)
+    if found != magic:
+        raise ValueError(error)
+    header = json.loads(bytes(buffer[_HEADER.size : _HEADER.size + header_len]))
+    return header, _aligned(_HEADER.size + header_len)
+
+
+def _array_view(buffer: memoryview, spec: dict[str, Any], data_offset: int) -> np.ndarray:
+    dtype = np.dtype(spec["dtype"])
+    count = int(np.prod(spec["shape"]))
+    if not count:
+        return np.empty(spec["shape"], dtype=dtype)
+    offset = data_offset + int(spec["offset"])
+    return np.frombuffer(buffer, dtype=dtype, count=count, offset=offset).reshape(spec["shape"])
+
+
+def _aligned(position: int) -> int:
+    return -(-position // _ALIGN) * _ALIGN
+
+
+def _text_row(obj: dict[str, Any]) -> list[float]:
+    return [
+        float(obj["x0"]),
+        float(obj["top"]),
+        float(obj["x1"]),
+        float(obj["bottom"]),
+        float(obj.get("size", 0.0)),
+    ]
+
+
+def _edge_row(obj: dict[str, Any]) -> list[float]:
+    return [
+        float(obj.get("x0", obj.get("x1", 0.0))),
+        float(obj.get("top", obj.get("y0", 0.0))),
+        float(obj.get("x1", obj.get("x0", 0.0))),
+        float(obj.get("bottom", obj.get("y1", 0.0))),
+    ]
+
+
+def _edge_objects(boxes: np.ndarray, kind: str) -> list[dict[str, Any]]:
+    return [
+        {
+            "x0": x0,
+            "top": top,
+            "x1": x1,
+            "bottom": bottom,
+            "width": x1 - x0,
+            "height": bottom - top,
+            "object_type": kind,
+        }
+        for x0, top, x1, bottom in boxes.tolist()
+    ]
+
+
+def _normalize_options(options: dict[str, Any]) -> dict[str, Any]:
+    return json.loads(json.dumps(options, sort_keys=True))
+
+
+__all__ = [
+    "MAGIC",
+    "SUFFIX",
+    "ParsedDocument",
+    "ParsedPage",
+    "is_parsed_artifact",
+    "write_parsed",
+]
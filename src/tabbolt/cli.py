@@ -1,20 +1,38 @@
 """Command line interface for TabBolt."""
 from __future__ import annotations
 
+import functools
+import glob
+import json
+import os
 import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, Callable, Iterable
 
 import click
 from rich.console import Console
 from rich.table import Table as RichTable
 
 from . import __version__
-from .api import extract
+from .api import extract, extract_partial, iter_extract, merge_partial_results, parse
+from .artifact import SUFFIX, ParsedDocument, is_parsed_artifact
 from .debug import render_overlay
 from .export import table_to_csv, table_to_html, table_to_markdown, table_to_dataframe
+from .export.writer import ARCHIVE_SUFFIXES, RenderedFiles, TableWriter
+from .manifest import JobManifest, file_digest
+from .models import PartialResult, Table
+from .resolve import TemplateCache
+from .server import DEFAULT_MAX_BODY, DEFAULT_PORT, ExtractionServer, extract_remote
+from .sweep import config_matrix, sweep
 
 console = Console()
 
+_INPUT_SUFFIXES = {".pdf", SUFFIX}
+_TEMPLATE_CACHES: dict[Path, TemplateCache] = {}
+
 
 @click.group()
 @click.version_option(__version__)
@@ -23,18 +41,61 @@ def main() -> None:
 
 
 @main.command()
-@click.argument("file", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.argument("inputs", nargs=-1, required=True)
 @click.option("--pages", type=str, default=None, help="Comma separated page ranges")
 @click.option("--detector", type=str, default="plumber", show_default=True)
 @click.option("--to", "export_format", type=click.Choice(["html", "csv", "md", "df"]), default="html")
 @click.option("--out", type=click.Path(path_type=Path), default=Path.cwd(), show_default=True)
-@click.option("--workers", type=str, default="1", show_default=True)
+@click.option(
+    "--workers",
+    type=str,
+    default="1",
+    show_default=True,
+    help="Documents processed in parallel: a number or 'auto'",
+)
 @click.option("--fill-policy", type=click.Choice(["repeat", "empty", "sentinel"]), default="repeat")
 @click.option("--stitch-aggressiveness", type=click.Choice(["low", "med", "high"]), default="med")
+@click.option(
+    "--stitch-mode", type=click.Choice(["sequential", "indexed"]), default="sequential", show_default=True
+)
+@click.option("--stitch-lookback", type=int, default=1, show_default=True)
+@click.option(
+    "--prescreen",
+    type=float,
+    default=None,
+    help="Skip pages whose table pre-screen score is below this threshold (0-1)",
+)
+@click.option(
+    "--grid-mode",
+    type=click.Choice(["auto", "words", "lattice"]),
+    default="auto",
+    show_default=True,
+    help="Build grids from word positions, ruling-line lattices, or pick per region",
+)
+@click.option(
+    "--template-cache",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="SQLite file of layout templates shared by all workers and runs",
+)
 @click.option("--inline-styles", is_flag=True, default=False)
 @click.option("--debug-overlays", is_flag=True, default=False)
+@click.option(
+    "--into",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help=f"Write all output into one file instead of --out ({', '.join(ARCHIVE_SUFFIXES)})",
+)
+@click.option("--writer-threads", type=int, default=4, show_default=True)
+@click.option(
+    "--manifest",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="JSONL job manifest; documents already recorded as done are skipped",
+)
+@click.option("--server", type=str, default=None, help="Send documents to a `tabbolt serve` URL")
 def extract_cmd(
-    file: Path,
+    inputs: tuple[str, ...],
     pages: str | None,
     detector: str,
     export_format: str,
@@ -42,39 +103,468 @@ def extract_cmd(
     workers: str,
     fill_policy: str,
     stitch_aggressiveness: str,
+    stitch_mode: str,
+    stitch_lookback: int,
+    prescreen: float | None,
+    grid_mode: str,
+    template_cache: Path | None,
     inline_styles: bool,
     debug_overlays: bool,
+    into: Path | None,
+    writer_threads: int,
+    manifest: Path | None,
+    server: str | None,
 ) -> None:
-    """Extract tables from FILE."""
+    """Extract tables from INPUTS: PDFs, `.tbz` parse artifacts, directories or globs.
 
-    if workers not in {"1", "auto"}:
-        console.print("[yellow]Parallel workers not implemented; running single-threaded.[/yellow]")
-    page_list = _parse_pages(pages) if pages else None
-    result = extract(
-        file,
-        pages=page_list,
+    Directories are searched recursively for `.pdf` and `.tbz` files. In
+    sequential stitch mode each table is written as soon as it is final,
+    while later pages are still being extracted.
+    """
+
+    if into is not None and into.suffix.lower() not in ARCHIVE_SUFFIXES:
+        raise click.BadParameter(f"must end in one of {', '.join(ARCHIVE_SUFFIXES)}", param_hint="--into")
+    documents = _expand_inputs(inputs)
+    settings = _ExtractSettings(
+        pages=tuple(_parse_pages(pages)) if pages else None,
         detector=detector,
+        export_format=export_format,
+        out=out,
+        fill_policy=fill_policy,
         stitch_aggressiveness=stitch_aggressiveness,
+        stitch_mode=stitch_mode,
+        stitch_lookback=stitch_lookback,
+        prescreen=prescreen,
+        grid_mode=grid_mode,
+        template_cache=template_cache,
+        inline_styles=inline_styles,
+        debug_overlays=debug_overlays,
+        writer_threads=writer_threads,
+        server=server,
+    )
+    job = JobManifest(manifest, output=_output_key(settings, into)) if manifest is not None else None
+    n_workers = (os.cpu_count() or 1) if workers == "auto" else max(1, int(workers))
+    n_workers = min(n_workers, len(documents))
+    batch = len(documents) > 1 or job is not None
+
+    todo: list[tuple[Path, str, str]] = []
+    skipped = 0
+    for path, stem in documents:
+        digest = file_digest(path) if job is not None else ""
+        if job is not None and job.is_done(path, digest):
+            skipped += 1
+            continue
+        todo.append((path, stem, digest))
+
+    start = time.perf_counter()
+    outcomes: list[_DocumentOutcome] = []
+    # a resumed run adds to the bundle holding the documents it skips
+    with TableWriter(out, into=into, threads=writer_threads, append=job is not None) as writer:
+        if n_workers > 1:
+            with ProcessPoolExecutor(max_workers=n_workers) as pool:
+                futures = {
+                    pool.submit(_extract_in_worker, path, stem, settings, into is not None): (path, digest)
+                    for path, stem, digest in todo
+                }
+                for future in as_completed(futures):
+                    path, digest = futures[future]
+                    try:
+                        outcome, files = future.result()
+                    except Exception as exc:  # noqa: BLE001 - reported per document
+                        outcome = _DocumentOutcome.failed(path, exc)
+                        files = []
+                    if files:
+                        writer.submit(functools.partial(list, files))
+                    outcomes.append(_finish(outcome, digest, job, batch, writer))
+        else:
+            for path, stem, digest in todo:
+                try:
+                    outcome = _extract_document(path, stem, settings, writer.submit)
+                except Exception as exc:
+                    if not batch:
+                        raise
+                    outcome = _DocumentOutcome.failed(path, exc)
+                outcomes.append(_finish(outcome, digest, job, batch, writer))
+    elapsed = time.perf_counter() - start
+
+    if not batch:
+        stats = outcomes[0].stats
+        if "pages_skipped" in stats:
+            console.print(
+                f"Pre-screen skipped {stats['pages_skipped']} of "
+                f"{stats['pages_screened']} pages."
+            )
+        console.print(f"[green]Extracted {outcomes[0].tables} tables.[/green]")
+        return
+    _print_summary(outcomes, skipped=skipped, elapsed=elapsed)
+    if any(outcome.error for outcome in outcomes):
+        raise SystemExit(1)
+
+
+@dataclass(frozen=True)
+class _ExtractSettings:
+    pages: tuple[int, ...] | None
+    detector: str
+    export_format: str
+    out: Path
+    fill_policy: str
+    stitch_aggressiveness: str
+    stitch_mode: str
+    stitch_lookback: int
+    prescreen: float | None
+    grid_mode: str
+    template_cache: Path | None
+    inline_styles: bool
+    debug_overlays: bool
+    writer_threads: int
+    server: str | None = None
+
+
+@dataclass
+class _DocumentOutcome:
+    path: Path
+    tables: int = 0
+    seconds: float = 0.0
+    size: int = 0
+    stats: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+    @classmethod
+    def failed(cls, path: Path, exc: BaseException) -> _DocumentOutcome:
+        return cls(path=path, size=path.stat().st_size, error=f"{type(exc).__name__}: {exc}")
+
+
+def _extract_document(
+    path: Path,
+    stem: str,
+    settings: _ExtractSettings,
+    submit: Callable[[Callable[[], RenderedFiles]], None],
+) -> _DocumentOutcome:
+    """Extract one document, handing each table's render job to ``submit``."""
+
+    start = time.perf_counter()
+    parsed = ParsedDocument.open(path) if is_parsed_artifact(path) else None
+    source = parsed if parsed is not None else path
+    pages = list(settings.pages) if settings.pages else None
+    try:
+        if settings.server is not None:
+            result = extract_remote(
+                path,
+                settings.server,
+                pages=pages,
+                detector=settings.detector,
+                stitch_aggressiveness=settings.stitch_aggressiveness,
+                stitch_mode=settings.stitch_mode,
+                stitch_lookback=settings.stitch_lookback,
+                prescreen=settings.prescreen,
+                grid_mode=settings.grid_mode,
+            )
+            tables, stats = iter(result.tables), result.stats
+        elif settings.stitch_mode == "sequential":
+            tables = iter_extract(
+                source,
+                pages=pages,
+                detector=settings.detector,
+                stitch_aggressiveness=settings.stitch_aggressiveness,
+                prescreen=settings.prescreen,
+                grid_mode=settings.grid_mode,
+                templates=_template_cache(settings.template_cache),
+            )
+            stats = tables.stats
+        else:
+            result = extract(
+                source,
+                pages=pages,
+                detector=settings.detector,
+                stitch_aggressiveness=settings.stitch_aggressiveness,
+                stitch_mode=settings.stitch_mode,
+                stitch_lookback=settings.stitch_lookback,
+                prescreen=settings.prescreen,
+                grid_mode=settings.grid_mode,
+                templates=_template_cache(settings.template_cache),
+            )
+            tables, stats = iter(result.tables), result.stats
+        count = 0
+        for count, table in enumerate(tables, start=1):
+            # render jobs may run after this document is closed, so each holds its own view
+            view = parsed.borrow() if parsed is not None and settings.debug_overlays else None
+            submit(
+                functools.partial(
+                    _render_borrowed,
+                    view,
+                    table,
+                    stem + f"_table_{count}",
+                    export_format=settings.export_format,
+                    fill_policy=settings.fill_policy,
+                    inline_styles=settings.inline_styles,
+                    debug_overlays=settings.debug_overlays,
+                    detector=settings.detector,
+                )
+            )
+    finally:
+        if parsed is not None:
+            parsed.close()
+    return _DocumentOutcome(
+        path=path,
+        tables=count,
+        seconds=time.perf_counter() - start,
+        size=path.stat().st_size,
+        stats=dict(stats),
+    )
+
+
+def _template_cache(path: Path | None) -> TemplateCache | None:
+    """Return this process's cache for ``path`` so templates carry across documents."""
+
+    if path is None:
+        return None
+    cache = _TEMPLATE_CACHES.get(path)
+    if cache is None:
+        cache = _TEMPLATE_CACHES[path] = TemplateCache(path)
+    return cache
+
+
+def _extract_in_worker(
+    path: Path, stem: str, settings: _ExtractSettings, bundle: bool
+) -> tuple[_DocumentOutcome, RenderedFiles]:
+    """Process-pool entry point: write files locally or return them for a bundle."""
+
+    if bundle:
+        files: RenderedFiles = []
+        outcome = _extract_document(path, stem, settings, lambda render: files.extend(render()))
+        return outcome, files
+    with TableWriter(settings.out, threads=settings.writer_threads) as writer:
+        outcome = _extract_document(path, stem, settings, writer.submit)
+    return outcome, []
+
+
+def _finish(
+    outcome: _DocumentOutcome,
+    digest: str,
+    job: JobManifest | None,
+    batch: bool,
+    writer: TableWriter,
+) -> _DocumentOutcome:
+    if job is not None:
+        # only a document whose output is on disk counts as done
+        writer.after(
+            functools.partial(
+                job.record,
+                outcome.path,
+                digest,
+                status="error" if outcome.error else "ok",
+                seconds=outcome.seconds,
+                tables=outcome.tables,
+                **({"error": outcome.error} if outcome.error else {}),
+            )
+        )
+    if batch:
+        if outcome.error:
+            console.print(f"[red]{outcome.path}: {outcome.error}[/red]")
+        else:
+            console.print(f"{outcome.path}: {outcome.tables} tables in {outcome.seconds:.3f}s")
+    return outcome
+
+
+def _output_key(settings: _ExtractSettings, into: Path | None) -> str:
+    """The output settings a manifest entry is only valid for."""
+
+    return json.dumps(
+        {
+            "to": settings.export_format,
+            "out": str(settings.out.resolve()) if into is None else None,
+            "into": str(into.resolve()) if into is not None else None,
+            "fill_policy": settings.fill_policy,
+            "inline_styles": settings.inline_styles,
+            "debug_overlays": settings.debug_overlays,
+        },
+        sort_keys=True,
+    )
+
+
+def _print_summary(outcomes: list[_DocumentOutcome], *, skipped: int, elapsed: float) -> None:
+    done = [outcome for outcome in outcomes if not outcome.error]
+    n_tables = sum(outcome.tables for outcome in done)
+    megabytes = sum(outcome.size for outcome in done) / 1e6
+    rate = 1.0 / elapsed if elapsed > 0 else 0.0
+    table = RichTable(title="TabBolt Extract")
+    table.add_column("Metric")
+    table.add_column("Value", justify="right")
+    table.add_row("documents", str(len(done)))
+    table.add_row("skipped (manifest)", str(skipped))
+    table.add_row("failed", str(len(outcomes) - len(done)))
+    table.add_row("tables", str(n_tables))
+    if any("template_hits" in outcome.stats for outcome in done):
+        hits = sum(outcome.stats.get("template_hits", 0) for outcome in done)
+        table.add_row("template hits", str(hits))
+    table.add_row("seconds", f"{elapsed:.3f}")
+    table.add_row("documents/s", f"{len(done) * rate:.2f}")
+    table.add_row("tables/s", f"{n_tables * rate:.2f}")
+    table.add_row("MB/s", f"{megabytes * rate:.2f}")
+    console.print(table)
+
+
+def _expand_inputs(inputs: Iterable[str]) -> list[tuple[Path, str]]:
+    """Resolve files, directories and glob patterns to ``(path, output stem)`` pairs.
+
+    A PDF and the ``.tbz`` artifact parsed from it next to it count as one
+    document, read from the artifact. Output stems are unique: stems that
+    collide are qualified with their parent directory, then numbered.
+    """
+
+    documents: dict[Path, tuple[Path, str]] = {}
+
+    def add(path: Path, stem: str) -> None:
+        key = path.resolve().with_suffix("")
+        current = documents.get(key)
+        if current is None:
+            documents[key] = (path, stem)
+        elif path.suffix.lower() == SUFFIX and current[0].suffix.lower() != SUFFIX:
+            documents[key] = (path, current[1])
+
+    for item in inputs:
+        path = Path(item)
+        if path.is_file():
+            add(path, path.stem)
+        elif path.is_dir():
+            for candidate in sorted(path.rglob("*")):
+                if candidate.is_file() and candidate.suffix.lower() in _INPUT_SUFFIXES:
+                    add(candidate, "__".join(candidate.relative_to(path).with_suffix("").parts))
+        else:
+            matches = sorted(Path(match) for match in glob.glob(item, recursive=True))
+            files = [match for match in matches if match.is_file()]
+            if not files:
+                raise click.BadParameter(f"no such file, directory or match: {item}", param_hint="INPUTS")
+            for match in files:
+                add(match, match.stem)
+    if not documents:
+        raise click.BadParameter("no PDF or .tbz files found", param_hint="INPUTS")
+    return _unique_stems(list(documents.values()))
+
+
+def _unique_stems(documents: list[tuple[Path, str]]) -> list[tuple[Path, str]]:
+    counts = Counter(stem for _, stem in documents)
+    qualified = [
+        (path, f"{path.resolve().parent.name}__{stem}" if counts[stem] > 1 else stem)
+        for path, stem in documents
+    ]
+    taken: set[str] = set()
+    unique: list[tuple[Path, str]] = []
+    for path, stem in qualified:
+        candidate, number = stem, 1
+        while candidate in taken:
+            number += 1
+            candidate = f"{stem}_{number}"
+        taken.add(candidate)
+        unique.append((path, candidate))
+    return unique
+
+
+@main.command()
+@click.option("--host", type=str, default="127.0.0.1", show_default=True)
+@click.option("--port", type=int, default=DEFAULT_PORT, show_default=True)
+@click.option("--workers", type=str, default="auto", show_default=True, help="Worker processes")
+@click.option("--max-queue", type=int, default=64, show_default=True)
+@click.option(
+    "--max-body",
+    type=int,
+    default=DEFAULT_MAX_BODY,
+    show_default=True,
+    help="Largest accepted request body in bytes; larger ones get 413",
+)
+@click.option("--detector", "detectors", type=str, multiple=True, default=["plumber"], show_default=True)
+def serve(
+    host: str, port: int, workers: str, max_queue: int, max_body: int, detectors: tuple[str, ...]
+) -> None:
+    """Run a local extraction server with warm worker processes.
+
+    Use `tabbolt extract --server URL` as the client. GET /metrics reports
+    queue depth, in-flight requests and latency histograms.
+    """
+
+    n_workers = (os.cpu_count() or 1) if workers == "auto" else max(1, int(workers))
+    server = ExtractionServer(
+        host, port, workers=n_workers, max_queue=max_queue, max_body=max_body, detectors=detectors
+    )
+    console.print(f"[green]Serving on {server.url} with {n_workers} workers[/green]")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+
+
+@main.command(name="parse")
+@click.argument("file", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option("--out", type=click.Path(dir_okay=False, path_type=Path), default=None)
+@click.option("--pages", type=str, default=None, help="Comma separated page ranges")
+def parse_cmd(file: Path, out: Path | None, pages: str | None) -> None:
+    """Parse FILE once into a reusable `.tbz` artifact."""
+
+    target = out or file.with_suffix(SUFFIX)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+    parse(file, target, pages=_parse_pages(pages) if pages else None)
+    console.print(
+        f"[green]Wrote {target} ({target.stat().st_size} bytes) "
+        f"in {time.perf_counter() - start:.3f}s.[/green]"
+    )
+
+
+@main.command(name="sweep")
+@click.argument(
+    "files", nargs=-1, required=True, type=click.Path(exists=True, dir_okay=False, path_type=Path)
+)
+@click.option("--detector", "detectors", type=str, multiple=True, default=["plumber"], show_default=True)
+@click.option(
+    "--stitch-aggressiveness",
+    "stitch_levels",
+    type=click.Choice(["low", "med", "high"]),
+    multiple=True,
+    default=["med"],
+    show_default=True,
+)
+@click.option("--epsilon", "epsilons", type=float, multiple=True, help="Snapping overrides to add")
+@click.option("--pages", type=str, default=None, help="Comma separated page ranges")
+@click.option("--workers", type=int, default=None, help="Concurrent runs (default: CPU count)")
+def sweep_cmd(
+    files: tuple[Path, ...],
+    detectors: tuple[str, ...],
+    stitch_levels: tuple[str, ...],
+    epsilons: tuple[float, ...],
+    pages: str | None,
+    workers: int | None,
+) -> None:
+    """Compare configurations on FILES, parsing each file only once.
+
+    The first configuration is the baseline the others are diffed against.
+    """
+
+    configs = config_matrix(detectors, stitch_levels, [None, *epsilons])
+    report = sweep(
+        list(files),
+        configs,
+        pages=_parse_pages(pages) if pages else None,
+        workers=workers,
     )
-    out.mkdir(parents=True, exist_ok=True)
-    for idx, table in enumerate(result.tables, start=1):
-        stem = file.stem + f"_table_{idx}"
-        if export_format == "html":
-            html = table_to_html(table, inline_styles=inline_styles)
-            (out / f"{stem}.html").write_text(html)
-        elif export_format == "csv":
-            csv_data = table_to_csv(table, fill_policy=fill_policy)
-            (out / f"{stem}.csv").write_text(csv_data)
-        elif export_format == "md":
-            md = table_to_markdown(table)
-            (out / f"{stem}.md").write_text(md)
-        elif export_format == "df":
-            df = table_to_dataframe(table)
-            df.to_json(out / f"{stem}.json", orient="records", force_ascii=False, indent=2)
-        if debug_overlays:
-            overlay = render_overlay(table, epsilon=table.meta.get("epsilon", 0.0), detector=detector)
-            (out / f"{stem}_overlay.html").write_text(overlay)
-    console.print(f"[green]Extracted {len(result.tables)} tables.[/green]")
+    for source, seconds in report.parse_seconds.items():
+        console.print(f"Parsed {source} in {seconds:.3f}s")
+    table = RichTable(title="TabBolt Sweep")
+    table.add_column("Config")
+    table.add_column("Source")
+    table.add_column("Tables", justify="right")
+    table.add_column("Seconds", justify="right")
+    table.add_column("Diff vs baseline")
+    for run in report.runs:
+        table.add_row(
+            run.config.label,
+            run.source,
+            str(len(run.result.tables)),
+            f"{run.seconds:.3f}",
+            "; ".join(run.diffs) or "-",
+        )
+    console.print(table)
 
 
 @main.command()
@@ -99,6 +589,148 @@ def benchmark(file: Path, repeat: int, detector: str) -> None:
     console.print(table)
 
 
+@main.command()
+@click.argument("file", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option("--pages", type=str, required=True, help="Comma separated page ranges of this shard")
+@click.option("--detector", type=str, default="plumber", show_default=True)
+@click.option("--out", type=click.Path(dir_okay=False, path_type=Path), required=True)
+@click.option("--stitch-aggressiveness", type=click.Choice(["low", "med", "high"]), default="med")
+def partial(
+    file: Path,
+    pages: str,
+    detector: str,
+    out: Path,
+    stitch_aggressiveness: str,
+) -> None:
+    """Extract a page-range shard of FILE into a partial result for `merge`."""
+
+    result = extract_partial(
+        file,
+        pages=_parse_pages(pages),
+        detector=detector,
+        stitch_aggressiveness=stitch_aggressiveness,
+    )
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(result.to_json())
+    console.print(
+        f"[green]Wrote {len(result.head)} open head and {len(result.tables)} stitched tables.[/green]"
+    )
+
+
+@main.command()
+@click.argument(
+    "partials", nargs=-1, required=True, type=click.Path(exists=True, dir_okay=False, path_type=Path)
+)
+@click.option("--stem", type=str, default="merged", show_default=True, help="Output file name prefix")
+@click.option("--to", "export_format", type=click.Choice(["html", "csv", "md", "df"]), default="html")
+@click.option("--out", type=click.Path(path_type=Path), default=Path.cwd(), show_default=True)
+@click.option("--fill-policy", type=click.Choice(["repeat", "empty", "sentinel"]), default="repeat")
+@click.option("--inline-styles", is_flag=True, default=False)
+def merge(
+    partials: tuple[Path, ...],
+    stem: str,
+    export_format: str,
+    out: Path,
+    fill_policy: str,
+    inline_styles: bool,
+) -> None:
+    """Merge partial results written by `partial` and export the tables."""
+
+    parts = [PartialResult.model_validate_json(path.read_text()) for path in partials]
+    result = merge_partial_results(parts)
+    _write_tables(
+        result.tables,
+        stem=stem,
+        out=out,
+        export_format=export_format,
+        fill_policy=fill_policy,
+        inline_styles=inline_styles,
+        debug_overlays=False,
+        detector=str(result.stats.get("detector")),
+    )
+    console.print(f"[green]Merged {len(parts)} shards into {len(result.tables)} tables.[/green]")
+
+
+def _write_tables(
+    tables: Iterable[Table],
+    *,
+    stem: str,
+    out: Path,
+    export_format: str,
+    fill_policy: str,
+    inline_styles: bool,
+    debug_overlays: bool,
+    detector: str,
+    parsed: ParsedDocument | None = None,
+    into: Path | None = None,
+    threads: int = 4,
+) -> int:
+    """Render and write ``tables`` as they arrive; return how many were written."""
+
+    count = 0
+    with TableWriter(out, into=into, threads=threads) as writer:
+        for idx, table in enumerate(tables, start=1):
+            writer.submit(
+                functools.partial(
+                    _render_table,
+                    table,
+                    stem + f"_table_{idx}",
+                    export_format=export_format,
+                    fill_policy=fill_policy,
+                    inline_styles=inline_styles,
+                    debug_overlays=debug_overlays,
+                    detector=detector,
+                    parsed=parsed,
+                )
+            )
+            count = idx
+    return count
+
+
+def _render_table(
+    table: Table,
+    table_stem: str,
+    *,
+    export_format: str,
+    fill_policy: str,
+    inline_styles: bool,
+    debug_overlays: bool,
+    detector: str,
+    parsed: ParsedDocument | None,
+) -> RenderedFiles:
+    files: RenderedFiles = []
+    if export_format == "html":
+        files.append((f"{table_stem}.html", table_to_html(table, inline_styles=inline_styles)))
+    elif export_format == "csv":
+        files.append((f"{table_stem}.csv", table_to_csv(table, fill_policy=fill_policy)))
+    elif export_format == "md":
+        files.append((f"{table_stem}.md", table_to_markdown(table)))
+    elif export_format == "df":
+        df = table_to_dataframe(table)
+        files.append(
+            (f"{table_stem}.json", df.to_json(orient="records", force_ascii=False, indent=2))
+        )
+    if debug_overlays:
+        overlay = render_overlay(
+            table,
+            epsilon=table.meta.get("epsilon", 0.0),
+            detector=detector,
+            parsed=parsed,
+        )
+        files.append((f"{table_stem}_overlay.html", overlay))
+    return files
+
+
+def _render_borrowed(view: ParsedDocument | None, table: Table, table_stem: str, **options: Any) -> RenderedFiles:
+    """Render one table, then release the artifact view borrowed for it."""
+
+    try:
+        return _render_table(table, table_stem, parsed=view, **options)
+    finally:
+        if view is not None:
+            view.close()
+
+
 def _parse_pages(value: str) -> list[int]:
     pages: set[int] = set()
     for part in value.split(","):
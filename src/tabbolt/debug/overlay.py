@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from html import escape
 
+from ..artifact import ParsedDocument
 from ..models import Table
 
 
@@ -12,14 +13,19 @@ def render_overlay(
     epsilon: float,
     detector: str,
     scale: float = 1.0,
+    parsed: ParsedDocument | None = None,
 ) -> str:
-    """Render an SVG overlay for the table."""
+    """Render an SVG overlay for the table.
+
+    With a ``parsed`` artifact, the ruling lines and word boxes of the table's
+    pages are drawn underneath the cells.
+    """
 
     width = table.page_size[0] if table.page_size else max(cell.bbox[2] for cell in table.cells)
     height = table.page_size[1] if table.page_size else max(cell.bbox[3] for cell in table.cells)
     svg_width = width * scale
     svg_height = height * scale
-    elements = []
+    elements = _parsed_elements(table, parsed, height, scale) if parsed is not None else []
     for idx, cell in enumerate(table.cells):
         x0, y0, x1, y1 = cell.bbox
         rect = (
@@ -54,4 +60,24 @@ def render_overlay(
     )
 
 
+def _parsed_elements(
+    table: Table, parsed: ParsedDocument, height: float, scale: float
+) -> list[str]:
+    elements = []
+    for page_number in table.page:
+        if not 1 <= page_number <= len(parsed.pages):
+            continue
+        page = parsed.pages[page_number - 1]
+        for boxes, style in (
+            (page.line_boxes, 'fill="none" stroke="rgba(200, 0, 0, 0.6)"'),
+            (page.word_boxes[:, :4], 'fill="none" stroke="rgba(0, 0, 0, 0.25)"'),
+        ):
+            for x0, y0, x1, y1 in boxes.tolist():
+                elements.append(
+                    f'<rect x="{x0*scale:.2f}" y="{(height - y1)*scale:.2f}" '
+                    f'width="{(x1 - x0)*scale:.2f}" height="{(y1 - y0)*scale:.2f}" {style}/>'
+                )
+    return elements
+
+
 __all__ = ["render_overlay"]
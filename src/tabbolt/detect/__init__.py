@@ -1,5 +1,19 @@
 """Detector implementations."""
 from .base import Detector, DetectedRegion
+from .consolidate import consolidate_regions
+from .furniture import flag_furniture, furniture_keys, furniture_masks
 from .plumber import PlumberDetector
+from .prescreen import PageScreen, screen_page, stream_boxes
 
-__all__ = ["Detector", "DetectedRegion", "PlumberDetector"]
+__all__ = [
+    "Detector",
+    "DetectedRegion",
+    "PlumberDetector",
+    "PageScreen",
+    "consolidate_regions",
+    "flag_furniture",
+    "furniture_keys",
+    "furniture_masks",
+    "screen_page",
+    "stream_boxes",
+]
@@ -1,41 +1,128 @@
 """Detector interfaces for TabBolt."""
 from __future__ import annotations
 
-from typing import Protocol, runtime_checkable
+from typing import Any, Iterator, Protocol, Sequence, runtime_checkable
 
-from pydantic import BaseModel, Field
+import numpy as np
+from pydantic import BaseModel, Field, field_serializer, field_validator
 
 from ..models import BBox
+from ..source import PDFSource
+
+
+class PackedBoxes(Sequence[BBox]):
+    """``(n, 4)`` box array that reads like a list of ``BBox`` tuples.
+
+    Items and iteration build tuples on demand; ``array`` is the packed data.
+    """
+
+    __slots__ = ("array",)
+
+    def __init__(self, array: np.ndarray) -> None:
+        self.array = array
+
+    def __len__(self) -> int:
+        return len(self.array)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [tuple(row) for row in self.array[index].tolist()]
+        return tuple(self.array[index].tolist())
+
+    def __iter__(self) -> Iterator[BBox]:
+        return (tuple(row) for row in self.array.tolist())  # type: ignore[misc]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PackedBoxes):
+            return len(self) == len(other) and bool(np.array_equal(self.array, other.array))
+        if isinstance(other, (list, tuple, np.ndarray)):
+            return list(self) == [tuple(row) for row in np.asarray(other, dtype=float).reshape(-1, 4).tolist()]
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(list(self))
 
 
 class DetectedRegion(BaseModel):
-    """Region returned by a detector representing a candidate table."""
+    """Region returned by a detector representing a candidate table.
+
+    ``lines`` (ruling lines) and ``boxes`` (char boxes) accept lists of
+    ``(x0, top, x1, bottom)`` tuples or ``(n, 4)`` arrays, on construction and
+    on assignment. They are stored packed, lines as float64 and boxes as
+    float32, which keeps dense regions small in memory and cheap to pickle,
+    and read like lists of tuples. ``line_array`` and ``box_array`` expose the
+    packed arrays; serialization emits the original tuple lists.
+    """
 
     page: int
     bbox: BBox
-    lines: list[BBox] = Field(default_factory=list)
-    boxes: list[BBox] = Field(default_factory=list)
+    lines: PackedBoxes = Field(default_factory=list)
+    boxes: PackedBoxes = Field(default_factory=list)
     conf: float = 1.0
     detector_version: str
 
     model_config = {
         "arbitrary_types_allowed": True,
+        "validate_assignment": True,
+        "validate_default": True,
     }
 
+    @field_validator("lines", mode="before")
+    @classmethod
+    def _pack_lines(cls, value: Any) -> PackedBoxes:
+        return PackedBoxes(_packed(value, np.float64))
+
+    @field_validator("boxes", mode="before")
+    @classmethod
+    def _pack_boxes(cls, value: Any) -> PackedBoxes:
+        return PackedBoxes(_packed(value, np.float32))
+
+    @field_serializer("lines", "boxes")
+    def _unpack(self, value: PackedBoxes) -> list[BBox]:
+        return list(value)
+
+    @property
+    def line_array(self) -> np.ndarray:
+        return _packed(self.lines, np.float64)
+
+    @property
+    def box_array(self) -> np.ndarray:
+        return _packed(self.boxes, np.float32)
+
+
+def _packed(value: Any, dtype: type[np.floating]) -> np.ndarray:
+    if isinstance(value, PackedBoxes):
+        value = value.array
+    elif not isinstance(value, np.ndarray):
+        value = list(value)
+    return np.asarray(value, dtype=dtype).reshape(-1, 4)
+
 
 @runtime_checkable
 class Detector(Protocol):
-    """Protocol for table detectors."""
+    """Protocol for table detectors.
+
+    ``extract`` may call ``detect`` on one instance from several threads at
+    once. Detectors that keep per-call state on ``self`` should set the
+    class attribute ``reentrant = False``; detectors looked up by name then
+    get one instance per thread.
+    """
 
     name: str
     version: str
 
-    def detect(self, pdf_path: str, pages: list[int] | None = None) -> list[DetectedRegion]:
-        """Return detected table regions for the given PDF."""
+    def detect(self, source: PDFSource, pages: list[int] | None = None) -> list[DetectedRegion]:
+        """Return detected table regions for the given PDF.
+
+        ``source`` is a path string, a byte ``memoryview`` or a seekable binary
+        file object; :func:`tabbolt.source.open_pdf` opens any of them.
+        """
 
 
 class DetectorError(RuntimeError):
     """Raised when a detector fails."""
 
 
-__all__ = ["DetectedRegion", "Detector", "DetectorError"]
+__all__ = ["DetectedRegion", "Detector", "DetectorError", "PackedBoxes"]
@@ -0,0 +1,141 @@
+"""Consolidation of overlapping region proposals."""
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+
+from ..geometry import as_bbox_array, normalize_bboxes
+from .base import DetectedRegion
+
+
+def consolidate_regions(
+    regions: Sequence[DetectedRegion],
+    *,
+    iou: float = 0.5,
+    containment: float = 0.8,
+    mode: str = "merge",
+) -> list[DetectedRegion]:
+    """Collapse overlapping proposals for the same table into one region.
+
+    Regions on the same page overlap when their intersection-over-union
+    reaches ``iou``, or when the intersection covers ``containment`` of the
+    smaller one. Proposals are visited by descending ``conf`` (then area), and
+    each one still standing claims every overlapping proposal that has not
+    been claimed yet: non-maximum suppression. With ``mode="suppress"`` the
+    claimed proposals are dropped; with ``"merge"`` they are fused into the
+    winner, whose box becomes the ``conf``-weighted mean of the group grown
+    to cover the winner itself, and whose lines and char boxes gain theirs.
+
+    Surviving regions keep their input order.
+    """
+
+    if mode not in {"merge", "suppress"}:
+        raise ValueError(f"Unknown consolidation mode: {mode}")
+    pages: dict[int, list[int]] = {}
+    for index, region in enumerate(regions):
+        pages.setdefault(region.page, []).append(index)
+    survivors: dict[int, DetectedRegion] = {}
+    for indices in pages.values():
+        page_regions = [regions[i] for i in indices]
+        for local, region in _consolidate_page(page_regions, iou, containment, mode).items():
+            survivors[indices[local]] = region
+    return [survivors[index] for index in sorted(survivors)]
+
+
+def _consolidate_page(
+    regions: list[DetectedRegion], iou: float, containment: float, mode: str
+) -> dict[int, DetectedRegion]:
+    if len(regions) == 1:
+        return {0: regions[0]}
+    boxes = normalize_bboxes(as_bbox_array([region.bbox for region in regions]))
+    first, second = _overlapping_pairs(boxes)
+    if not len(first):
+        return dict(enumerate(regions))
+    area = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+    inter = np.clip(
+        np.minimum(boxes[first, 2], boxes[second, 2]) - np.maximum(boxes[first, 0], boxes[second, 0]),
+        0.0,
+        None,
+    ) * np.clip(
+        np.minimum(boxes[first, 3], boxes[second, 3]) - np.maximum(boxes[first, 1], boxes[second, 1]),
+        0.0,
+        None,
+    )
+    union = area[first] + area[second] - inter
+    smaller = np.minimum(area[first], area[second])
+    linked = (inter >= iou * np.where(union > 0, union, np.inf)) | (
+        inter >= containment * np.where(smaller > 0, smaller, np.inf)
+    )
+    neighbours: dict[int, list[int]] = {}
+    for a, b in zip(first[linked].tolist(), second[linked].tolist()):
+        neighbours.setdefault(a, []).append(b)
+        neighbours.setdefault(b, []).append(a)
+
+    conf = [region.conf for region in regions]
+    ranking = sorted(range(len(regions)), key=lambda i: (-conf[i], -area[i], i))
+    claimed = [False] * len(regions)
+    result: dict[int, DetectedRegion] = {}
+    for winner in ranking:
+        if claimed[winner]:
+            continue
+        claimed[winner] = True
+        group = [winner]
+        for other in neighbours.get(winner, ()):
+            if not claimed[other]:
+                claimed[other] = True
+                group.append(other)
+        if len(group) == 1 or mode == "suppress":
+            result[winner] = regions[winner]
+        else:
+            result[winner] = _fuse([regions[i] for i in group], boxes[group])
+    return result
+
+
+def _overlapping_pairs(boxes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return index pairs of touching boxes using a sweep over sorted ``x0``.
+
+    Only boxes whose ``x0`` falls inside another box's x-range are paired up
+    before the vertical test, so sparse pages avoid the all-pairs matrix.
+    """
+
+    order = np.argsort(boxes[:, 0], kind="stable")
+    x0 = boxes[order, 0]
+    starts = np.arange(1, len(order))
+    ends = np.searchsorted(x0, boxes[order[:-1], 2], side="right")
+    counts = np.maximum(ends - starts, 0)
+    left = np.repeat(np.arange(len(order) - 1), counts)
+    offsets = np.arange(int(counts.sum())) - np.repeat(np.cumsum(counts) - counts, counts)
+    right = np.repeat(starts, counts) + offsets
+    first, second = order[left], order[right]
+    touching = (boxes[first, 1] <= boxes[second, 3]) & (boxes[second, 1] <= boxes[first, 3])
+    return first[touching], second[touching]
+
+
+def _fuse(group: list[DetectedRegion], boxes: np.ndarray) -> DetectedRegion:
+    winner = group[0]
+    weights = np.array([max(region.conf, 0.0) for region in group], dtype=float)
+    if weights.sum() <= 0:
+        weights = np.ones(len(group))
+    mean = (boxes * weights[:, None]).sum(axis=0) / weights.sum()
+    bbox = (
+        float(min(mean[0], boxes[0, 0])),
+        float(min(mean[1], boxes[0, 1])),
+        float(max(mean[2], boxes[0, 2])),
+        float(max(mean[3], boxes[0, 3])),
+    )
+    lines = _unique_rows(np.concatenate([region.line_array for region in group]))
+    char_boxes = _unique_rows(np.concatenate([region.box_array for region in group]))
+    return type(winner)(**{**dict(winner), "bbox": bbox, "lines": lines, "boxes": char_boxes})
+
+
+def _unique_rows(rows: np.ndarray) -> np.ndarray:
+    """Drop repeated rows, keeping first occurrences in order."""
+
+    if not len(rows):
+        return rows
+    _, first = np.unique(rows, axis=0, return_index=True)
+    return rows[np.sort(first)]
+
+
+__all__ = ["consolidate_regions"]
@@ -0,0 +1,192 @@
+"""Document-level detection of repeated page furniture."""
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+from typing import Any, Iterable, Sequence
+
+import numpy as np
+
+from ..geometry import as_bbox_array
+from ..models import BBox
+
+_NUMBER = re.compile(r"\d+")
+
+PageKeys = tuple[list[tuple[int, str] | None], np.ndarray]
+
+
+def furniture_masks(
+    pages: Sequence[tuple[list[dict[str, Any]], float] | tuple[list[dict[str, Any]], float, Iterable[BBox]]],
+    *,
+    min_pages: int = 3,
+    min_share: float = 0.5,
+    margin: float = 0.12,
+    quantum: float = 2.0,
+) -> list[np.ndarray]:
+    """Flag the chars of running headers, footers, page numbers and watermarks.
+
+    ``pages`` holds the chars and height of every page, optionally followed
+    by the page's ruling lines. This is :func:`furniture_keys` for every page
+    followed by :func:`flag_furniture`.
+
+    Returns one boolean mask per page, true for the chars to drop.
+    """
+
+    keys = [
+        furniture_keys(page[0], page[1], rules=page[2] if len(page) > 2 else (), margin=margin, quantum=quantum)
+        for page in pages
+    ]
+    return flag_furniture(keys, min_pages=min_pages, min_share=min_share)
+
+
+def furniture_keys(
+    chars: list[dict[str, Any]],
+    height: float,
+    *,
+    rules: Iterable[BBox] = (),
+    margin: float = 0.12,
+    quantum: float = 2.0,
+) -> PageKeys:
+    """Hash the line segments of one page that could be page furniture.
+
+    The page's text is split into line segments, and a segment is hashed by
+    its top edge rounded to ``quantum`` points and its text with digit runs
+    folded, so "Page 3" and "Page 14" agree even when centred. Segments in
+    the top or bottom ``margin`` of the page, or set at least twice the
+    page's median font size, are candidates, except table text: segments
+    between two horizontal ``rules`` close above and below, and lines with
+    several segments aligned with segments on the neighbouring line (a
+    repeated header row, say).
+
+    Returns the keys, ``None`` for segments that cannot be furniture, and the
+    segment of every char. Both are small, so a document can be keyed page by
+    page without keeping the chars.
+    """
+
+    if not chars:
+        return [], np.zeros(0, dtype=np.int32)
+    boxes = np.array(
+        [
+            (float(c["x0"]), float(c["top"]), float(c["x1"]), float(c["bottom"]), float(c.get("size", 10.0)))
+            for c in chars
+        ],
+        dtype=float,
+    )
+    size = float(np.median(boxes[:, 4])) or 10.0
+    order = np.lexsort((boxes[:, 0], boxes[:, 1]))
+    line_ids = np.concatenate([[0], np.cumsum(np.diff(boxes[order, 1]) > size * 0.5)])
+    # regroup by line, then by x within each line
+    order = order[np.lexsort((boxes[order, 0], line_ids))]
+    line_ids = np.sort(line_ids)
+    ordered = boxes[order]
+    same_line = line_ids[1:] == line_ids[:-1]
+    gaps = ordered[1:, 0] - ordered[:-1, 2]
+    starts = np.concatenate([[0], np.flatnonzero(~same_line | (gaps > size)) + 1])
+    segments = np.stack(
+        [
+            np.minimum.reduceat(ordered[:, 0], starts),
+            np.minimum.reduceat(ordered[:, 1], starts),
+            np.maximum.reduceat(ordered[:, 2], starts),
+            np.maximum.reduceat(ordered[:, 3], starts),
+        ],
+        axis=1,
+    )
+    seg_size = np.maximum.reduceat(ordered[:, 4], starts)
+    seg_line = line_ids[starts]
+    seg_top = segments[:, 1]
+    candidate = (
+        (seg_top < height * margin)
+        | (seg_top > height * (1.0 - margin))
+        | (seg_size >= 2.0 * size)
+    )
+    if candidate.any():
+        candidate &= ~_ruled(segments, rules, size)
+    if candidate.any():
+        candidate &= ~_tabular(segments, seg_line, candidate, size)
+
+    texts = [str(chars[i].get("text", "")) for i in order.tolist()]
+    ends = [*starts[1:].tolist(), len(texts)]
+    keys: list[tuple[int, str] | None] = []
+    for index, (start, end) in enumerate(zip(starts.tolist(), ends)):
+        if not candidate[index]:
+            keys.append(None)
+            continue
+        text = _NUMBER.sub("#", "".join(texts[start:end]).strip())
+        keys.append((round(seg_top[index] / quantum), text))
+
+    segment_of = np.empty(len(chars), dtype=np.int32)
+    segment_of[order] = np.repeat(np.arange(len(starts)), np.diff([*starts.tolist(), len(order)]))
+    return keys, segment_of
+
+
+def flag_furniture(
+    page_keys: Sequence[PageKeys], *, min_pages: int = 3, min_share: float = 0.5
+) -> list[np.ndarray]:
+    """Turn the :func:`furniture_keys` of every page into per-char drop masks.
+
+    A key is furniture when it occurs on ``min_share`` of the pages and at
+    least ``min_pages`` of them.
+    """
+
+    if len(page_keys) < min_pages:
+        return [np.zeros(len(segment_of), dtype=bool) for _, segment_of in page_keys]
+    counts: Counter[tuple[int, str]] = Counter()
+    for keys, _ in page_keys:
+        counts.update({key for key in keys if key is not None})
+    needed = max(min_pages, math.ceil(min_share * len(page_keys)))
+    furniture = {key for key, count in counts.items() if count >= needed}
+
+    masks: list[np.ndarray] = []
+    for keys, segment_of in page_keys:
+        flagged = np.array([key in furniture for key in keys], dtype=bool)
+        masks.append(flagged[segment_of] if len(keys) else np.zeros(0, dtype=bool))
+    return masks
+
+
+def _ruled(segments: np.ndarray, rules: Iterable[BBox], size: float) -> np.ndarray:
+    """Segments with a horizontal rule across them just above and just below."""
+
+    boxes = as_bbox_array(rules)
+    if not len(boxes):
+        return np.zeros(len(segments), dtype=bool)
+    # rects contribute their top and bottom edges
+    edges = np.concatenate([boxes[:, [0, 1, 2, 1]], boxes[:, [0, 3, 2, 3]]])
+    edges = edges[(edges[:, 2] - edges[:, 0]) > 0]
+    centre = (segments[:, 0] + segments[:, 2]) / 2.0
+    across = (edges[None, :, 0] <= centre[:, None]) & (edges[None, :, 2] >= centre[:, None])
+    y = edges[None, :, 1]
+    above = across & (y <= segments[:, 1, None] + 1.0) & (y >= segments[:, 1, None] - 2.0 * size)
+    below = across & (y >= segments[:, 3, None] - 1.0) & (y <= segments[:, 3, None] + 2.0 * size)
+    return above.any(axis=1) & below.any(axis=1)
+
+
+def _tabular(
+    segments: np.ndarray, seg_line: np.ndarray, candidate: np.ndarray, size: float
+) -> np.ndarray:
+    """Segments on lines whose segments line up with the neighbouring line's.
+
+    Only lines holding a ``candidate`` segment are checked.
+    """
+
+    n_lines = int(seg_line[-1]) + 1
+    line_top = np.full(n_lines, np.inf)
+    np.minimum.at(line_top, seg_line, segments[:, 1])
+    per_line = np.bincount(seg_line, minlength=n_lines)
+    tabular = np.zeros(n_lines, dtype=bool)
+    for line in np.unique(seg_line[candidate]).tolist():
+        if per_line[line] < 2:
+            continue
+        own = segments[seg_line == line]
+        for other in (line - 1, line + 1):
+            if not 0 <= other < n_lines or abs(line_top[other] - line_top[line]) > 3.0 * size:
+                continue
+            theirs = segments[seg_line == other]
+            overlaps = (own[:, None, 0] <= theirs[None, :, 2]) & (theirs[None, :, 0] <= own[:, None, 2])
+            if np.count_nonzero(overlaps.any(axis=1)) >= 2:
+                tabular[line] = True
+                break
+    return tabular[seg_line]
+
+
+__all__ = ["PageKeys", "flag_furniture", "furniture_keys", "furniture_masks"]
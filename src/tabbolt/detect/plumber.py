@@ -1,86 +1,118 @@
 """Default pdfplumber-based detector."""
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Any, Iterable, NamedTuple, Sequence
 
-import pdfplumber
-from shapely.geometry import Polygon, box
+import numpy as np
+from shapely import box
+from shapely.geometry import Polygon
 from shapely.ops import unary_union
 
-from ..geometry import RotatedPage, expand_bbox, merge_boxes, rotation_from_chars, snap_epsilon
+from ..geometry import (
+    RotatedPage,
+    as_bbox_array,
+    bbox_envelope,
+    char_angles,
+    expand_bbox,
+    overlap_mask,
+    rotation_from_angles,
+    snap_epsilon,
+)
 from ..models import BBox
+from ..source import PDFSource, open_pdf
 from .base import DetectedRegion
+from .furniture import PageKeys, flag_furniture, furniture_keys
 
 
 class PlumberDetector:
-    """Detector that relies on pdfplumber text boxes."""
+    """Detector that relies on pdfplumber text boxes.
+
+    With ``strip_furniture`` running headers, footers, page numbers and
+    watermarks that repeat across the document are left out of clustering
+    (see :func:`~tabbolt.detect.furniture_keys`). Furniture is a property of
+    the whole document, so every page is keyed, including pages outside
+    ``pages``: a page range, a pre-screened run or a shard strips exactly what
+    a full run strips, at the cost of parsing every page. Pages are packed
+    into arrays and released as they are read, so only the packed geometry of
+    the requested pages is held until the furniture is known.
+    """
 
     name = "plumber"
     version = "1.0"
 
-    def detect(self, pdf_path: str, pages: list[int] | None = None) -> list[DetectedRegion]:
+    def __init__(
+        self,
+        *,
+        rotation_sample: int | None = 1024,
+        rotation_dominance: float | None = 0.95,
+        strip_furniture: bool = False,
+    ) -> None:
+        self.rotation_sample = rotation_sample
+        self.rotation_dominance = rotation_dominance
+        self.strip_furniture = strip_furniture
+
+    def detect(self, source: PDFSource, pages: list[int] | None = None) -> list[DetectedRegion]:
         selected = set(pages or [])
         results: list[DetectedRegion] = []
-        with pdfplumber.open(pdf_path) as pdf:
-            for index, page in enumerate(pdf.pages, start=1):
-                if selected and index not in selected:
-                    continue
-                chars = page.chars
-                if not chars:
-                    continue
-                rot = rotation_from_chars(chars, page.width, page.height)
-                padding = snap_epsilon([float(c.get("size", 10.0)) for c in chars]) * 1.5
-                char_boxes = [
-                    box(
-                        float(min(c["x0"], c["x1"])) - padding,
-                        float(min(c["top"], c["bottom"])) - padding,
-                        float(max(c["x0"], c["x1"])) + padding,
-                        float(max(c["top"], c["bottom"])) + padding,
-                    )
-                    for c in chars
-                ]
-                clusters = self._clusters(char_boxes)
-                raw_lines = list(getattr(page, "lines", [])) + list(getattr(page, "rects", []))
-                line_boxes = [
-                    self._normalize_line(line, rot)
-                    for line in raw_lines
-                ]
-                for cluster in clusters:
-                    x0, y0, x1, y1 = cluster.bounds
-                    region_bbox = (float(x0), float(y0), float(x1), float(y1))
-                    region_lines = [lb for lb in line_boxes if self._overlaps(lb, region_bbox)]
-                    region_chars = [
-                        (
-                            float(min(c["x0"], c["x1"])),
-                            float(min(c["top"], c["bottom"])),
-                            float(max(c["x0"], c["x1"])),
-                            float(max(c["top"], c["bottom"])),
-                        )
-                        for c in chars
-                        if self._overlaps(
-                            (
-                                float(min(c["x0"], c["x1"])),
-                                float(min(c["top"], c["bottom"])),
-                                float(max(c["x0"], c["x1"])),
-                                float(max(c["top"], c["bottom"])),
-                            ),
-                            region_bbox,
-                        )
-                    ]
-                    merged_bbox = merge_boxes(region_chars) if region_chars else region_bbox
-                    expanded = expand_bbox(merged_bbox, padding * 0.3)
-                    results.append(
-                        DetectedRegion(
-                            page=index,
-                            bbox=expanded,
-                            lines=region_lines,
-                            boxes=region_chars,
-                            conf=0.8,
-                            detector_version=self.version,
-                        )
-                    )
+        with open_pdf(source) as pdf:
+            indices = [i for i in range(1, len(pdf.pages) + 1) if not selected or i in selected]
+            if not self.strip_furniture:
+                for index in indices:
+                    results.extend(self._regions(index, _PageGeometry.read(pdf.pages[index - 1])))
+                return results
+            # keep packed geometry and furniture keys, not every page's char dicts
+            wanted = set(indices)
+            geometry: list[_PageGeometry] = []
+            keys: list[PageKeys] = []
+            masked: list[int] = []
+            for index, page in enumerate(pdf.pages, 1):
+                if index in wanted:
+                    masked.append(len(keys))
+                    geometry.append(_PageGeometry.read(page, keys))
+                else:
+                    keys.append(_page_keys(page, page.chars, _raw_lines(page)))
+                    page.close()
+            masks = flag_furniture(keys)
+            for index, page, key_index in zip(indices, geometry, masked):
+                results.extend(self._regions(index, page.without(masks[key_index])))
         return results
 
+    def _regions(self, index: int, page: _PageGeometry) -> list[DetectedRegion]:
+        if not len(page.char_array):
+            return []
+        rot = rotation_from_angles(
+            page.angles,
+            page.width,
+            page.height,
+            sample_size=self.rotation_sample,
+            dominance=self.rotation_dominance,
+        )
+        char_array = page.char_array
+        padding = snap_epsilon(page.sizes.tolist()) * 1.5
+        padded = char_array + np.array([-padding, -padding, padding, padding])
+        char_boxes = box(padded[:, 0], padded[:, 1], padded[:, 2], padded[:, 3])
+        clusters = self._clusters(char_boxes)
+        line_boxes = as_bbox_array([self._normalize_line(line, rot) for line in page.raw_lines.tolist()])
+        cluster_bboxes = [tuple(float(v) for v in cluster.bounds) for cluster in clusters]
+        char_hits = overlap_mask(char_array, cluster_bboxes)
+        line_hits = overlap_mask(line_boxes, cluster_bboxes)
+        regions: list[DetectedRegion] = []
+        for cluster_index, region_bbox in enumerate(cluster_bboxes):
+            region_array = char_array[char_hits[:, cluster_index]]
+            merged_bbox = bbox_envelope(region_array) if len(region_array) else region_bbox
+            expanded = expand_bbox(merged_bbox, padding * 0.3)
+            regions.append(
+                DetectedRegion(
+                    page=index,
+                    bbox=expanded,
+                    lines=line_boxes[line_hits[:, cluster_index]],
+                    boxes=region_array,
+                    conf=0.8,
+                    detector_version=self.version,
+                )
+            )
+        return regions
+
     def _clusters(self, char_boxes: Iterable[Polygon]) -> list[Polygon]:
         union = unary_union(list(char_boxes))
         if union.is_empty:
@@ -89,21 +121,95 @@ class PlumberDetector:
             return [union]
         return list(union.geoms)
 
-    def _normalize_line(self, line: dict[str, float], rot: RotatedPage) -> BBox:
-        x0 = float(line.get("x0", line.get("x1", 0.0)))
-        x1 = float(line.get("x1", line.get("x0", 0.0)))
-        top = float(line.get("top", line.get("y0", 0.0)))
-        bottom = float(line.get("bottom", line.get("y1", 0.0)))
+    def _normalize_line(self, line: Sequence[float], rot: RotatedPage) -> BBox:
+        x0, top, x1, bottom = line
         x0, top = rot.unrotate_point(x0, top)
         x1, bottom = rot.unrotate_point(x1, bottom)
         x_min, x_max = sorted([x0, x1])
         y_min, y_max = sorted([top, bottom])
         return (x_min, y_min, x_max, y_max)
 
-    def _overlaps(self, bbox: BBox, region: BBox) -> bool:
-        ax0, ay0, ax1, ay1 = bbox
-        bx0, by0, bx1, by1 = region
-        return not (ax1 < bx0 or ax0 > bx1 or ay1 < by0 or ay0 > by1)
+
+class _PageGeometry(NamedTuple):
+    """What the detector needs from a page, packed into arrays."""
+
+    width: float
+    height: float
+    char_array: np.ndarray  # (n, 4) normalized char boxes
+    sizes: np.ndarray
+    angles: np.ndarray  # NaN where a char has no angle
+    raw_lines: np.ndarray  # (m, 4) x0, top, x1, bottom of lines and rects as parsed
+
+    @classmethod
+    def read(cls, page: Any, keys: list[PageKeys] | None = None) -> _PageGeometry:
+        """Pack ``page`` and release its parsed objects.
+
+        With ``keys`` the page's :func:`~tabbolt.detect.furniture_keys` are
+        appended to it.
+        """
+
+        chars = page.chars
+        raw_lines = _raw_lines(page)
+        if keys is not None:
+            keys.append(_page_keys(page, chars, raw_lines))
+        geometry = cls(
+            width=float(page.width),
+            height=float(page.height),
+            char_array=np.array(
+                [
+                    (
+                        float(min(c["x0"], c["x1"])),
+                        float(min(c["top"], c["bottom"])),
+                        float(max(c["x0"], c["x1"])),
+                        float(max(c["top"], c["bottom"])),
+                    )
+                    for c in chars
+                ],
+                dtype=float,
+            ).reshape(-1, 4),
+            sizes=np.array([float(c.get("size", 10.0)) for c in chars], dtype=float),
+            angles=char_angles(chars),
+            raw_lines=raw_lines,
+        )
+        page.close()
+        return geometry
+
+    def without(self, drop: np.ndarray) -> _PageGeometry:
+        if not drop.any():
+            return self
+        keep = ~drop
+        return self._replace(
+            char_array=self.char_array[keep], sizes=self.sizes[keep], angles=self.angles[keep]
+        )
+
+
+def _page_keys(page: Any, chars: list[dict[str, Any]], raw_lines: np.ndarray) -> PageKeys:
+    rules = np.stack(
+        [
+            np.minimum(raw_lines[:, 0], raw_lines[:, 2]),
+            np.minimum(raw_lines[:, 1], raw_lines[:, 3]),
+            np.maximum(raw_lines[:, 0], raw_lines[:, 2]),
+            np.maximum(raw_lines[:, 1], raw_lines[:, 3]),
+        ],
+        axis=1,
+    )
+    return furniture_keys(chars, float(page.height), rules=rules)
+
+
+def _raw_lines(page: Any) -> np.ndarray:
+    return np.array(
+        [_raw_line(line) for line in [*getattr(page, "lines", []), *getattr(page, "rects", [])]],
+        dtype=float,
+    ).reshape(-1, 4)
+
+
+def _raw_line(line: dict[str, float]) -> tuple[float, float, float, float]:
+    return (
+        float(line.get("x0", line.get("x1", 0.0))),
+        float(line.get("top", line.get("y0", 0.0))),
+        float(line.get("x1", line.get("x0", 0.0))),
+        float(line.get("bottom", line.get("y1", 0.0))),
+    )
 
 
 __all__ = ["PlumberDetector"]
@@ -0,0 +1,310 @@
+"""Cheap page-level pre-screen for table content.
+
+PDF pages are screened from their content-stream operators: text placement
+and path painting are read straight from the stream without decoding chars
+or running pdfminer's layout analysis, so pages that are skipped are never
+parsed and candidate pages are parsed once, by the detector.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+import numpy as np
+from pdfminer.pdfinterp import PDFContentParser, PDFResourceManager
+from pdfminer.pdftypes import PDFException, PDFObjRef, PDFStream, resolve1
+from pdfminer.psparser import PSEOF, PSKeyword, PSLiteral
+
+Matrix = tuple[float, float, float, float, float, float]
+
+_IDENTITY: Matrix = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+_PAINT = frozenset({"S", "s", "f", "F", "f*", "B", "B*", "b", "b*"})
+_SHOW = frozenset({"Tj", "TJ", "'", '"'})
+_CURVES = frozenset({"c", "v", "y"})
+_MAX_FORM_DEPTH = 8
+# device-space drift, in points, still treated as horizontal or vertical
+_AXIS_TOLERANCE = 0.5
+
+
+@dataclass(frozen=True)
+class PageScreen:
+    """Pre-screen outcome for one page.
+
+    ``score`` is 1.0 for pages with ruling lines and otherwise the share of
+    text lines holding at least two column-aligned segments. Running prose
+    scores close to 0.
+    """
+
+    page: int
+    score: float
+    n_lines: int
+    n_rules: int
+
+
+def screen_page(
+    page: Any,
+    index: int,
+    *,
+    min_rules: int = 4,
+    gap_factor: float = 1.0,
+    min_aligned: int = 3,
+) -> PageScreen:
+    """Score how likely a pdfplumber ``page`` is to contain a table.
+
+    Text lines are split into segments at horizontal gaps wider than
+    ``gap_factor`` times the median font size. On lines with several segments,
+    a segment is column-aligned when its left, centre or right edge lines up
+    with segments on at least ``min_aligned`` lines.
+
+    PDF pages are read from their content streams (see :func:`stream_boxes`),
+    which leaves the page's cached objects untouched. Pages without a
+    ``page_obj``, such as parse-artifact pages, are scored from their chars
+    and ruling lines.
+    """
+
+    if getattr(page, "page_obj", None) is not None:
+        boxes, n_rules = stream_boxes(page)
+    else:
+        n_rules = len(getattr(page, "lines", [])) + len(getattr(page, "rects", []))
+        boxes = np.array(
+            [
+                (float(c["x0"]), float(c["top"]), float(c["x1"]), float(c.get("size", 10.0)))
+                for c in page.chars
+            ],
+            dtype=float,
+        ).reshape(-1, 4)
+    if not len(boxes):
+        return PageScreen(page=index, score=0.0, n_lines=0, n_rules=n_rules)
+    size = float(np.median(boxes[:, 3])) or 10.0
+
+    order = np.lexsort((boxes[:, 0], boxes[:, 1]))
+    boxes = boxes[order]
+    line_ids = np.concatenate([[0], np.cumsum(np.diff(boxes[:, 1]) > size * 0.5)])
+    # chars in reading order: regroup by line, then by x within each line
+    order = np.lexsort((boxes[:, 0], line_ids))
+    boxes, line_ids = boxes[order], line_ids[order]
+    n_lines = int(line_ids[-1]) + 1
+    if n_rules >= min_rules:
+        return PageScreen(page=index, score=1.0, n_lines=n_lines, n_rules=n_rules)
+
+    same_line = line_ids[1:] == line_ids[:-1]
+    gaps = boxes[1:, 0] - boxes[:-1, 2]
+    breaks = np.flatnonzero(~same_line | (gaps > size * gap_factor)) + 1
+    seg_starts = np.concatenate([[0], breaks])
+    seg_x0 = np.minimum.reduceat(boxes[:, 0], seg_starts)
+    seg_x1 = np.maximum.reduceat(boxes[:, 2], seg_starts)
+    seg_line = line_ids[seg_starts]
+    multi = np.bincount(seg_line, minlength=n_lines)[seg_line] >= 2
+    if not multi.any():
+        return PageScreen(page=index, score=0.0, n_lines=n_lines, n_rules=n_rules)
+    seg_ids = np.flatnonzero(multi)
+    quantum = max(size * 0.5, 1.0)
+    # a segment edge is aligned when its left, centre or right x repeats on other lines
+    edges = np.concatenate([seg_x0[seg_ids], (seg_x0[seg_ids] + seg_x1[seg_ids]) / 2.0, seg_x1[seg_ids]])
+    kinds = np.repeat(np.arange(3), len(seg_ids))
+    keys = np.round(edges / quantum).astype(np.int64) * 3 + kinds
+    owners = np.tile(seg_ids, 3)
+    pairs = np.unique(np.stack([keys, seg_line[owners]], axis=1), axis=0)
+    values, counts = np.unique(pairs[:, 0], return_counts=True)
+    aligned_keys = values[counts >= min_aligned]
+    aligned_segments = np.unique(owners[np.isin(keys, aligned_keys)])
+    per_line = np.bincount(seg_line[aligned_segments], minlength=n_lines)
+    aligned_lines = int(np.count_nonzero(per_line >= 2))
+    return PageScreen(
+        page=index,
+        score=aligned_lines / n_lines,
+        n_lines=n_lines,
+        n_rules=n_rules,
+    )
+
+
+def stream_boxes(page: Any) -> tuple[np.ndarray, int]:
+    """Read the text runs and ruling-line count of a pdfplumber ``page``.
+
+    Every text-showing operator becomes one ``(x0, top, x1, size)`` box, its
+    width taken from the font's glyph widths; ``top`` is the negated
+    baseline, which orders lines like pdfplumber's ``top``. Rules are the
+    ``re`` rectangles and the horizontal or vertical ``l`` segments of
+    stroked or filled paths; diagonal segments, curves and paths ended with
+    ``n`` do not count. Form XObjects are followed.
+    """
+
+    scan = _StreamScan(getattr(page.pdf, "rsrcmgr", None) or PDFResourceManager())
+    scan.run(page.page_obj.contents, page.page_obj.resources, _IDENTITY, 0)
+    boxes = np.array(scan.boxes, dtype=float).reshape(-1, 4)
+    return boxes, scan.n_rules
+
+
+def _multiply(m: Matrix, n: Matrix) -> Matrix:
+    """``m`` applied first, then ``n``."""
+
+    a, b, c, d, e, f = m
+    a1, b1, c1, d1, e1, f1 = n
+    return (
+        a * a1 + b * c1,
+        a * b1 + b * d1,
+        c * a1 + d * c1,
+        c * b1 + d * d1,
+        e * a1 + f * c1 + e1,
+        e * b1 + f * d1 + f1,
+    )
+
+
+def _number(value: Any, default: float = 0.0) -> float:
+    return float(value) if isinstance(value, (int, float)) else default
+
+
+def _apply(m: Matrix, x: Any, y: Any) -> tuple[float, float]:
+    a, b, c, d, e, f = m
+    x, y = _number(x), _number(y)
+    return a * x + c * y + e, b * x + d * y + f
+
+
+class _StreamScan:
+    """Text-run and path bookkeeping for :func:`stream_boxes`."""
+
+    def __init__(self, rsrcmgr: PDFResourceManager) -> None:
+        self.rsrcmgr = rsrcmgr
+        self.boxes: list[tuple[float, float, float, float]] = []
+        self.n_rules = 0
+
+    def run(self, streams: Any, resources: Any, ctm: Matrix, depth: int) -> None:
+        resources = resolve1(resources) or {}
+        fonts = resolve1(resources.get("Font")) or {}
+        xobjects = resolve1(resources.get("XObject")) or {}
+        stack: list[tuple[Matrix, Any, float, float, float, float, float]] = []
+        font: Any = None
+        font_size = 10.0
+        char_space = word_space = leading = 0.0
+        scaling = 1.0
+        line: Matrix = _IDENTITY
+        text: Matrix = _IDENTITY
+        rules = 0
+        start = point = (0.0, 0.0)
+        for name, operands in self._operators(streams):
+            if name == "q":
+                stack.append((ctm, font, font_size, char_space, word_space, leading, scaling))
+            elif name == "Q":
+                if stack:
+                    ctm, font, font_size, char_space, word_space, leading, scaling = stack.pop()
+            elif name == "cm" and len(operands) == 6:
+                ctm = _multiply(tuple(_number(v) for v in operands), ctm)  # type: ignore[arg-type]
+            elif name == "m" and len(operands) == 2:
+                start = point = _apply(ctm, operands[0], operands[1])
+            elif name == "l" and len(operands) == 2:
+                end = _apply(ctm, operands[0], operands[1])
+                dx, dy = abs(end[0] - point[0]), abs(end[1] - point[1])
+                if min(dx, dy) <= _AXIS_TOLERANCE < max(dx, dy):
+                    rules += 1
+                point = end
+            elif name in _CURVES and len(operands) >= 4:
+                point = _apply(ctm, operands[-2], operands[-1])
+            elif name == "h":
+                point = start
+            elif name == "re" and len(operands) == 4:
+                rules += 1
+                start = point = _apply(ctm, operands[0], operands[1])
+            elif name in _PAINT:
+                self.n_rules += rules
+                rules = 0
+            elif name == "n":
+                rules = 0
+            elif name == "BT":
+                line = text = _IDENTITY
+            elif name == "Tf" and len(operands) == 2:
+                font = self._font(fonts, operands[0])
+                font_size = _number(operands[1], font_size)
+            elif name == "Tc" and operands:
+                char_space = _number(operands[0])
+            elif name == "Tw" and operands:
+                word_space = _number(operands[0])
+            elif name == "Tz" and operands:
+                scaling = _number(operands[0], 100.0) / 100.0
+            elif name == "TL" and operands:
+                leading = _number(operands[0])
+            elif name == "Tm" and len(operands) == 6:
+                line = text = tuple(_number(v) for v in operands)  # type: ignore[assignment]
+            elif name in ("Td", "TD") and len(operands) == 2:
+                tx, ty = _number(operands[0]), _number(operands[1])
+                if name == "TD":
+                    leading = -ty
+                line = text = _multiply((1.0, 0.0, 0.0, 1.0, tx, ty), line)
+            elif name == "T*":
+                line = text = _multiply((1.0, 0.0, 0.0, 1.0, 0.0, -leading), line)
+            elif name in _SHOW:
+                if name in ("'", '"'):
+                    line = text = _multiply((1.0, 0.0, 0.0, 1.0, 0.0, -leading), line)
+                if name == '"' and len(operands) == 3:
+                    word_space, char_space = _number(operands[0]), _number(operands[1])
+                shown = operands[-1] if operands else b""
+                advance = self._advance(shown, font, font_size, char_space, word_space) * scaling
+                if advance:
+                    self._add(text, ctm, advance, font_size)
+                text = _multiply((1.0, 0.0, 0.0, 1.0, advance, 0.0), text)
+            elif name == "Do" and operands and depth < _MAX_FORM_DEPTH:
+                self._form(xobjects, operands[0], resources, ctm, depth)
+
+    def _operators(self, streams: Any) -> Iterator[tuple[str, list[Any]]]:
+        parser = PDFContentParser(list(streams or []))
+        operands: list[Any] = []
+        while True:
+            try:
+                _, obj = parser.nextobject()
+            except PSEOF:
+                return
+            if isinstance(obj, PSKeyword):
+                yield obj.name.decode("latin-1"), operands
+                operands = []
+            else:
+                operands.append(obj)
+
+    def _font(self, fonts: Any, name: Any) -> Any:
+        key = name.name if isinstance(name, PSLiteral) else name
+        ref = fonts.get(key)
+        spec = resolve1(ref)
+        if not isinstance(spec, dict):
+            return None
+        try:
+            return self.rsrcmgr.get_font(ref.objid if isinstance(ref, PDFObjRef) else None, spec)
+        except PDFException:
+            # pdfminer's strict mode rejects malformed font dicts
+            return None
+
+    def _advance(
+        self, shown: Any, font: Any, size: float, char_space: float, word_space: float
+    ) -> float:
+        """Horizontal extent of a Tj string or TJ array, in text space."""
+
+        parts = shown if isinstance(shown, list) else [shown]
+        advance = 0.0
+        for part in parts:
+            if isinstance(part, (int, float)):
+                advance -= part / 1000.0 * size
+            elif isinstance(part, bytes):
+                if font is None:
+                    advance += len(part) * 0.5 * size
+                    continue
+                cids = list(font.decode(part))
+                advance += sum(font.char_width(cid) for cid in cids) * size
+                advance += char_space * len(cids)
+                if not font.is_multibyte():
+                    advance += word_space * part.count(b" ")
+        return advance
+
+    def _add(self, text: Matrix, ctm: Matrix, advance: float, size: float) -> None:
+        a, b, c, d, e, f = _multiply(text, ctm)
+        x0, x1 = e, e + a * advance
+        scale = abs(a * d - b * c) ** 0.5
+        self.boxes.append((min(x0, x1), -(f + b * advance / 2.0), max(x0, x1), size * scale))
+
+    def _form(self, xobjects: Any, name: Any, resources: Any, ctm: Matrix, depth: int) -> None:
+        key = name.name if isinstance(name, PSLiteral) else name
+        xobject = resolve1(xobjects.get(key))
+        if not isinstance(xobject, PDFStream) or getattr(xobject.get("Subtype"), "name", None) != "Form":
+            return
+        matrix = resolve1(xobject.get("Matrix")) or _IDENTITY
+        form_ctm = _multiply(tuple(_number(v) for v in matrix), ctm)  # type: ignore[arg-type]
+        self.run([xobject], xobject.get("Resources") or resources, form_ctm, depth + 1)
+
+
+__all__ = ["PageScreen", "screen_page", "stream_boxes"]
@@ -1,8 +1,8 @@
 """Export helpers."""
-from .html import table_to_html, tables_to_html
+from .html import iter_html, iter_tables_html, table_to_html, tables_to_html, write_html, write_tables_html
 from .csv import table_to_csv
-from .md import table_to_markdown
-from .dataframe import table_to_dataframe
+from .md import iter_markdown, table_to_markdown, write_markdown
+from .dataframe import doc_to_dataframe, iter_dataframes, table_to_dataframe
 
 __all__ = [
     "table_to_html",
@@ -10,4 +10,12 @@ __all__ = [
     "table_to_csv",
     "table_to_markdown",
     "table_to_dataframe",
+    "iter_dataframes",
+    "doc_to_dataframe",
+    "iter_html",
+    "iter_tables_html",
+    "iter_markdown",
+    "write_html",
+    "write_tables_html",
+    "write_markdown",
 ]
@@ -22,11 +22,9 @@ def table_to_csv(
         fill = "empty"
     elif fill_policy == "sentinel":
         fill = sentinel
-    matrix = table.as_matrix(fill=fill)
     buffer = StringIO()
     writer = csv.writer(buffer)
-    for row in matrix:
-        writer.writerow(row)
+    writer.writerows(table.iter_rows(fill=fill))
     return buffer.getvalue()
 
 
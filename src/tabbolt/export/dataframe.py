@@ -1,21 +1,136 @@
 """DataFrame exporters."""
 from __future__ import annotations
 
+from itertools import islice
+from typing import Iterator
+
+import numpy as np
 import pandas as pd
 
-from ..models import Table
+from ..models import DocResult, Table
+
+_BBOX_COLUMNS = ("x0", "top", "x1", "bottom")
 
 
 def table_to_dataframe(table: Table, *, tidy: bool = False, fill: str = "repeat") -> pd.DataFrame:
-    matrix = table.as_matrix(fill=fill)
-    df = pd.DataFrame(matrix)
+    chunks = list(iter_dataframes(table, tidy=tidy, fill=fill))
+    if not chunks:
+        return pd.DataFrame([])
+    if len(chunks) == 1:
+        return chunks[0]
+    return pd.concat(chunks, ignore_index=True)
+
+
+def iter_dataframes(
+    table: Table,
+    *,
+    chunk_size: int = 10_000,
+    tidy: bool = False,
+    fill: str = "repeat",
+) -> Iterator[pd.DataFrame]:
+    """Yield ``table`` as DataFrames of at most ``chunk_size`` table rows.
+
+    Chunks carry the row numbers of the full frame, so concatenating them
+    reproduces :func:`table_to_dataframe`.
+    """
+
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    rows = table.iter_rows(fill=fill)
+    start = 0
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        if tidy:
+            n_cols = len(chunk[0])
+            if not n_cols:
+                start += len(chunk)
+                continue
+            yield pd.DataFrame(
+                {
+                    "row": [r for r in range(start, start + len(chunk)) for _ in range(n_cols)],
+                    "col": [c for _ in chunk for c in range(n_cols)],
+                    "value": [value for row in chunk for value in row],
+                },
+                index=range(start * n_cols, (start + len(chunk)) * n_cols),
+            )
+        else:
+            yield pd.DataFrame(chunk, index=range(start, start + len(chunk)))
+        start += len(chunk)
+
+
+def doc_to_dataframe(
+    result: DocResult,
+    *,
+    tidy: bool = True,
+    fill: str = "repeat",
+    categorical_text: bool = False,
+) -> pd.DataFrame:
+    """Return every table of ``result`` as one DataFrame.
+
+    In tidy form there is one row per cell with the columns ``table_id``,
+    ``page`` (first page of the table), ``row``, ``col``, ``rowspan``,
+    ``colspan``, ``x0``, ``top``, ``x1``, ``bottom`` and ``text``. Each column
+    is allocated once for the whole document. ``categorical_text`` stores
+    ``text`` as a categorical, which pays off when values repeat.
+
+    Otherwise the frame is wide: ``table_id``, ``page`` and ``row`` followed by
+    one column per table column (filled as in :meth:`Table.as_matrix`),
+    padded with missing values for tables narrower than the widest one.
+    """
+
+    tables = result.tables
     if not tidy:
-        return df
-    tidy_rows = []
-    for r, row in enumerate(matrix):
-        for c, value in enumerate(row):
-            tidy_rows.append({"row": r, "col": c, "value": value})
-    return pd.DataFrame(tidy_rows)
+        return _wide_frame(tables, fill=fill, categorical_text=categorical_text)
+    counts = np.fromiter((len(table.cells) for table in tables), dtype=np.int64, count=len(tables))
+    total = int(counts.sum())
+    cells = [cell for table in tables for cell in table.cells]
+    columns: dict[str, object] = {
+        "table_id": np.repeat(np.arange(len(tables), dtype=np.int64), counts),
+        "page": np.repeat(
+            np.fromiter(
+                (min(table.page) if table.page else 0 for table in tables),
+                dtype=np.int64,
+                count=len(tables),
+            ),
+            counts,
+        ),
+    }
+    for name in ("row", "col", "rowspan", "colspan"):
+        columns[name] = np.fromiter(
+            (getattr(cell, name) for cell in cells), dtype=np.int64, count=total
+        )
+    bbox = np.fromiter((cell.bbox for cell in cells), dtype=(np.float64, 4), count=total)
+    for index, name in enumerate(_BBOX_COLUMNS):
+        columns[name] = bbox[:, index]
+    text = [cell.text for cell in cells]
+    columns["text"] = pd.Categorical(text) if categorical_text else text
+    return pd.DataFrame(columns)
+
+
+def _wide_frame(tables: list[Table], *, fill: str, categorical_text: bool) -> pd.DataFrame:
+    width = max((table.n_cols for table in tables), default=0)
+    table_ids: list[int] = []
+    pages: list[int] = []
+    rows: list[int] = []
+    values: list[list[object]] = [[] for _ in range(width)]
+    for table_id, table in enumerate(tables):
+        page = min(table.page) if table.page else 0
+        for r, row in enumerate(table.iter_rows(fill=fill)):
+            table_ids.append(table_id)
+            pages.append(page)
+            rows.append(r)
+            for c in range(width):
+                values[c].append(row[c] if c < len(row) else None)
+    columns: dict[object, object] = {
+        "table_id": np.asarray(table_ids, dtype=np.int64),
+        "page": np.asarray(pages, dtype=np.int64),
+        "row": np.asarray(rows, dtype=np.int64),
+    }
+    for c, column in enumerate(values):
+        columns[c] = pd.Categorical(column) if categorical_text else column
+    return pd.DataFrame(columns)
 
 
-__all__ = ["table_to_dataframe"]
+__all__ = ["table_to_dataframe", "iter_dataframes", "doc_to_dataframe"]
@@ -2,55 +2,81 @@
 from __future__ import annotations
 
 from html import escape
-from typing import Iterable
+from typing import Iterable, Iterator, TextIO
 
 from ..models import Table
 
+_TABLE_STYLE = ' style="border-collapse:collapse;border:1px solid #666;font-family:monospace;"'
+_CELL_STYLE = ' style="padding:4px;border:1px solid #999;"'
+_ROWS_PER_CHUNK = 256
+
 
 def table_to_html(table: Table, *, inline_styles: bool = True) -> str:
+    return ''.join(iter_html(table, inline_styles=inline_styles))
+
+
+def tables_to_html(tables: Iterable[Table], *, inline_styles: bool = True) -> str:
+    return ''.join(iter_tables_html(tables, inline_styles=inline_styles))
+
+
+def iter_html(table: Table, *, inline_styles: bool = True) -> Iterator[str]:
+    """Yield the markup of :func:`table_to_html` in chunks of rows."""
+
     table.sort_cells()
-    matrix = _build_cell_matrix(table)
-    style_attr = ''
-    if inline_styles:
-        style_attr = ' style="border-collapse:collapse;border:1px solid #666;font-family:monospace;"'
-    lines = [f'<table{style_attr}>']
-    for row in matrix:
-        lines.append('  <tr>')
+    cell_style = _CELL_STYLE if inline_styles else ''
+    # opening tags depend only on the spans, so build each variant once
+    openers: dict[tuple[int, int], str] = {}
+    yield f'<table{_TABLE_STYLE if inline_styles else ""}>'
+    parts: list[str] = []
+    for index, row in enumerate(table.iter_cell_rows(), start=1):
+        parts.append('\n  <tr>')
         for cell in row:
             if cell is None:
                 continue
-            attrs = []
-            if cell.rowspan > 1:
-                attrs.append(f'rowspan="{cell.rowspan}"')
-            if cell.colspan > 1:
-                attrs.append(f'colspan="{cell.colspan}"')
-            cell_style = 'padding:4px;border:1px solid #999;' if inline_styles else ''
-            if cell_style:
-                attrs.append(f'style="{cell_style}"')
-            attrs_str = (' ' + ' '.join(attrs)) if attrs else ''
-            lines.append(f'    <td{attrs_str}>{escape(cell.text)}</td>')
-        lines.append('  </tr>')
-    lines.append('</table>')
-    return '
-'.join(lines)
+            key = (cell.rowspan, cell.colspan)
+            opener = openers.get(key)
+            if opener is None:
+                attrs = ''
+                if cell.rowspan > 1:
+                    attrs += f' rowspan="{cell.rowspan}"'
+                if cell.colspan > 1:
+                    attrs += f' colspan="{cell.colspan}"'
+                opener = openers[key] = f'\n    <td{attrs}{cell_style}>'
+            parts.append(f'{opener}{escape(cell.text)}</td>')
+        parts.append('\n  </tr>')
+        if index % _ROWS_PER_CHUNK == 0:
+            yield ''.join(parts)
+            parts.clear()
+    parts.append('\n</table>')
+    yield ''.join(parts)
 
 
-def tables_to_html(tables: Iterable[Table], *, inline_styles: bool = True) -> str:
-    return '
+def iter_tables_html(tables: Iterable[Table], *, inline_styles: bool = True) -> Iterator[str]:
+    """Yield the markup of :func:`tables_to_html`, one table at a time."""
+
+    for index, table in enumerate(tables):
+        if index:
+            yield '\n\n'
+        yield from iter_html(table, inline_styles=inline_styles)
+
+
+def write_html(table: Table, sink: TextIO, *, inline_styles: bool = True) -> None:
+    """Write the markup of :func:`table_to_html` to ``sink`` without building it."""
+
+    sink.writelines(iter_html(table, inline_styles=inline_styles))
 
-'.join(table_to_html(table, inline_styles=inline_styles) for table in tables)
 
+def write_tables_html(tables: Iterable[Table], sink: TextIO, *, inline_styles: bool = True) -> None:
+    """Write a multi-table report to ``sink``; tables may be a lazy iterable."""
 
-def _build_cell_matrix(table: Table) -> list[list[object | None]]:
-    matrix: list[list[object | None]] = [[None for _ in range(table.n_cols)] for _ in range(table.n_rows)]
-    for cell in table.cells:
-        for r in range(cell.row, cell.row + cell.rowspan):
-            for c in range(cell.col, cell.col + cell.colspan):
-                if (r, c) == (cell.row, cell.col):
-                    matrix[r][c] = cell
-                else:
-                    matrix[r][c] = None
-    return matrix
+    sink.writelines(iter_tables_html(tables, inline_styles=inline_styles))
 
 
-__all__ = ["table_to_html", "tables_to_html"]
+__all__ = [
+    "table_to_html",
+    "tables_to_html",
+    "iter_html",
+    "iter_tables_html",
+    "write_html",
+    "write_tables_html",
+]
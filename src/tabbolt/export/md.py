@@ -1,28 +1,47 @@
 """Markdown exporter."""
 from __future__ import annotations
 
+from typing import Iterator, TextIO
+
 from ..models import Table
 
+_ROWS_PER_CHUNK = 256
+
 
 def table_to_markdown(table: Table, *, fill: str = "repeat") -> str:
-    matrix = table.as_matrix(fill=fill)
-    if not matrix:
-        return ""
-    header = matrix[0]
-    body = matrix[1:]
-    lines = ["| " + " | ".join(_escape(cell) for cell in header) + " |"]
-    lines.append("| " + " | ".join(["---"] * len(header)) + " |")
-    for row in body:
-        lines.append("| " + " | ".join(_escape(cell) for cell in row) + " |")
-    return "
-".join(lines)
+    return "".join(iter_markdown(table, fill=fill))
+
+
+def iter_markdown(table: Table, *, fill: str = "repeat") -> Iterator[str]:
+    """Yield the text of :func:`table_to_markdown` in chunks of rows."""
+
+    rows = table.iter_rows(fill=fill)
+    header = next(rows, None)
+    if header is None:
+        return
+    yield "| " + " | ".join(_escape(cell) for cell in header) + " |"
+    yield "\n| " + " | ".join(["---"] * len(header)) + " |"
+    parts: list[str] = []
+    for index, row in enumerate(rows, start=1):
+        parts.append("\n| " + " | ".join(_escape(cell) for cell in row) + " |")
+        if index % _ROWS_PER_CHUNK == 0:
+            yield "".join(parts)
+            parts.clear()
+    if parts:
+        yield "".join(parts)
+
+
+def write_markdown(table: Table, sink: TextIO, *, fill: str = "repeat") -> None:
+    """Write the text of :func:`table_to_markdown` to ``sink`` without building it."""
+
+    sink.writelines(iter_markdown(table, fill=fill))
 
 
 def _escape(value: object) -> str:
     if value is None:
         return ""
     text = str(value)
-    return text.replace("|", "\|")
+    return text.replace("|", "\\|")
 
 
-__all__ = ["table_to_markdown"]
+__all__ = ["table_to_markdown", "iter_markdown", "write_markdown"]
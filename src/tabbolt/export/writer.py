@@ -0,0 +1,117 @@
+"""Concurrent output writer for rendered tables."""
+from __future__ import annotations
+
+import json
+import zipfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, TextIO
+
+RenderedFiles = list[tuple[str, str]]
+
+ARCHIVE_SUFFIXES = (".zip", ".ndjson", ".jsonl")
+
+
+class TableWriter:
+    """Render and write tables on a thread pool while extraction continues.
+
+    Each submitted job returns ``(file name, content)`` pairs. Without
+    ``into`` every file is written to ``out`` by the worker that rendered it.
+    With ``into`` ending in ``.zip`` the files become members of one archive,
+    and with ``.ndjson``/``.jsonl`` each file becomes one
+    ``{"name": ..., "content": ...}`` line; both keep submission order.
+
+    With ``append`` an existing bundle is extended instead of replaced, as a
+    resumed run needs.
+
+    At most ``2 * threads`` jobs are in flight, so rendered output never
+    accumulates in memory.
+    """
+
+    def __init__(
+        self, out: Path, *, into: Path | None = None, threads: int = 4, append: bool = False
+    ) -> None:
+        if into is not None and into.suffix.lower() not in ARCHIVE_SUFFIXES:
+            raise ValueError(f"Unsupported output bundle {into.name}; use one of {ARCHIVE_SUFFIXES}")
+        self.out = out
+        self.into = into
+        self.files_written = 0
+        self._threads = max(1, threads)
+        self._pending: deque[Future[RenderedFiles] | Callable[[], None]] = deque()
+        self._archive: zipfile.ZipFile | None = None
+        self._stream: TextIO | None = None
+        if into is None:
+            out.mkdir(parents=True, exist_ok=True)
+        else:
+            into.parent.mkdir(parents=True, exist_ok=True)
+            if into.suffix.lower() == ".zip":
+                mode = "a" if append and into.exists() else "w"
+                self._archive = zipfile.ZipFile(into, mode, compression=zipfile.ZIP_DEFLATED)
+            else:
+                self._stream = into.open("a" if append else "w", encoding="utf-8")
+        self._pool = ThreadPoolExecutor(max_workers=self._threads, thread_name_prefix="tabbolt-writer")
+
+    def submit(self, render: Callable[[], RenderedFiles]) -> None:
+        """Queue ``render``; blocks while too many jobs are in flight."""
+
+        self._pending.append(self._pool.submit(self._run, render))
+        while len(self._pending) > 2 * self._threads:
+            self._drain_one()
+
+    def after(self, callback: Callable[[], None]) -> None:
+        """Call ``callback`` once every job submitted so far has been written.
+
+        Callbacks of a discarded writer are not called.
+        """
+
+        self._pending.append(callback)
+
+    def close(self, *, discard: bool = False) -> int:
+        """Wait for all jobs, close the output and return the files written.
+
+        With ``discard`` queued jobs are cancelled and pending output dropped.
+        """
+
+        try:
+            while self._pending and not discard:
+                self._drain_one()
+        finally:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            if self._archive is not None:
+                self._archive.close()
+            if self._stream is not None:
+                self._stream.close()
+        return self.files_written
+
+    def __enter__(self) -> TableWriter:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *exc: object) -> None:
+        self.close(discard=exc_type is not None)
+
+    def _run(self, render: Callable[[], RenderedFiles]) -> RenderedFiles:
+        files = render()
+        if self.into is None:
+            for name, content in files:
+                (self.out / name).write_text(content)
+        return files
+
+    def _drain_one(self) -> None:
+        pending = self._pending.popleft()
+        if not isinstance(pending, Future):
+            if self._stream is not None:
+                self._stream.flush()
+            pending()
+            return
+        files = pending.result()
+        for name, content in files:
+            if self._archive is not None:
+                self._archive.writestr(name, content)
+            elif self._stream is not None:
+                self._stream.write(json.dumps({"name": name, "content": content}, ensure_ascii=False))
+                self._stream.write("\n")
+        self.files_written += len(files)
+
+
+__all__ = ["TableWriter", "ARCHIVE_SUFFIXES"]
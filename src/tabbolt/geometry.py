@@ -6,8 +6,6 @@ from math import atan2, cos, pi, sin
 from typing import Iterable, Sequence
 
 import numpy as np
-from shapely.geometry import Polygon, box
-from shapely.ops import unary_union
 
 from .models import BBox
 
@@ -42,23 +40,85 @@ class RotatedPage:
         return min(xs), min(ys), max(xs), max(ys)
 
 
-def infer_rotation(char_angles: Sequence[float]) -> float:
-    """Infer the dominant page rotation from character angles."""
+def infer_rotation(
+    char_angles: Sequence[float],
+    *,
+    dominance: float | None = None,
+    batch_size: int = 512,
+) -> float:
+    """Infer the dominant page rotation from character angles.
 
-    if not char_angles:
+    Angles are assigned to the nearest multiple of 90 degrees in batches of
+    ``batch_size``. Counting stops early once the leading bucket can no longer
+    be overtaken, or, when ``dominance`` is given, once it holds at least that
+    share of the angles seen so far.
+    """
+
+    angles = np.asarray(char_angles, dtype=float)
+    if not angles.size:
         return 0.0
-    angles = np.array([a % 360 for a in char_angles], dtype=float)
-    buckets = {0: 0, 90: 0, 180: 0, 270: 0}
-    for angle in angles:
-        nearest = min(buckets, key=lambda b: min(abs(angle - b), abs(angle - b + 360)))
-        buckets[nearest] += 1
-    dominant = max(buckets, key=buckets.get)
+    counts = np.zeros(4, dtype=np.int64)
+    total = int(angles.size)
+    for start in range(0, total, max(1, batch_size)):
+        chunk = angles[start : start + max(1, batch_size)]
+        # ties resolve towards the lower bucket
+        buckets = np.ceil(np.mod(chunk, 360.0) / 90.0 - 0.5).astype(np.int64) % 4
+        counts += np.bincount(buckets, minlength=4)
+        seen = start + chunk.size
+        ranked = np.sort(counts)
+        if ranked[-1] - ranked[-2] > total - seen:
+            break
+        if dominance is not None and ranked[-1] >= dominance * seen:
+            break
+    dominant = int(np.argmax(counts)) * 90
     return dominant * pi / 180
 
 
-def rotation_from_chars(chars: Sequence[dict[str, float]], page_width: float, page_height: float) -> RotatedPage:
+def rotation_from_chars(
+    chars: Sequence[dict[str, float]],
+    page_width: float,
+    page_height: float,
+    *,
+    sample_size: int | None = None,
+    dominance: float | None = None,
+) -> RotatedPage:
+    """Infer page rotation from ``chars``.
+
+    With ``sample_size`` only an evenly strided sample of that many chars is
+    inspected, which keeps the cost bounded on text-heavy pages.
+    """
+
+    if sample_size is not None and len(chars) > sample_size:
+        indices = np.linspace(0, len(chars) - 1, num=max(1, sample_size)).astype(np.int64)
+        chars = [chars[int(i)] for i in indices]
     angles = [float(char.get("angle", 0.0)) for char in chars if "angle" in char]
-    angle = infer_rotation(angles)
+    angle = infer_rotation(angles, dominance=dominance)
+    return RotatedPage(angle=angle, width=page_width, height=page_height)
+
+
+def char_angles(chars: Sequence[dict[str, float]]) -> np.ndarray:
+    """Return the ``angle`` of every char, NaN where a char has none."""
+
+    return np.fromiter(
+        (float(char["angle"]) if "angle" in char else np.nan for char in chars),
+        dtype=float,
+        count=len(chars),
+    )
+
+
+def rotation_from_angles(
+    angles: np.ndarray,
+    page_width: float,
+    page_height: float,
+    *,
+    sample_size: int | None = None,
+    dominance: float | None = None,
+) -> RotatedPage:
+    """:func:`rotation_from_chars` for the :func:`char_angles` of a page."""
+
+    if sample_size is not None and len(angles) > sample_size:
+        angles = angles[np.linspace(0, len(angles) - 1, num=max(1, sample_size)).astype(np.int64)]
+    angle = infer_rotation(angles[~np.isnan(angles)].tolist(), dominance=dominance)
     return RotatedPage(angle=angle, width=page_width, height=page_height)
 
 
@@ -93,14 +153,73 @@ def expand_bbox(bbox: BBox, padding: float) -> BBox:
     return x0 - padding, y0 - padding, x1 + padding, y1 + padding
 
 
-def merge_boxes(boxes: Iterable[BBox]) -> BBox:
-    shapely_boxes = [box(*b) for b in boxes]
-    merged = unary_union(shapely_boxes)
-    if merged.geom_type == "Polygon":
-        minx, miny, maxx, maxy = merged.bounds
-    else:
-        minx, miny, maxx, maxy = merged.envelope.bounds
-    return float(minx), float(miny), float(maxx), float(maxy)
+def as_bbox_array(boxes: Iterable[BBox] | np.ndarray) -> np.ndarray:
+    """Return ``boxes`` as a float ``(n, 4)`` array of ``x0, y0, x1, y1`` rows."""
+
+    if isinstance(boxes, np.ndarray):
+        return boxes.astype(float, copy=False).reshape(-1, 4)
+    return np.asarray(list(boxes), dtype=float).reshape(-1, 4)
+
+
+def bbox_envelope(boxes: Iterable[BBox] | np.ndarray) -> BBox:
+    """Return the bounding envelope of a batch of axis-aligned boxes."""
+
+    arr = as_bbox_array(boxes)
+    if not len(arr):
+        raise ValueError("bbox_envelope() requires at least one box")
+    return (
+        float(np.minimum(arr[:, 0], arr[:, 2]).min()),
+        float(np.minimum(arr[:, 1], arr[:, 3]).min()),
+        float(np.maximum(arr[:, 0], arr[:, 2]).max()),
+        float(np.maximum(arr[:, 1], arr[:, 3]).max()),
+    )
+
+
+def overlap_mask(
+    a: Iterable[BBox] | np.ndarray, b: Iterable[BBox] | np.ndarray
+) -> np.ndarray:
+    """Return an ``(n, m)`` mask of boxes in ``a`` touching or overlapping ``b``."""
+
+    arr_a = as_bbox_array(a)[:, None, :]
+    arr_b = as_bbox_array(b)[None, :, :]
+    return ~(
+        (arr_a[..., 2] < arr_b[..., 0])
+        | (arr_a[..., 0] > arr_b[..., 2])
+        | (arr_a[..., 3] < arr_b[..., 1])
+        | (arr_a[..., 1] > arr_b[..., 3])
+    )
+
+
+def iou_matrix(a: Iterable[BBox] | np.ndarray, b: Iterable[BBox] | np.ndarray) -> np.ndarray:
+    """Return the ``(n, m)`` intersection-over-union matrix of two box batches."""
+
+    arr_a = normalize_bboxes(as_bbox_array(a))[:, None, :]
+    arr_b = normalize_bboxes(as_bbox_array(b))[None, :, :]
+    inter_w = np.minimum(arr_a[..., 2], arr_b[..., 2]) - np.maximum(arr_a[..., 0], arr_b[..., 0])
+    inter_h = np.minimum(arr_a[..., 3], arr_b[..., 3]) - np.maximum(arr_a[..., 1], arr_b[..., 1])
+    inter = np.clip(inter_w, 0.0, None) * np.clip(inter_h, 0.0, None)
+    area_a = (arr_a[..., 2] - arr_a[..., 0]) * (arr_a[..., 3] - arr_a[..., 1])
+    area_b = (arr_b[..., 2] - arr_b[..., 0]) * (arr_b[..., 3] - arr_b[..., 1])
+    union = area_a + area_b - inter
+    return np.divide(inter, union, out=np.zeros_like(inter), where=union > 0)
+
+
+def normalize_bboxes(arr: np.ndarray) -> np.ndarray:
+    """Return ``(n, 4)`` boxes with ``x0 <= x1`` and ``y0 <= y1``."""
+
+    return np.stack(
+        [
+            np.minimum(arr[:, 0], arr[:, 2]),
+            np.minimum(arr[:, 1], arr[:, 3]),
+            np.maximum(arr[:, 0], arr[:, 2]),
+            np.maximum(arr[:, 1], arr[:, 3]),
+        ],
+        axis=1,
+    ).reshape(-1, 4)
+
+
+def merge_boxes(boxes: Iterable[BBox] | np.ndarray) -> BBox:
+    return bbox_envelope(boxes)
 
 
 def bbox_area(bbox: BBox) -> float:
@@ -109,22 +228,24 @@ def bbox_area(bbox: BBox) -> float:
 
 
 def intersection_over_union(a: BBox, b: BBox) -> float:
-    poly_a = box(*a)
-    poly_b = box(*b)
-    inter = poly_a.intersection(poly_b).area
-    union = poly_a.union(poly_b).area
-    if union == 0:
-        return 0.0
-    return float(inter / union)
+    return float(iou_matrix([a], [b])[0, 0])
 
 
 __all__ = [
     "RotatedPage",
+    "infer_rotation",
     "rotation_from_chars",
+    "rotation_from_angles",
+    "char_angles",
     "snap_epsilon",
     "snap_values",
     "expand_bbox",
     "merge_boxes",
     "bbox_area",
     "intersection_over_union",
+    "as_bbox_array",
+    "normalize_bboxes",
+    "bbox_envelope",
+    "overlap_mask",
+    "iou_matrix",
 ]
@@ -0,0 +1,92 @@
+"""Resumable job manifest for batch extraction.
+
+The manifest is a JSON-lines file with one entry per processed document:
+its path, content hash, size, status, table count and timing. Entries are
+appended and flushed as documents finish, so an interrupted job leaves a
+valid manifest behind and a rerun skips every document already done.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+_CHUNK = 1 << 20
+
+
+def file_digest(path: str | os.PathLike[str]) -> str:
+    """Return the SHA-256 hex digest of the file at ``path``."""
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        while chunk := handle.read(_CHUNK):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class JobManifest:
+    """Append-only record of finished documents.
+
+    A document counts as done when an ``"ok"`` entry exists for the same
+    resolved path, content hash and ``output`` settings; changed files, and
+    runs writing another format or to another place, are processed again.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], *, output: str = "") -> None:
+        self.path = Path(path)
+        self.output = output
+        self._done: dict[tuple[str, str], str] = {}
+        if self.path.exists():
+            with self.path.open(encoding="utf-8") as handle:
+                for line in handle:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:  # torn final line of an interrupted run
+                        continue
+                    if entry.get("status") == "ok":
+                        self._done[entry["path"], entry.get("output", "")] = entry["sha256"]
+
+    def is_done(self, path: str | os.PathLike[str], digest: str) -> bool:
+        return self._done.get((_key(path), self.output)) == digest
+
+    def record(
+        self,
+        path: str | os.PathLike[str],
+        digest: str,
+        *,
+        status: str,
+        seconds: float,
+        **fields: Any,
+    ) -> None:
+        """Append an entry for ``path`` and flush it to disk."""
+
+        entry = {
+            "path": _key(path),
+            "sha256": digest,
+            "size": os.path.getsize(path),
+            "output": self.output,
+            "status": status,
+            "seconds": round(seconds, 6),
+            "finished": time.time(),
+            **fields,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            handle.flush()
+            os.fsync(handle.fileno())
+        if status == "ok":
+            self._done[entry["path"], self.output] = digest
+
+
+def _key(path: str | os.PathLike[str]) -> str:
+    return str(Path(path).resolve())
+
+
+__all__ = ["JobManifest", "file_digest"]
@@ -1,7 +1,9 @@
 """Data models for TabBolt."""
 from __future__ import annotations
 
-from typing import Any, ClassVar, Iterable, List, Sequence
+import os
+from itertools import pairwise
+from typing import TYPE_CHECKING, Any, ClassVar, Iterable, Iterator, List, Sequence
 
 from pydantic import BaseModel, Field, computed_field
 
@@ -10,6 +12,9 @@ try:  # pragma: no cover - optional dependency
 except Exception:  # pragma: no cover - fallback when optional dep missing
     orjson = None  # type: ignore[assignment]
 
+if TYPE_CHECKING:  # pragma: no cover
+    from .wire import LazyDocResult
+
 BBox = tuple[float, float, float, float]
 
 
@@ -70,28 +75,76 @@ class Table(BaseModel):
             spans, ``"sentinel"`` fills with ``None``.
         """
 
-        matrix: list[list[Any]] = [["" for _ in range(self.n_cols)] for _ in range(self.n_rows)]
-        for cell in self.cells:
-            value: Any
-            if fill == "sentinel":
-                value = None
-            elif fill == "repeat":
-                value = cell.text
-            else:
-                value = fill
-            for r in range(cell.row, cell.row + cell.rowspan):
-                for c in range(cell.col, cell.col + cell.colspan):
-                    if fill == "repeat" and (r, c) == (cell.row, cell.col):
-                        matrix[r][c] = cell.text
-                    elif fill == "repeat":
-                        matrix[r][c] = cell.text
-                    elif fill == "empty":
-                        matrix[r][c] = ""
-                    else:
-                        matrix[r][c] = value
-            # ensure top-left always text
-            matrix[cell.row][cell.col] = cell.text
-        return matrix
+        return list(self.iter_rows(fill=fill))
+
+    def iter_rows(self, *, fill: str | Any = "") -> Iterator[list[Any]]:
+        """Yield the rows of :meth:`as_matrix` one at a time.
+
+        Only the cells spanning the current row are held, so memory stays
+        proportional to the number of columns times the largest rowspan.
+        """
+
+        for r, owners in self._iter_owners():
+            row: list[Any] = []
+            for c, cell in enumerate(owners):
+                if cell is None:
+                    row.append("")
+                elif fill == "repeat" or (cell.row == r and cell.col == c):
+                    row.append(cell.text)
+                elif fill == "sentinel":
+                    row.append(None)
+                elif fill == "empty":
+                    row.append("")
+                else:
+                    row.append(fill)
+            yield row
+
+    def iter_cell_rows(self) -> Iterator[list[Cell | None]]:
+        """Yield, per row, the cell anchored at each column or ``None``.
+
+        Positions covered by a span from an earlier row or column are ``None``,
+        which is the layout HTML ``rowspan``/``colspan`` markup expects.
+        """
+
+        for r, owners in self._iter_owners():
+            yield [
+                cell if cell is not None and cell.row == r and cell.col == c else None
+                for c, cell in enumerate(owners)
+            ]
+
+    def _iter_owners(self) -> Iterator[tuple[int, list[Cell | None]]]:
+        """Yield each row index with the cell covering every column."""
+
+        # Cells are applied in list order, so a later cell wins where spans overlap.
+        cells = self.cells
+        n_cols = self.n_cols
+        order: Sequence[int] = range(len(cells))
+        if any(a.row > b.row for a, b in pairwise(cells)):
+            order = sorted(order, key=lambda index: cells[index].row)
+        position, total = 0, len(order)
+        spanning: list[int] = []
+        for r in range(self.n_rows):
+            start = position
+            while position < total and cells[order[position]].row <= r:
+                position += 1
+            active = [*spanning, *order[start:position]]
+            active.sort()
+            spanning = []
+            owners: list[Cell | None] = [None] * n_cols
+            for index in active:
+                cell = cells[index]
+                end = cell.row + cell.rowspan
+                if end <= r:
+                    continue
+                if end > r + 1:
+                    spanning.append(index)
+                col = cell.col
+                if cell.colspan == 1 and 0 <= col < n_cols:
+                    owners[col] = cell
+                else:
+                    for c in range(max(col, 0), min(col + cell.colspan, n_cols)):
+                        owners[c] = cell
+            yield r, owners
 
     def sort_cells(self) -> None:
         self.cells.sort(key=lambda c: (c.row, c.col))
@@ -113,8 +166,83 @@ class DocResult(BaseModel):
 
         return json.dumps(data, indent=indent)
 
+    def to_bytes(self) -> bytes:
+        """Encode the result in the compact binary format of :mod:`tabbolt.wire`."""
+
+        from .wire import encode_result
+
+        return encode_result(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes | bytearray | memoryview, *, trusted: bool = False) -> DocResult:
+        """Decode :meth:`to_bytes` output; ``trusted=True`` skips model validation."""
+
+        from .wire import decode_result
+
+        return decode_result(data, trusted=trusted)
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Write the result to ``path`` in the :meth:`to_bytes` format."""
+
+        from .wire import save_result
+
+        save_result(self, path)
+
+    @classmethod
+    def load(
+        cls, path: str | os.PathLike[str], *, lazy: bool = False, trusted: bool = False
+    ) -> DocResult | LazyDocResult:
+        """Read a result written by :meth:`save`.
+
+        The file is memory mapped. With ``lazy=True`` a
+        :class:`~tabbolt.wire.LazyDocResult` is returned whose tables are
+        decoded on first access; ``trusted=True`` skips model validation.
+        """
+
+        from .wire import load_result
+
+        return load_result(path, lazy=lazy, trusted=trusted)
+
     def as_matrices(self, *, fill: str | Any = "") -> list[list[list[Any]]]:
         return [table.as_matrix(fill=fill) for table in self.tables]
 
 
-__all__ = ["Cell", "Table", "DocResult", "BBox"]
+class PartialResult(BaseModel):
+    """Extraction result for one page-range shard of a document.
+
+    ``head`` holds the shard's leading tables unstitched so they can continue
+    a table left open by the previous shard. ``tables`` holds the remaining
+    stitched tables; the last one stays open for the next shard.
+    """
+
+    pages: list[int] = Field(default_factory=list)
+    head: list[Table] = Field(default_factory=list)
+    tables: list[Table] = Field(default_factory=list)
+    stitch_aggressiveness: str = "med"
+    stats: dict[str, Any] = Field(default_factory=dict)
+    warnings: list[str] = Field(default_factory=list)
+
+    @property
+    def first_page(self) -> int:
+        if self.pages:
+            return min(self.pages)
+        table_pages = [page for table in self.head + self.tables for page in table.page]
+        return min(table_pages) if table_pages else 0
+
+    @property
+    def tail(self) -> Table | None:
+        """Open tail table, or ``None`` when the whole shard is open head."""
+
+        return self.tables[-1] if self.tables else None
+
+    def to_json(self, *, indent: int | None = None) -> str:
+        data = self.model_dump(mode="json")
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 if indent else 0
+            return orjson.dumps(data, option=option).decode()
+        import json
+
+        return json.dumps(data, indent=indent)
+
+
+__all__ = ["Cell", "Table", "DocResult", "PartialResult", "BBox"]
@@ -1,39 +1,91 @@
-"""Plugin discovery utilities."""
+"""Plugin discovery utilities.
+
+Lookups are safe from any number of threads. Detectors are shared between
+threads unless they set ``reentrant = False``, in which case every thread
+gets its own instance.
+"""
 from __future__ import annotations
 
+import copy
+import threading
 from importlib import metadata
-from typing import Dict
+from typing import Callable, Dict, Optional
 
 from ..detect import Detector, PlumberDetector
 
+_LOCK = threading.RLock()
+_FACTORIES: Optional[Dict[str, Callable[[], Detector]]] = None
 _CACHE: Dict[str, Detector] = {}
+_LOCAL = threading.local()
 
 
 def available_detectors() -> dict[str, Detector]:
-    registry: dict[str, Detector] = {"plumber": PlumberDetector()}
-    try:
-        entries = metadata.entry_points(group="tabbolt.detectors")
-    except Exception:  # pragma: no cover - Python <3.10 fallback
-        entries = []
-    for entry in entries:
-        name = entry.name
-        if name in registry:
-            continue
-        detector = entry.load()
-        if callable(detector):
-            detector = detector()
-        registry[name] = detector
-    return registry
-
-
-def get_detector(name: str) -> Detector:
-    if name in _CACHE:
-        return _CACHE[name]
-    registry = available_detectors()
-    if name not in registry:
+    return {name: factory() for name, factory in _factories().items()}
+
+
+def get_detector(name: str, *, per_thread: bool | None = None) -> Detector:
+    """Return the detector registered as ``name``.
+
+    One instance is shared by all callers, unless ``per_thread`` is true or,
+    when it is ``None``, the detector sets ``reentrant = False``: then each
+    thread gets an instance of its own, created on its first lookup.
+    """
+
+    detector = _CACHE.get(name)
+    if detector is None:
+        with _LOCK:
+            detector = _CACHE.get(name)
+            if detector is None:
+                detector = _CACHE[name] = _factory(name)()
+    if per_thread is None:
+        per_thread = not getattr(detector, "reentrant", True)
+    if not per_thread:
+        return detector
+    local: dict[str, Detector] | None = getattr(_LOCAL, "detectors", None)
+    if local is None:
+        local = _LOCAL.detectors = {}
+    if name not in local:
+        with _LOCK:
+            instance = _factory(name)()
+        if instance is detector:  # the entry point exports an instance
+            instance = copy.deepcopy(detector)
+        local[name] = instance
+    return local[name]
+
+
+def _factory(name: str) -> Callable[[], Detector]:
+    factories = _factories()
+    if name not in factories:
         raise KeyError(f"Unknown detector: {name}")
-    _CACHE[name] = registry[name]
-    return registry[name]
+    return factories[name]
+
+
+def _factories() -> dict[str, Callable[[], Detector]]:
+    """Load the entry points once; each factory builds a fresh detector."""
+
+    global _FACTORIES
+    if _FACTORIES is not None:
+        return _FACTORIES
+    with _LOCK:
+        if _FACTORIES is not None:
+            return _FACTORIES
+        factories: dict[str, Callable[[], Detector]] = {"plumber": PlumberDetector}
+        try:
+            entries = metadata.entry_points(group="tabbolt.detectors")
+        except Exception:  # pragma: no cover - Python <3.10 fallback
+            entries = []
+        for entry in entries:
+            name = entry.name
+            if name in factories:
+                continue
+            detector = entry.load()
+            factories[name] = detector if callable(detector) else _constant(detector)
+        _FACTORIES = factories
+        return factories
+
+
+def _constant(detector: Detector) -> Callable[[], Detector]:
+    return lambda: detector
 
 
 __all__ = ["available_detectors", "get_detector"]
@@ -1,12 +1,21 @@
 """Table resolution pipeline."""
-from .grid import build_grid, GridStructure, CandidateCell
+from .grid import assign_words, build_grid, GridStructure, CandidateCell
 from .merge import apply_merges
-from .stitch import stitch_tables
+from .rules import consolidate_rules
+from .stitch import iter_stitched, split_open_head, stitch_shards, stitch_tables
+from .templates import LayoutTemplate, TemplateCache
 
 __all__ = [
     "build_grid",
     "GridStructure",
     "CandidateCell",
+    "assign_words",
     "apply_merges",
+    "consolidate_rules",
     "stitch_tables",
+    "iter_stitched",
+    "split_open_head",
+    "stitch_shards",
+    "LayoutTemplate",
+    "TemplateCache",
 ]
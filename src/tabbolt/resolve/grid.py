@@ -2,10 +2,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Iterable
+from typing import Dict, Iterable, Optional
+
+import numpy as np
 
 from ..geometry import snap_values
 from ..models import BBox
+from .rules import consolidate_rules
 
 
 @dataclass
@@ -23,6 +26,8 @@ class GridStructure:
     vertical_boundaries: list[list[bool]]  # rows x (cols-1)
     horizontal_boundaries: list[list[bool]]  # (rows-1) x cols
     epsilon: float
+    # (rowspan, colspan) keyed by top-left slot, when the spans are known exactly
+    spans: Optional[Dict[tuple[int, int], tuple[int, int]]] = None
 
     @property
     def n_rows(self) -> int:
@@ -90,8 +95,29 @@ def build_grid(
     region_bbox: BBox,
     lines: Iterable[BBox],
     epsilon: float,
+    *,
+    mode: str = "auto",
 ) -> tuple[GridStructure, list[CandidateCell]]:
-    """Infer a grid from words and vector lines."""
+    """Infer a grid from words and vector lines.
+
+    ``mode`` selects how row and column edges are found. ``"words"`` snaps word
+    centres and checks line coverage per boundary; ``"lattice"`` builds the grid
+    from the intersections of the ruling lines (see
+    :func:`~tabbolt.resolve.lattice.build_lattice`). ``"auto"`` uses the lattice
+    when the rules form one around the region's words and its cells leave no
+    unruled columns or rows, and falls back to word snapping otherwise, as does
+    ``"lattice"`` when there is no lattice at all.
+    """
+
+    if mode not in {"auto", "words", "lattice"}:
+        raise ValueError(f"Unknown grid mode: {mode}")
+    rules = consolidate_rules(lines, epsilon)
+    if mode != "words":
+        from .lattice import build_lattice  # lattice builds on the types defined here
+
+        lattice = build_lattice(words, region_bbox, rules, epsilon, strict=mode == "auto")
+        if lattice is not None:
+            return lattice
 
     x0, y0, x1, y1 = region_bbox
     centers_y = [
@@ -108,7 +134,7 @@ def build_grid(
     row_edges = _centers_to_edges(row_centers, float(y0), float(y1))
     col_edges = _centers_to_edges(col_centers, float(x0), float(x1))
 
-    vertical_lines, horizontal_lines = _classify_lines(lines)
+    vertical_lines, horizontal_lines = _classify_lines(rules)
 
     vertical_boundaries: list[list[bool]] = []
     for row_idx in range(max(1, len(row_edges) - 1)):
@@ -144,6 +170,12 @@ def build_grid(
         epsilon=epsilon,
     )
 
+    return grid, _snap_words(grid, words)
+
+
+def _snap_words(grid: GridStructure, words: list[dict[str, float]]) -> list[CandidateCell]:
+    """Place ``words`` into a word-snapped grid by their snapped centres."""
+
     agg: Dict[tuple[int, int], dict[str, object]] = {}
     for word in words:
         wx0 = float(min(word["x0"], word["x1"]))
@@ -182,7 +214,88 @@ def build_grid(
             )
         )
 
-    return grid, candidate_cells
+    return candidate_cells
+
+
+def assign_words(grid: GridStructure, words: list[dict[str, float]]) -> list[CandidateCell]:
+    """Place ``words`` into a grid whose ``spans`` are known.
+
+    Each word goes to the cell containing its centre point. Words sharing a
+    cell are read line by line, left to right.
+    """
+
+    if grid.spans is None:
+        raise ValueError("assign_words needs a grid with known spans")
+    owner = np.zeros((grid.n_rows, grid.n_cols, 2), dtype=int)
+    for (row, col), (rowspan, colspan) in grid.spans.items():
+        owner[row : row + rowspan, col : col + colspan] = (row, col)
+    boxes = _word_boxes(words)
+    if not len(boxes):
+        return []
+    cx = (boxes[:, 0] + boxes[:, 2]) / 2.0
+    cy = (boxes[:, 1] + boxes[:, 3]) / 2.0
+    row_index = np.clip(np.searchsorted(grid.row_edges, cy) - 1, 0, grid.n_rows - 1)
+    col_index = np.clip(np.searchsorted(grid.col_edges, cx) - 1, 0, grid.n_cols - 1)
+    anchors = owner[row_index, col_index]
+    # group words by owning cell; one reduceat per bbox side covers every cell
+    keys = anchors[:, 0] * grid.n_cols + anchors[:, 1]
+    order = np.argsort(keys, kind="stable")
+    keys = keys[order]
+    starts = np.flatnonzero(np.concatenate([[True], keys[1:] != keys[:-1]]))
+    ordered_boxes = boxes[order]
+    bounds = np.stack(
+        [
+            np.minimum.reduceat(ordered_boxes[:, 0], starts),
+            np.minimum.reduceat(ordered_boxes[:, 1], starts),
+            np.maximum.reduceat(ordered_boxes[:, 2], starts),
+            np.maximum.reduceat(ordered_boxes[:, 3], starts),
+        ],
+        axis=1,
+    ).tolist()
+    cx_list, cy_list = cx.tolist(), cy.tolist()
+    order_list = order.tolist()
+    ends = [*starts[1:].tolist(), len(order_list)]
+
+    candidate_cells: list[CandidateCell] = []
+    for start, end, bbox in zip(starts.tolist(), ends, bounds):
+        members = order_list[start:end]
+        row, col = divmod(int(keys[start]), grid.n_cols)
+        if len(members) > 1:
+            members = _reading_order(members, cx_list, cy_list, grid.epsilon)
+        candidate_cells.append(
+            CandidateCell(
+                row=row,
+                col=col,
+                text=" ".join(str(words[i]["text"]) for i in members).strip(),
+                bbox=(bbox[0], bbox[1], bbox[2], bbox[3]),
+            )
+        )
+    return candidate_cells
+
+
+def _reading_order(members: list[int], cx: list[float], cy: list[float], epsilon: float) -> list[int]:
+    """Order words top to bottom by text line, then left to right."""
+
+    by_height = sorted(members, key=lambda i: cy[i])
+    line_of = {by_height[0]: 0}
+    for previous, current in zip(by_height, by_height[1:]):
+        line_of[current] = line_of[previous] + int(cy[current] - cy[previous] > epsilon)
+    return sorted(members, key=lambda i: (line_of[i], cx[i]))
+
+
+def _word_boxes(words: list[dict[str, float]]) -> np.ndarray:
+    if not words:
+        return np.empty((0, 4), dtype=float)
+    boxes = np.array([[w["x0"], w["top"], w["x1"], w["bottom"]] for w in words], dtype=float)
+    return np.stack(
+        [
+            np.minimum(boxes[:, 0], boxes[:, 2]),
+            np.minimum(boxes[:, 1], boxes[:, 3]),
+            np.maximum(boxes[:, 0], boxes[:, 2]),
+            np.maximum(boxes[:, 1], boxes[:, 3]),
+        ],
+        axis=1,
+    )
 
 
 def _locate_edge(edges: list[float], value: float, epsilon: float) -> int:
@@ -195,4 +308,4 @@ def _locate_edge(edges: list[float], value: float, epsilon: float) -> int:
     return max(0, min(len(edges) - 2, len(edges) // 2))
 
 
-__all__ = ["GridStructure", "CandidateCell", "build_grid"]
+__all__ = ["GridStructure", "CandidateCell", "assign_words", "build_grid"]
@@ -0,0 +1,206 @@
+"""Lattice grid resolution for fully ruled tables."""
+from __future__ import annotations
+
+from typing import Iterable
+
+import numpy as np
+
+from ..geometry import as_bbox_array, snap_values
+from ..models import BBox
+from .grid import CandidateCell, GridStructure, _word_boxes, assign_words
+
+LATTICE_COVERAGE = 0.9
+
+
+def build_lattice(
+    words: list[dict[str, float]],
+    region_bbox: BBox,
+    rules: Iterable[BBox],
+    epsilon: float,
+    *,
+    strict: bool = False,
+) -> tuple[GridStructure, list[CandidateCell]] | None:
+    """Build a grid from the intersections of consolidated ``rules``.
+
+    Rules are clipped to ``region_bbox``; a rule takes part in the lattice when
+    it crosses at least two perpendicular rules. Row and column edges are the
+    positions of those rules, cells are the minimal rectangles they enclose
+    (recorded in :attr:`GridStructure.spans`) and each word goes to the cell
+    containing its centre point. Returns ``None`` when the rules do not form a
+    lattice or fewer than ``LATTICE_COVERAGE`` of the words fall inside it.
+
+    With ``strict`` the lattice must also account for the layout of the
+    words: ``None`` is returned when a cell's words leave a vertical
+    whitespace gutter (an unruled column, e.g. a table with only an outer box
+    and a header rule) or when every cell of a lattice row holds the same
+    stack of text lines (unruled rows).
+    """
+
+    vertical, horizontal = _lattice_rules(rules, region_bbox, epsilon)
+    if len(vertical) < 2 or len(horizontal) < 2:
+        return None
+    row_edges = snap_values(((horizontal[:, 1] + horizontal[:, 3]) / 2.0).tolist(), epsilon)
+    col_edges = snap_values(((vertical[:, 0] + vertical[:, 2]) / 2.0).tolist(), epsilon)
+    if len(row_edges) < 2 or len(col_edges) < 2:
+        return None
+
+    boxes = _word_boxes(words)
+    if len(boxes):
+        cx = (boxes[:, 0] + boxes[:, 2]) / 2.0
+        cy = (boxes[:, 1] + boxes[:, 3]) / 2.0
+        inside = (
+            (cx >= col_edges[0] - epsilon)
+            & (cx <= col_edges[-1] + epsilon)
+            & (cy >= row_edges[0] - epsilon)
+            & (cy <= row_edges[-1] + epsilon)
+        )
+        if inside.mean() < LATTICE_COVERAGE:
+            return None
+
+    rows = np.asarray(row_edges)
+    cols = np.asarray(col_edges)
+    vertical_marks = _boundary_marks(vertical, cols[1:-1], rows, epsilon)
+    horizontal_marks = _boundary_marks(horizontal[:, [1, 0, 3, 2]], rows[1:-1], cols, epsilon)
+    grid = GridStructure(
+        row_edges=row_edges,
+        col_edges=col_edges,
+        vertical_boundaries=vertical_marks.tolist(),
+        horizontal_boundaries=horizontal_marks.T.tolist(),
+        epsilon=epsilon,
+    )
+    grid.spans = _minimal_rectangles(vertical_marks, horizontal_marks.T)
+    if strict and _unruled_divisions(grid, boxes, epsilon):
+        return None
+    return grid, assign_words(grid, words)
+
+
+def _unruled_divisions(grid: GridStructure, boxes: np.ndarray, epsilon: float) -> bool:
+    """Whether the words inside the lattice cells still form separate columns or rows."""
+
+    if not len(boxes):
+        return False
+    assert grid.spans is not None
+    owner = np.zeros((grid.n_rows, grid.n_cols), dtype=int)
+    for (row, col), (rowspan, colspan) in grid.spans.items():
+        owner[row : row + rowspan, col : col + colspan] = row * grid.n_cols + col
+    cx = (boxes[:, 0] + boxes[:, 2]) / 2.0
+    cy = (boxes[:, 1] + boxes[:, 3]) / 2.0
+    row_index = np.clip(np.searchsorted(grid.row_edges, cy) - 1, 0, grid.n_rows - 1)
+    col_index = np.clip(np.searchsorted(grid.col_edges, cx) - 1, 0, grid.n_cols - 1)
+    keys = owner[row_index, col_index]
+    gutter = max(float(np.median(boxes[:, 3] - boxes[:, 1])), 2.0 * epsilon)
+
+    # columns: a gap no word of the cell crosses; offsetting each cell by its
+    # key lets one running maximum cover every cell at once
+    stride = float(boxes[:, 2].max() - boxes[:, 0].min()) + 2.0 * gutter + 1.0
+    order = np.lexsort((boxes[:, 0], keys))
+    shift = keys[order] * stride
+    reach = np.maximum.accumulate(boxes[order, 2] + shift)
+    same_cell = keys[order][1:] == keys[order][:-1]
+    gaps = boxes[order[1:], 0] + shift[1:] - reach[:-1]
+    if (same_cell & (gaps > gutter)).any():
+        return True
+
+    # rows: every cell of a lattice row holding the same two or more lines
+    order = np.lexsort((cy, keys))
+    ordered_keys, ordered_cy = keys[order], cy[order]
+    new_cell = np.concatenate([[True], ordered_keys[1:] != ordered_keys[:-1]])
+    new_line = new_cell | np.concatenate([[True], np.diff(ordered_cy) > epsilon])
+    starts = np.flatnonzero(new_cell)
+    line_counts = np.add.reduceat(new_line.astype(int), starts)
+    ends = np.concatenate([starts[1:], [len(order)]]) - 1
+    cells: dict[int, list[tuple[int, float, float]]] = {}
+    for start, end, count in zip(starts.tolist(), ends.tolist(), line_counts.tolist()):
+        key = int(ordered_keys[start])
+        row, col = divmod(key, grid.n_cols)
+        if grid.spans[(row, col)][0] == 1:
+            cells.setdefault(row, []).append((count, float(ordered_cy[start]), float(ordered_cy[end])))
+    for stacks in cells.values():
+        count, first, last = stacks[0]
+        if len(stacks) >= 2 and count >= 2 and all(
+            other == count and abs(top - first) <= epsilon and abs(bottom - last) <= epsilon
+            for other, top, bottom in stacks[1:]
+        ):
+            return True
+    return False
+
+
+def _lattice_rules(
+    rules: Iterable[BBox], region_bbox: BBox, epsilon: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the vertical and horizontal rules that cross at least two others."""
+
+    boxes = as_bbox_array(rules).reshape(-1, 4)
+    x0, y0, x1, y1 = (float(v) for v in region_bbox)
+    boxes = np.stack(
+        [
+            np.maximum(boxes[:, 0], x0 - epsilon),
+            np.maximum(boxes[:, 1], y0 - epsilon),
+            np.minimum(boxes[:, 2], x1 + epsilon),
+            np.minimum(boxes[:, 3], y1 + epsilon),
+        ],
+        axis=1,
+    )
+    boxes = boxes[(boxes[:, 2] >= boxes[:, 0]) & (boxes[:, 3] >= boxes[:, 1])]
+    is_vertical = (boxes[:, 2] - boxes[:, 0]) <= (boxes[:, 3] - boxes[:, 1])
+    vertical, horizontal = boxes[is_vertical], boxes[~is_vertical]
+    vx = (vertical[:, 0] + vertical[:, 2]) / 2.0
+    hy = (horizontal[:, 1] + horizontal[:, 3]) / 2.0
+    # crosses[h, v]: horizontal rule h meets vertical rule v
+    crosses = (
+        (vx[None, :] >= horizontal[:, 0, None] - epsilon)
+        & (vx[None, :] <= horizontal[:, 2, None] + epsilon)
+        & (hy[:, None] >= vertical[None, :, 1] - epsilon)
+        & (hy[:, None] <= vertical[None, :, 3] + epsilon)
+    )
+    return vertical[crosses.sum(axis=0) >= 2], horizontal[crosses.sum(axis=1) >= 2]
+
+
+def _boundary_marks(
+    rules: np.ndarray, positions: np.ndarray, edges: np.ndarray, epsilon: float
+) -> np.ndarray:
+    """Mark which spans between ``edges`` are ruled at each boundary position.
+
+    ``rules`` are given as (position, start, position, end) boxes; the result
+    has one row per span and one column per position.
+    """
+
+    centers = (rules[:, 0] + rules[:, 2]) / 2.0
+    at_position = np.abs(centers[:, None] - positions[None, :]) <= epsilon
+    covers = (rules[:, 1, None] - epsilon <= edges[None, :-1]) & (
+        rules[:, 3, None] + epsilon >= edges[None, 1:]
+    )
+    return (covers.T.astype(int) @ at_position.astype(int)) > 0
+
+
+def _minimal_rectangles(
+    vertical_marks: np.ndarray, horizontal_marks: np.ndarray
+) -> dict[tuple[int, int], tuple[int, int]]:
+    """Group grid slots into the rectangles enclosed by ruled boundaries.
+
+    Returns the ``(rowspan, colspan)`` of every rectangle keyed by its top-left
+    slot.
+    """
+
+    n_rows = vertical_marks.shape[0]
+    n_cols = vertical_marks.shape[1] + 1
+    owner = np.full((n_rows, n_cols, 2), -1, dtype=int)
+    spans: dict[tuple[int, int], tuple[int, int]] = {}
+    for row in range(n_rows):
+        for col in range(n_cols):
+            if owner[row, col, 0] >= 0:
+                continue
+            col_end = col
+            while col_end + 1 < n_cols and not vertical_marks[row, col_end] and owner[row, col_end + 1, 0] < 0:
+                col_end += 1
+            row_end = row
+            while row_end + 1 < n_rows and not horizontal_marks[row_end, col : col_end + 1].any():
+                if (owner[row_end + 1, col : col_end + 1, 0] >= 0).any():
+                    break
+                row_end += 1
+            owner[row : row_end + 1, col : col_end + 1] = (row, col)
+            spans[(row, col)] = (row_end - row + 1, col_end - col + 1)
+    return spans
+
+
+__all__ = ["LATTICE_COVERAGE", "build_lattice"]
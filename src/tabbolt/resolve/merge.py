@@ -31,6 +31,8 @@ def apply_merges(
     candidate_map: Dict[tuple[int, int], CandidateCell] = {
         (cell.row, cell.col): cell for cell in candidates
     }
+    if grid.spans is not None:
+        return _known_spans(grid, candidate_map)
     has_vertical_lines = any(any(row) for row in grid.vertical_boundaries)
     has_horizontal_lines = any(any(row) for row in grid.horizontal_boundaries)
 
@@ -95,6 +97,31 @@ def apply_merges(
     return resolved
 
 
+def _known_spans(
+    grid: GridStructure,
+    candidate_map: Dict[tuple[int, int], CandidateCell],
+) -> list[Cell]:
+    resolved: list[Cell] = []
+    for (row, col), (rowspan, colspan) in sorted(grid.spans.items()):
+        candidate = candidate_map.get((row, col))
+        resolved.append(
+            Cell(
+                text=candidate.text if candidate else "",
+                bbox=(
+                    grid.col_edges[col],
+                    grid.row_edges[row],
+                    grid.col_edges[col + colspan],
+                    grid.row_edges[row + rowspan],
+                ),
+                row=row,
+                col=col,
+                rowspan=rowspan,
+                colspan=colspan,
+            )
+        )
+    return resolved
+
+
 def _expand_columns(
     grid: GridStructure,
     candidate_map: Dict[tuple[int, int], CandidateCell],
@@ -0,0 +1,78 @@
+"""Ruling-line consolidation."""
+from __future__ import annotations
+
+from typing import Iterable
+
+import numpy as np
+
+from ..geometry import as_bbox_array, normalize_bboxes
+from ..models import BBox
+
+
+def consolidate_rules(lines: Iterable[BBox], epsilon: float) -> list[BBox]:
+    """Merge ruling segments into maximal horizontal and vertical rules.
+
+    Boxes thicker than ``2 * epsilon`` in both directions are rect outlines
+    and contribute their four edges. Segments whose centre lines lie within
+    ``epsilon`` of each other are treated as collinear, and collinear segments
+    that overlap or leave gaps of at most ``epsilon`` are joined. Dashed or
+    tiled rules and per-cell rects thus collapse to one rule per grid line.
+    """
+
+    boxes = normalize_bboxes(as_bbox_array(lines))
+    if not len(boxes):
+        return []
+    tolerance = max(float(epsilon), 0.0)
+    widths = boxes[:, 2] - boxes[:, 0]
+    heights = boxes[:, 3] - boxes[:, 1]
+    outline = (widths > 2 * tolerance) & (heights > 2 * tolerance)
+    rects = boxes[outline]
+    x0, y0, x1, y1 = rects.T
+    segments = np.concatenate(
+        [
+            boxes[~outline],
+            np.stack([x0, y0, x1, y0], axis=1),
+            np.stack([x0, y1, x1, y1], axis=1),
+            np.stack([x0, y0, x0, y1], axis=1),
+            np.stack([x1, y0, x1, y1], axis=1),
+        ]
+    )
+    vertical = (segments[:, 2] - segments[:, 0]) <= (segments[:, 3] - segments[:, 1])
+    horizontal_rules = _merge_collinear(segments[~vertical], tolerance)
+    # vertical rules are horizontal rules with the axes swapped
+    vertical_rules = _merge_collinear(segments[vertical][:, [1, 0, 3, 2]], tolerance)[:, [1, 0, 3, 2]]
+    merged = np.concatenate([vertical_rules, horizontal_rules])
+    return [tuple(row) for row in merged.tolist()]
+
+
+def _merge_collinear(segments: np.ndarray, tolerance: float) -> np.ndarray:
+    """Merge horizontal ``segments``; returns one bbox per maximal rule."""
+
+    if not len(segments):
+        return np.empty((0, 4), dtype=float)
+    centers = (segments[:, 1] + segments[:, 3]) / 2.0
+    order = np.argsort(centers, kind="stable")
+    segments, centers = segments[order], centers[order]
+    # consecutive centre lines within tolerance share a track
+    track = np.concatenate([[0], np.cumsum(np.diff(centers) > tolerance)])
+    order = np.lexsort((segments[:, 0], track))
+    segments, track = segments[order], track[order]
+    # offset each track so a running maximum never leaks between tracks
+    span = float(segments[:, 2].max() - segments[:, 0].min()) + 2 * tolerance + 1.0
+    offset = track * span
+    reach = np.maximum.accumulate(segments[:, 2] + offset)
+    starts = np.ones(len(segments), dtype=bool)
+    starts[1:] = (track[1:] != track[:-1]) | (segments[1:, 0] + offset[1:] > reach[:-1] + tolerance)
+    runs = np.flatnonzero(starts)
+    return np.stack(
+        [
+            np.minimum.reduceat(segments[:, 0], runs),
+            np.minimum.reduceat(segments[:, 1], runs),
+            np.maximum.reduceat(segments[:, 2], runs),
+            np.maximum.reduceat(segments[:, 3], runs),
+        ],
+        axis=1,
+    )
+
+
+__all__ = ["consolidate_rules"]
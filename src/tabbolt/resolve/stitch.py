@@ -1,98 +1,338 @@
 """Table stitching utilities."""
 from __future__ import annotations
 
-from typing import Sequence
+from dataclasses import dataclass, field
+from math import log, log1p
+from typing import Any, Iterable, Iterator, Sequence
 
 from ..models import Cell, Table
 
 
-def stitch_tables(tables: Sequence[Table], aggressiveness: str = "med") -> list[Table]:
-    """Stitch tables that continue across pages."""
+def stitch_tables(
+    tables: Sequence[Table],
+    aggressiveness: str = "med",
+    *,
+    mode: str = "sequential",
+    lookback: int = 1,
+) -> list[Table]:
+    """Stitch tables that continue across pages.
 
+    Parameters
+    ----------
+    mode:
+        ``"sequential"`` joins each table only onto the one before it in page
+        order. ``"indexed"`` keeps every table that is still open in a hash
+        index keyed by column count, header and width bucket, so a table can
+        continue any open table even when other tables sit in between.
+    lookback:
+        For ``"indexed"`` mode, how many pages back an open table may end and
+        still be continued.
+    """
+
+    if mode not in {"sequential", "indexed"}:
+        raise ValueError(f"Unknown stitch mode: {mode}")
     if not tables:
         return []
-    tolerance = {
+    tolerance = _tolerance(aggressiveness)
+    builders: list[_StitchBuilder] = []
+    if mode == "indexed":
+        index = _OpenTableIndex(tolerance, lookback)
+        for table in _page_order(tables):
+            table.sort_cells()
+            sig = _signature(table)
+            page = min(table.page) if table.page else 0
+            match = index.match(sig, page)
+            if match is None:
+                builder = _StitchBuilder(table, sig)
+                builders.append(builder)
+                index.insert(builder)
+            else:
+                index.remove(match)
+                match.add(table, sig)
+                index.insert(match)
+        return [builder.build() for builder in builders]
+    return list(iter_stitched(_page_order(tables), aggressiveness=aggressiveness))
+
+
+def iter_stitched(tables: Iterable[Table], aggressiveness: str = "med") -> Iterator[Table]:
+    """Stitch ``tables`` sequentially, yielding each table once it is closed.
+
+    ``tables`` must already be in page order. A stitched table is yielded as
+    soon as the next table fails to continue it, so only one table is held
+    open at a time.
+    """
+
+    tolerance = _tolerance(aggressiveness)
+    current: _StitchBuilder | None = None
+    for table in tables:
+        table.sort_cells()
+        sig = _signature(table)
+        if current is not None and _should_join(current.signature, sig, tolerance):
+            current.add(table, sig)
+            continue
+        if current is not None:
+            yield current.build()
+        current = _StitchBuilder(table, sig)
+    if current is not None:
+        yield current.build()
+
+
+def split_open_head(
+    tables: Sequence[Table], aggressiveness: str = "med"
+) -> tuple[list[Table], list[Table]]:
+    """Stitch one shard of a document, keeping its open head unstitched.
+
+    Returns ``(head, closed)``. ``head`` holds the leading raw tables whose
+    stitching may change once the previous shard's tail is known: every table
+    up to the first one that can never join them (different column count or
+    header, or no width). ``closed`` holds the remaining tables stitched as
+    usual; its last table stays open for the next shard.
+    """
+
+    ordered = _page_order(tables)
+    if not ordered:
+        return [], []
+    first = _signature(ordered[0])
+    split = len(ordered)
+    for index in range(1, len(ordered)):
+        sig = _signature(ordered[index])
+        if (
+            sig.n_cols != first.n_cols
+            or not first.width
+            or not sig.width
+            or sig.header != first.header
+        ):
+            split = index
+            break
+    for table in ordered[:split]:
+        table.sort_cells()
+    return ordered[:split], stitch_tables(ordered[split:], aggressiveness=aggressiveness)
+
+
+def stitch_shards(
+    shards: Iterable[tuple[Sequence[Table], Sequence[Table]]], aggressiveness: str = "med"
+) -> list[Table]:
+    """Merge ``(head, closed)`` shard results in page order.
+
+    Each head is re-stitched onto the tail of the shards before it, which
+    reproduces :func:`stitch_tables` over the whole document.
+    """
+
+    tolerance = _tolerance(aggressiveness)
+    builders: list[_StitchBuilder] = []
+    for head, closed in shards:
+        for table in head:
+            _stitch_into(builders, table, tolerance)
+        builders.extend(_StitchBuilder(table) for table in closed)
+    return [builder.build() for builder in builders]
+
+
+def _tolerance(aggressiveness: str) -> float:
+    return {
         "low": 0.01,
         "med": 0.015,
         "high": 0.025,
     }.get(aggressiveness, 0.015)
 
-    ordered = sorted(tables, key=lambda t: (min(t.page) if t.page else 0, t.page))
-    stitched: list[Table] = []
-    for table in ordered:
-        table.sort_cells()
-        if not stitched:
-            stitched.append(table)
-            continue
-        prev = stitched[-1]
-        if _should_join(prev, table, tolerance):
-            stitched[-1] = _merge_tables(prev, table)
+
+def _page_order(tables: Sequence[Table]) -> list[Table]:
+    return sorted(tables, key=lambda t: (min(t.page) if t.page else 0, t.page))
+
+
+def _stitch_into(builders: list[_StitchBuilder], table: Table, tolerance: float) -> None:
+    table.sort_cells()
+    sig = _signature(table)
+    if builders and _should_join(builders[-1].signature, sig, tolerance):
+        builders[-1].add(table, sig)
+    else:
+        builders.append(_StitchBuilder(table, sig))
+
+
+@dataclass
+class _Signature:
+    """Join criteria of a table, computed in one pass over its cells."""
+
+    n_cols: int
+    header: tuple[str, ...]
+    x0: float = 0.0
+    x1: float = 0.0
+    has_cells: bool = False
+
+    @property
+    def width(self) -> float:
+        return self.x1 - self.x0 if self.has_cells else 0.0
+
+    def cover(self, cell: Cell) -> None:
+        if self.has_cells:
+            self.x0 = min(self.x0, cell.bbox[0])
+            self.x1 = max(self.x1, cell.bbox[2])
         else:
-            stitched.append(table)
-    return stitched
+            self.x0, self.x1 = cell.bbox[0], cell.bbox[2]
+            self.has_cells = True
 
 
-def _should_join(first: Table, second: Table, tolerance: float) -> bool:
+def _signature(table: Table) -> _Signature:
+    header_cells: list[Cell] = []
+    sig = _Signature(n_cols=table.n_cols, header=())
+    for cell in table.cells:
+        sig.cover(cell)
+        if cell.row == 0:
+            header_cells.append(cell)
+    header_cells.sort(key=lambda cell: cell.col)
+    sig.header = tuple(cell.text.strip() for cell in header_cells)
+    return sig
+
+
+def _should_join(first: _Signature, second: _Signature, tolerance: float) -> bool:
     if first.n_cols != second.n_cols:
         return False
-    width_a = _table_width(first)
-    width_b = _table_width(second)
+    width_a = first.width
+    width_b = second.width
     if not width_a or not width_b:
         return False
     width_diff = abs(width_a - width_b) / max(width_a, width_b)
     if width_diff > tolerance:
         return False
-    if _row_signature(first, 0) != _row_signature(second, 0):
+    if first.header != second.header:
         return False
     return True
 
 
-def _table_width(table: Table) -> float:
-    if not table.cells:
-        return 0.0
-    x0 = min(cell.bbox[0] for cell in table.cells)
-    x1 = max(cell.bbox[2] for cell in table.cells)
-    return x1 - x0
+@dataclass(eq=False)
+class _StitchBuilder:
+    """Accumulates the continuation pages of one stitched table.
 
+    Cells are appended as pages join and the :class:`Table` is materialized
+    once in :meth:`build`, so a long run costs time linear in its cells.
+    """
 
-def _row_signature(table: Table, row: int) -> tuple[str, ...]:
-    row_cells = [cell for cell in table.cells if cell.row == row]
-    if not row_cells:
-        return ()
-    row_cells.sort(key=lambda cell: cell.col)
-    return tuple(cell.text.strip() for cell in row_cells)
+    first: Table
+    _sig: _Signature | None = None
+    cells: list[Cell] = field(default_factory=list)
+    n_rows: int = 0
+    pages: set[int] = field(default_factory=set)
+    last_page: int = 0
+    metas: list[dict[str, Any]] = field(default_factory=list)
+    title: str | None = None
+    conf: float = 1.0
+    page_size: tuple[float, float] | None = None
 
+    def __post_init__(self) -> None:
+        self.n_rows = self.first.n_rows
+        self.title = self.first.title
+        self.conf = self.first.conf
+        self.page_size = self.first.page_size
+        self.last_page = max(self.first.page, default=0)
 
-def _merge_tables(first: Table, second: Table) -> Table:
-    drop_rows = 0
-    if _row_signature(first, 0) == _row_signature(second, 0):
-        drop_rows = 1
-    offset = first.n_rows
-    new_cells: list[Cell] = [cell for cell in first.cells]
-    for cell in second.cells:
-        if cell.row < drop_rows:
-            continue
-        updated = cell.model_copy(
-            update={
-                "row": cell.row - drop_rows + offset,
-            },
+    @property
+    def signature(self) -> _Signature:
+        if self._sig is None:
+            self._sig = _signature(self.first)
+        return self._sig
+
+    def add(self, table: Table, sig: _Signature) -> None:
+        if not self.metas:
+            self.cells = list(self.first.cells)
+            self.pages = set(self.first.page)
+            self.metas = [self.first.meta]
+        drop_rows = 1 if self.signature.header == sig.header else 0
+        offset = self.n_rows
+        for cell in table.cells:
+            if cell.row < drop_rows:
+                continue
+            updated = cell.model_copy(
+                update={
+                    "row": cell.row - drop_rows + offset,
+                },
+            )
+            self.cells.append(updated)
+            self.signature.cover(updated)
+        self.pages.update(table.page)
+        self.last_page = max(self.last_page, max(table.page, default=0))
+        self.metas.append(table.meta)
+        self.n_rows += table.n_rows - drop_rows
+        self.title = self.title or table.title
+        self.conf = min(self.conf, table.conf)
+        self.page_size = self.page_size or table.page_size
+
+    def build(self) -> Table:
+        if not self.metas:
+            return self.first
+        meta: dict[str, Any] = {}
+        for part_meta in self.metas:
+            meta = {**part_meta, **meta}
+        stitched = Table(
+            page=sorted(self.pages),
+            cells=self.cells,
+            n_rows=self.n_rows,
+            n_cols=self.first.n_cols,
+            title=self.title,
+            conf=self.conf,
+            meta=meta,
+            units=self.first.units,
+            page_size=self.page_size,
         )
-        new_cells.append(updated)
-    pages = sorted(set(first.page + second.page))
-    n_rows = first.n_rows + second.n_rows - drop_rows
-    stitched = Table(
-        page=pages,
-        cells=new_cells,
-        n_rows=n_rows,
-        n_cols=first.n_cols,
-        title=first.title or second.title,
-        conf=min(first.conf, second.conf),
-        meta={**second.meta, **first.meta},
-        units=first.units,
-        page_size=first.page_size or second.page_size,
-    )
-    stitched.sort_cells()
-    return stitched
-
-
-__all__ = ["stitch_tables"]
+        stitched.sort_cells()
+        return stitched
+
+
+class _OpenTableIndex:
+    """Hash index of open stitched tables for ``"indexed"`` stitching.
+
+    Keys are ``(n_cols, header, width bucket)``. Buckets are spaced so that
+    widths within ``tolerance`` of each other fall into the same or an adjacent
+    bucket, which bounds a lookup to three probes.
+    """
+
+    def __init__(self, tolerance: float, lookback: int) -> None:
+        self._tolerance = tolerance
+        self._lookback = max(1, lookback)
+        self._step = -log1p(-tolerance)
+        self._buckets: dict[tuple[int, tuple[str, ...], int], list[_StitchBuilder]] = {}
+        self._keys: dict[int, tuple[int, tuple[str, ...], int]] = {}
+
+    def _key(self, sig: _Signature) -> tuple[int, tuple[str, ...], int] | None:
+        if sig.width <= 0:
+            return None
+        return sig.n_cols, sig.header, int(log(sig.width) // self._step)
+
+    def insert(self, builder: _StitchBuilder) -> None:
+        key = self._key(builder.signature)
+        if key is None:
+            return
+        self._buckets.setdefault(key, []).append(builder)
+        self._keys[id(builder)] = key
+
+    def remove(self, builder: _StitchBuilder) -> None:
+        key = self._keys.pop(id(builder), None)
+        if key is not None:
+            self._buckets[key].remove(builder)
+
+    def match(self, sig: _Signature, page: int) -> _StitchBuilder | None:
+        """Return the open table ``sig`` continues, preferring horizontal alignment."""
+
+        key = self._key(sig)
+        if key is None:
+            return None
+        n_cols, header, bucket = key
+        best: _StitchBuilder | None = None
+        best_rank: tuple[float, int] | None = None
+        for probe in (bucket - 1, bucket, bucket + 1):
+            entries = self._buckets.get((n_cols, header, probe))
+            if not entries:
+                continue
+            for builder in list(entries):
+                if builder.last_page < page - self._lookback:
+                    self.remove(builder)
+                    continue
+                if builder.last_page >= page:
+                    continue
+                if not _should_join(builder.signature, sig, self._tolerance):
+                    continue
+                rank = (abs(builder.signature.x0 - sig.x0), -builder.last_page)
+                if best_rank is None or rank < best_rank:
+                    best, best_rank = builder, rank
+        return best
+
+
+__all__ = ["stitch_tables", "iter_stitched", "split_open_head", "stitch_shards"]
@@ -0,0 +1,299 @@
+"""Layout template cache for recurring table layouts.
+
+Documents from one source (invoices, statements, ...) usually repeat the same
+table layout. :class:`TemplateCache` fingerprints a region by its ruling
+lines and header row, remembers the resolved grid edges and span map, and on
+a confident match assigns the words straight into the known grid instead of
+snapping and checking boundaries again; merges are reused for ruled
+lattices and inferred again for word-snapped grids.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from ..geometry import as_bbox_array, snap_values
+from ..models import BBox, Cell
+from .grid import GridStructure, _snap_words, _word_boxes, assign_words, build_grid
+from .lattice import LATTICE_COVERAGE
+from .merge import apply_merges
+from .rules import consolidate_rules
+
+
+@dataclass
+class LayoutTemplate:
+    """Resolved grid of a layout; ``positions`` pins word-snapped grids.
+
+    Only lattice templates keep their ``spans``: merges in word-snapped grids
+    follow the word extents of each region and are inferred again on a hit.
+    """
+
+    row_edges: list[float]
+    col_edges: list[float]
+    vertical_boundaries: list[list[bool]]
+    horizontal_boundaries: list[list[bool]]
+    spans: Optional[list[tuple[int, int, int, int]]]  # (row, col, rowspan, colspan)
+    lattice: bool
+    positions: Optional[str] = None
+
+    @classmethod
+    def from_grid(cls, grid: GridStructure, cells: Iterable[Cell], positions: str) -> LayoutTemplate:
+        return cls(
+            row_edges=list(grid.row_edges),
+            col_edges=list(grid.col_edges),
+            vertical_boundaries=grid.vertical_boundaries,
+            horizontal_boundaries=grid.horizontal_boundaries,
+            spans=(
+                [(cell.row, cell.col, cell.rowspan, cell.colspan) for cell in cells]
+                if grid.spans is not None
+                else None
+            ),
+            lattice=grid.spans is not None,
+            positions=None if grid.spans is not None else positions,
+        )
+
+    def to_grid(self, epsilon: float, region_bbox: BBox | None = None) -> GridStructure:
+        """Rebuild the grid; word-snapped grids take their outer edges from ``region_bbox``."""
+
+        row_edges, col_edges = list(self.row_edges), list(self.col_edges)
+        if not self.lattice and region_bbox is not None:
+            col_edges[0], row_edges[0], col_edges[-1], row_edges[-1] = (float(v) for v in region_bbox)
+        return GridStructure(
+            row_edges=row_edges,
+            col_edges=col_edges,
+            vertical_boundaries=self.vertical_boundaries,
+            horizontal_boundaries=self.horizontal_boundaries,
+            epsilon=epsilon,
+            spans=(
+                {(row, col): (rowspan, colspan) for row, col, rowspan, colspan in self.spans}
+                if self.lattice and self.spans is not None
+                else None
+            ),
+        )
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, payload: str) -> LayoutTemplate:
+        data = json.loads(payload)
+        if data["spans"] is not None:
+            data["spans"] = [tuple(span) for span in data["spans"]]
+        return cls(**data)
+
+
+class TemplateCache:
+    """LRU cache of :class:`LayoutTemplate` objects, optionally backed by SQLite.
+
+    ``capacity`` templates are kept in memory. With ``path`` every template
+    is also written to a SQLite database that any number of processes may
+    share; lookups missing the memory cache fall through to it, and the
+    least recently used entries beyond ``max_entries`` are deleted.
+
+    Positions are compared after rounding to ``quantum`` points, so layouts
+    must line up to within about that distance to match.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] | None = None,
+        *,
+        capacity: int = 256,
+        max_entries: int = 10_000,
+        quantum: float = 2.0,
+    ) -> None:
+        self.path = Path(path) if path is not None else None
+        self.capacity = max(1, capacity)
+        self.max_entries = max_entries
+        self.quantum = quantum
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self._memory: OrderedDict[str, LayoutTemplate] = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+
+    @property
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "stores": self.stores,
+                "evictions": self.evictions,
+                "size": len(self._memory),
+            }
+
+    def fingerprint(self, words: list[dict[str, Any]], lines: Iterable[BBox], epsilon: float, mode: str) -> str:
+        """Hash the ruling-line layout and header row of a region."""
+
+        q = self._quantize
+        rules = sorted(tuple(q(v) for v in rule) for rule in consolidate_rules(lines, epsilon))
+        boxes = _word_boxes(words)
+        header: list[tuple[str, int, int]] = []
+        if len(boxes):
+            centers = (boxes[:, 1] + boxes[:, 3]) / 2.0
+            first_line = centers <= centers.min() + epsilon
+            header = sorted(
+                (str(words[i]["text"]), q(boxes[i, 0]), q(boxes[i, 2]))
+                for i in first_line.nonzero()[0].tolist()
+            )
+        payload = json.dumps([mode, rules, header], separators=(",", ":"))
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def resolve(
+        self,
+        words: list[dict[str, Any]],
+        region_bbox: BBox,
+        lines: Iterable[BBox],
+        epsilon: float,
+        *,
+        mode: str = "auto",
+    ) -> tuple[GridStructure, list[Cell], bool]:
+        """Resolve a region through the cache.
+
+        Returns the grid, the cells and whether a template was used. On a
+        miss the region goes through :func:`build_grid` and
+        :func:`apply_merges` and the result is stored as a new template.
+        """
+
+        lines = as_bbox_array(lines)
+        key = self.fingerprint(words, lines, epsilon, mode)
+        positions = self._positions(words, epsilon)
+        template = self._get(key)
+        if template is not None and self._confident(template, words, positions, epsilon):
+            grid = template.to_grid(epsilon, region_bbox)
+            with self._lock:
+                self.hits += 1
+            candidates = assign_words(grid, words) if grid.spans is not None else _snap_words(grid, words)
+            return grid, apply_merges(grid, candidates), True
+
+        grid, candidates = build_grid(words, region_bbox, lines, epsilon, mode=mode)
+        cells = apply_merges(grid, candidates)
+        with self._lock:
+            self.misses += 1
+        self._put(key, LayoutTemplate.from_grid(grid, cells, positions))
+        return grid, cells, False
+
+    def clear(self) -> None:
+        """Drop every template from memory and from the on-disk store."""
+
+        with self._lock:
+            self._memory.clear()
+            if self.path is not None:
+                db = self._connect()
+                with db:
+                    db.execute("DELETE FROM templates")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        # worker processes open their own connection and start with an empty LRU
+        state = self.__dict__.copy()
+        state.update(_memory=OrderedDict(), _lock=None, _db=None)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _confident(
+        self, template: LayoutTemplate, words: list[dict[str, Any]], positions: str, epsilon: float
+    ) -> bool:
+        if not template.lattice:
+            return template.positions == positions
+        boxes = _word_boxes(words)
+        if not len(boxes):
+            return True
+        cx = (boxes[:, 0] + boxes[:, 2]) / 2.0
+        cy = (boxes[:, 1] + boxes[:, 3]) / 2.0
+        inside = (
+            (cx >= template.col_edges[0] - epsilon)
+            & (cx <= template.col_edges[-1] + epsilon)
+            & (cy >= template.row_edges[0] - epsilon)
+            & (cy <= template.row_edges[-1] + epsilon)
+        )
+        return bool(inside.mean() >= LATTICE_COVERAGE)
+
+    def _positions(self, words: list[dict[str, Any]], epsilon: float) -> str:
+        """Quantized row and column centres, which fix a word-snapped grid."""
+
+        boxes = _word_boxes(words)
+        rows = snap_values(((boxes[:, 1] + boxes[:, 3]) / 2.0).tolist(), epsilon)
+        cols = snap_values(((boxes[:, 0] + boxes[:, 2]) / 2.0).tolist(), epsilon)
+        return json.dumps([[self._quantize(v) for v in rows], [self._quantize(v) for v in cols]])
+
+    def _quantize(self, value: float) -> int:
+        return int(round(float(value) / self.quantum))
+
+    def _get(self, key: str) -> LayoutTemplate | None:
+        with self._lock:
+            template = self._memory.get(key)
+            if template is not None:
+                self._memory.move_to_end(key)
+                return template
+            if self.path is None:
+                return None
+            db = self._connect()
+            row = db.execute("SELECT payload FROM templates WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            with db:
+                db.execute("UPDATE templates SET used = ? WHERE key = ?", (time.time(), key))
+            template = LayoutTemplate.from_json(row[0])
+            self._remember(key, template)
+            return template
+
+    def _put(self, key: str, template: LayoutTemplate) -> None:
+        with self._lock:
+            self.stores += 1
+            self._remember(key, template)
+            if self.path is None:
+                return
+            db = self._connect()
+            with db:
+                db.execute(
+                    "INSERT OR REPLACE INTO templates (key, payload, used) VALUES (?, ?, ?)",
+                    (key, template.to_json(), time.time()),
+                )
+                db.execute(
+                    "DELETE FROM templates WHERE key IN ("
+                    "SELECT key FROM templates ORDER BY used DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+
+    def _remember(self, key: str, template: LayoutTemplate) -> None:
+        self._memory[key] = template
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.capacity:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            assert self.path is not None
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(self.path, timeout=30.0, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS templates "
+                "(key TEXT PRIMARY KEY, payload TEXT NOT NULL, used REAL NOT NULL)"
+            )
+            self._db = db
+        return self._db
+
+
+__all__ = ["LayoutTemplate", "TemplateCache"]
@@ -0,0 +1,341 @@
+"""Local extraction daemon and its client.
+
+``tabbolt serve`` starts an HTTP server on localhost backed by a pool of
+worker processes. Every worker imports tabbolt and resolves its detectors
+once at startup, so requests skip interpreter start, imports and plugin
+discovery. ``POST /extract`` takes a PDF (or ``.tbz`` artifact) as the
+request body and extraction options as query parameters, and returns the
+:class:`~tabbolt.models.DocResult` JSON. ``GET /metrics`` reports queue depth,
+in-flight requests and latency histograms; ``GET /health`` answers ``ok``.
+Bodies larger than ``max_body`` bytes are rejected with 413, and a pool
+broken by a crashed worker is replaced so later requests are served again.
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Sequence
+
+from .api import extract
+from .models import DocResult
+
+DEFAULT_PORT = 8765
+DEFAULT_MAX_BODY = 256 * 1024 * 1024
+LATENCY_BOUNDS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_INT_OPTIONS = {"stitch_lookback"}
+_FLOAT_OPTIONS = {"prescreen", "epsilon", "crop_padding"}
+_STR_OPTIONS = {"detector", "stitch_aggressiveness", "stitch_mode", "grid_mode"}
+
+
+class LatencyHistogram:
+    """Cumulative latency histogram with fixed upper bounds in seconds."""
+
+    def __init__(self, bounds: Sequence[float] = LATENCY_BOUNDS) -> None:
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.total = 0.0
+
+    def observe(self, seconds: float) -> None:
+        for index, bound in enumerate(self.bounds):
+            if seconds <= bound:
+                self.counts[index] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.total += seconds
+
+    def snapshot(self) -> dict[str, Any]:
+        buckets: dict[str, int] = {}
+        running = 0
+        for bound, count in zip([*map(str, self.bounds), "+Inf"], self.counts):
+            running += count
+            buckets[bound] = running
+        return {"buckets": buckets, "count": running, "sum": round(self.total, 6)}
+
+
+class ServerMetrics:
+    """Thread-safe request counters and latency histograms."""
+
+    def __init__(self, workers: int) -> None:
+        self.workers = workers
+        self.queued = 0
+        self.in_flight = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.restarts = 0
+        self.queue_wait = LatencyHistogram()
+        self.service = LatencyHistogram()
+        self.latency = LatencyHistogram()
+        self._lock = threading.Lock()
+
+    def enqueue(self, max_queue: int) -> bool:
+        with self._lock:
+            if self.queued >= max_queue:
+                self.rejected += 1
+                return False
+            self.queued += 1
+            return True
+
+    def start(self, waited: float) -> None:
+        with self._lock:
+            self.queued -= 1
+            self.in_flight += 1
+            self.queue_wait.observe(waited)
+
+    def finish(self, service: float, total: float, *, ok: bool) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            if ok:
+                self.completed += 1
+            else:
+                self.failed += 1
+            self.service.observe(service)
+            self.latency.observe(total)
+
+    def restarted(self) -> None:
+        with self._lock:
+            self.restarts += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "queue_depth": self.queued,
+                "in_flight": self.in_flight,
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+                "pool_restarts": self.restarts,
+                "latency_seconds": self.latency.snapshot(),
+                "queue_wait_seconds": self.queue_wait.snapshot(),
+                "service_seconds": self.service.snapshot(),
+            }
+
+
+class ExtractionServer:
+    """HTTP front end over a pool of warm extraction worker processes.
+
+    At most ``workers`` requests run at once; up to ``max_queue`` more wait
+    for a free worker and anything beyond that is rejected with 503. Request
+    bodies over ``max_body`` bytes are rejected with 413.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = DEFAULT_PORT,
+        *,
+        workers: int | None = None,
+        max_queue: int = 64,
+        max_body: int = DEFAULT_MAX_BODY,
+        detectors: Sequence[str] = ("plumber",),
+    ) -> None:
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.max_queue = max_queue
+        self.max_body = max_body
+        self.detectors = tuple(detectors)
+        self.metrics = ServerMetrics(self.workers)
+        self._slots = threading.BoundedSemaphore(self.workers)
+        self._pool_lock = threading.Lock()
+        self._pool = self._new_pool()
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.app = self  # type: ignore[attr-defined]
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start_workers(self) -> None:
+        """Fork and warm every worker process before serving."""
+
+        for future in [self._pool.submit(os.getpid) for _ in range(self.workers)]:
+            future.result()
+
+    def serve_forever(self) -> None:
+        self.start_workers()
+        self._httpd.serve_forever()
+
+    def shutdown(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+    def extract(self, payload: bytes, options: dict[str, Any]) -> tuple[int, bytes]:
+        """Run one request through the pool; return the HTTP status and body."""
+
+        received = time.perf_counter()
+        if not self.metrics.enqueue(self.max_queue):
+            return 503, _error("queue full")
+        self._slots.acquire()
+        started = time.perf_counter()
+        self.metrics.start(started - received)
+        ok = False
+        pool = self._pool
+        try:
+            body = pool.submit(_extract_payload, payload, options).result()
+            ok = True
+            return 200, body.encode("utf-8")
+        except BrokenProcessPool as exc:
+            self._replace_pool(pool)
+            return 500, _error(f"{type(exc).__name__}: {exc}")
+        except Exception as exc:  # noqa: BLE001 - reported to the client
+            return 500, _error(f"{type(exc).__name__}: {exc}")
+        finally:
+            self._slots.release()
+            finished = time.perf_counter()
+            self.metrics.finish(finished - started, finished - received, ok=ok)
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.workers, initializer=_warm_worker, initargs=(self.detectors,)
+        )
+
+    def _replace_pool(self, broken: ProcessPoolExecutor) -> None:
+        # concurrent requests may all see the same broken pool; replace it once
+        with self._pool_lock:
+            if self._pool is not broken:
+                return
+            self._pool = self._new_pool()
+        self.metrics.restarted()
+        broken.shutdown(wait=False, cancel_futures=True)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "tabbolt"
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        path = urllib.parse.urlsplit(self.path).path
+        if path == "/health":
+            self._reply(200, b"ok", "text/plain")
+        elif path == "/metrics":
+            self._reply(200, json.dumps(self.server.app.metrics.snapshot()).encode("utf-8"))  # type: ignore[attr-defined]
+        else:
+            self._reply(404, _error("not found"))
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        parts = urllib.parse.urlsplit(self.path)
+        app = self.server.app  # type: ignore[attr-defined]
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            length = -1
+        if length < 0:
+            self.close_connection = True
+            self._reply(400, _error("invalid Content-Length"))
+            return
+        if length > app.max_body:
+            # the body is left unread, so the connection cannot be reused
+            self.close_connection = True
+            self._reply(413, _error(f"body exceeds {app.max_body} bytes"))
+            return
+        payload = self.rfile.read(length)
+        if parts.path != "/extract":
+            self._reply(404, _error("not found"))
+            return
+        try:
+            options = _parse_options(urllib.parse.parse_qs(parts.query))
+        except ValueError as exc:
+            self._reply(400, _error(str(exc)))
+            return
+        status, body = app.extract(payload, options)
+        self._reply(status, body)
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - signature from base
+        return
+
+    def _reply(self, status: int, body: bytes, content_type: str = "application/json") -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def extract_remote(
+    source: str | os.PathLike[str] | bytes,
+    server: str,
+    *,
+    timeout: float | None = None,
+    **options: Any,
+) -> DocResult:
+    """Extract ``source`` on a running ``tabbolt serve`` instance.
+
+    ``options`` are the keyword arguments of :func:`tabbolt.extract`
+    (``pages``, ``detector``, ``stitch_aggressiveness``, ...).
+    """
+
+    payload = source if isinstance(source, bytes) else Path(source).read_bytes()
+    query: dict[str, str] = {}
+    for name, value in options.items():
+        if value is None:
+            continue
+        query[name] = ",".join(str(int(p)) for p in value) if name == "pages" else str(value)
+    url = f"{server.rstrip('/')}/extract?{urllib.parse.urlencode(query)}"
+    request = urllib.request.Request(
+        url, data=payload, method="POST", headers={"Content-Type": "application/pdf"}
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return DocResult.model_validate_json(response.read())
+    except urllib.error.HTTPError as exc:
+        detail = exc.read().decode("utf-8", "replace")
+        raise RuntimeError(f"Server returned {exc.code}: {detail}") from exc
+
+
+def _parse_options(query: dict[str, list[str]]) -> dict[str, Any]:
+    options: dict[str, Any] = {}
+    for name, values in query.items():
+        value = values[-1]
+        if name == "pages":
+            options[name] = [int(p) for p in value.split(",") if p]
+        elif name in _INT_OPTIONS:
+            options[name] = int(value)
+        elif name in _FLOAT_OPTIONS:
+            options[name] = float(value)
+        elif name in _STR_OPTIONS:
+            options[name] = value
+        else:
+            raise ValueError(f"Unknown option: {name}")
+    return options
+
+
+def _warm_worker(detectors: tuple[str, ...]) -> None:
+    from . import export  # noqa: F401 - import pandas-backed exporters up front
+    from .plugins.entrypoints import get_detector
+
+    for name in detectors:
+        get_detector(name)
+
+
+def _extract_payload(payload: bytes, options: dict[str, Any]) -> str:
+    return extract(payload, **options).to_json()
+
+
+def _error(message: str) -> bytes:
+    return json.dumps({"error": message}).encode("utf-8")
+
+
+__all__ = [
+    "DEFAULT_MAX_BODY",
+    "DEFAULT_PORT",
+    "ExtractionServer",
+    "LatencyHistogram",
+    "ServerMetrics",
+    "extract_remote",
+]
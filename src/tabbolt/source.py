@@ -0,0 +1,134 @@
+"""PDF input sources.
+
+Extraction accepts filesystem paths as well as in-memory data: ``bytes``,
+``bytearray``, ``memoryview``, memory-mapped files and binary file objects.
+In-memory inputs are wrapped in a read-only view so the same buffer is shared
+by detection and resolution without copies or temporary files.
+"""
+from __future__ import annotations
+
+import io
+import mmap
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator, Union
+
+import pdfplumber
+
+from .artifact import ParsedDocument, is_parsed_artifact
+
+PDFSource = Union[
+    str, "os.PathLike[str]", bytes, bytearray, memoryview, mmap.mmap, BinaryIO, ParsedDocument
+]
+
+
+class BufferReader(io.RawIOBase):
+    """Seekable, read-only file object over a byte buffer.
+
+    The buffer is referenced through a ``memoryview``; reads copy only the
+    requested chunk.
+    """
+
+    def __init__(self, view: memoryview) -> None:
+        super().__init__()
+        self._view = view
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = len(self._view) + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if pos < 0:
+            raise ValueError(f"Negative seek position {pos}")
+        self._pos = pos
+        return pos
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:  # type: ignore[override]
+        start = min(self._pos, len(self._view))
+        size = min(len(buffer), len(self._view) - start)
+        buffer[:size] = self._view[start : start + size]
+        self._pos = start + size
+        return size
+
+
+def as_source(source: PDFSource) -> str | memoryview | BinaryIO | ParsedDocument:
+    """Normalize ``source`` so it can be opened repeatedly.
+
+    Paths become strings, buffers become a flat byte ``memoryview`` sharing
+    the caller's memory, and seekable file objects and parsed documents are
+    returned unchanged. Non-seekable streams are read once into memory.
+    """
+
+    if isinstance(source, ParsedDocument):
+        return source
+    if isinstance(source, memoryview):
+        return source if source.format == "B" and source.ndim == 1 else source.cast("B")
+    if isinstance(source, (str, os.PathLike)):
+        return str(Path(source))
+    if isinstance(source, (bytes, bytearray, mmap.mmap)):
+        return memoryview(source)
+    if isinstance(source, io.BytesIO):
+        return source.getbuffer()
+    if hasattr(source, "read"):
+        if hasattr(source, "seekable") and source.seekable():
+            return source
+        return memoryview(source.read())
+    raise TypeError(f"Unsupported PDF source: {type(source).__name__}")
+
+
+@contextmanager
+def shared_source(
+    source: PDFSource,
+) -> Iterator[str | memoryview | BinaryIO | ParsedDocument]:
+    """Normalize ``source`` for the duration of a block.
+
+    Views created here are released on exit so memory-mapped inputs can be
+    closed by the caller afterwards.
+    """
+
+    normalized = as_source(source)
+    try:
+        yield normalized
+    finally:
+        if isinstance(normalized, memoryview) and normalized is not source:
+            normalized.release()
+
+
+def open_pdf(source: PDFSource) -> Any:
+    """Open ``source`` with pdfplumber, or as a parse artifact.
+
+    Sources holding a ``.tbz`` parse artifact open as a
+    :class:`~tabbolt.artifact.ParsedDocument`, which offers the same
+    ``pages`` interface. Caller-owned file objects, buffers and parsed
+    documents are not closed with the document.
+    """
+
+    normalized = as_source(source)
+    if isinstance(normalized, ParsedDocument):
+        return normalized.borrow()
+    if is_parsed_artifact(normalized):
+        return ParsedDocument.open(normalized)
+    if isinstance(normalized, str):
+        return pdfplumber.open(normalized)
+    if isinstance(normalized, memoryview):
+        return pdfplumber.open(BufferReader(normalized))
+    normalized.seek(0)
+    return pdfplumber.open(normalized)
+
+
+__all__ = ["PDFSource", "BufferReader", "as_source", "shared_source", "open_pdf"]
@@ -0,0 +1,203 @@
+"""Detector comparison and parameter sweeps over a shared parse.
+
+Each source is parsed once into an in-memory parse artifact (see
+:mod:`tabbolt.artifact`); every configuration then runs :func:`tabbolt.extract`
+against that artifact, so the cost of a sweep is one parse plus the detection
+and resolution work of each configuration.
+"""
+from __future__ import annotations
+
+import io
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import product
+from typing import Iterable, Sequence
+
+from .api import extract, parse
+from .artifact import ParsedDocument, is_parsed_artifact
+from .models import DocResult, Table
+from .source import PDFSource, as_source
+
+
+@dataclass(frozen=True)
+class SweepConfig:
+    """One point of a sweep: detector, stitch level and snapping override."""
+
+    detector: str = "plumber"
+    stitch_aggressiveness: str = "med"
+    epsilon: float | None = None
+
+    @property
+    def label(self) -> str:
+        epsilon = "auto" if self.epsilon is None else f"{self.epsilon:g}"
+        return f"{self.detector}/{self.stitch_aggressiveness}/eps={epsilon}"
+
+
+@dataclass
+class SweepRun:
+    """Result of one configuration on one source.
+
+    ``diffs`` lists the structural differences from the baseline run (the
+    first configuration) on the same source; it is empty for the baseline.
+    """
+
+    config: SweepConfig
+    source: str
+    result: DocResult
+    seconds: float
+    diffs: list[str] = field(default_factory=list)
+
+
+@dataclass
+class SweepReport:
+    """All runs of a sweep plus the one-off parse time per source."""
+
+    runs: list[SweepRun]
+    parse_seconds: dict[str, float]
+
+    def for_config(self, config: SweepConfig) -> list[SweepRun]:
+        return [run for run in self.runs if run.config == config]
+
+
+def config_matrix(
+    detectors: Iterable[str] = ("plumber",),
+    stitch_levels: Iterable[str] = ("med",),
+    epsilons: Iterable[float | None] = (None,),
+) -> list[SweepConfig]:
+    """Return the cross product of the given settings as configurations."""
+
+    return [
+        SweepConfig(detector=detector, stitch_aggressiveness=level, epsilon=epsilon)
+        for detector, level, epsilon in product(detectors, stitch_levels, epsilons)
+    ]
+
+
+def sweep(
+    sources: Sequence[PDFSource],
+    configs: Sequence[SweepConfig],
+    *,
+    pages: Sequence[int] | None = None,
+    workers: int | None = None,
+) -> SweepReport:
+    """Run every configuration in ``configs`` on every source.
+
+    Sources are parsed once up front. Runs execute on a thread pool of
+    ``workers`` threads (default: one per CPU, capped by the number of runs).
+    Runs on one source share its memory-mapped arrays and the per-page char,
+    word and line dicts built from them, so each page's dicts are built once
+    per sweep rather than once per run. ``seconds`` is the wall time of each
+    run, so it includes contention with concurrent runs.
+    """
+
+    if not configs:
+        raise ValueError("At least one configuration is required")
+    labels = [_source_label(source, index) for index, source in enumerate(sources)]
+    docs: list[ParsedDocument] = []
+    parse_seconds: dict[str, float] = {}
+    try:
+        for label, source in zip(labels, sources):
+            start = time.perf_counter()
+            docs.append(_parsed(source, pages))
+            parse_seconds[label] = time.perf_counter() - start
+        jobs = [(doc_index, config) for doc_index in range(len(docs)) for config in configs]
+        max_workers = workers or min(len(jobs), os.cpu_count() or 1) or 1
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results = list(
+                pool.map(lambda job: _timed_extract(docs[job[0]], job[1], pages), jobs)
+            )
+    finally:
+        for doc in docs:
+            doc.close()
+
+    runs: list[SweepRun] = []
+    baselines: dict[int, DocResult] = {}
+    for (doc_index, config), (result, seconds) in zip(jobs, results):
+        baseline = baselines.setdefault(doc_index, result)
+        runs.append(
+            SweepRun(
+                config=config,
+                source=labels[doc_index],
+                result=result,
+                seconds=seconds,
+                diffs=[] if baseline is result else diff_results(baseline, result),
+            )
+        )
+    return SweepReport(runs=runs, parse_seconds=parse_seconds)
+
+
+def diff_results(expected: DocResult, actual: DocResult) -> list[str]:
+    """Describe the structural differences between two results.
+
+    Tables are compared in order: page spans, shapes and cell texts.
+    """
+
+    diffs: list[str] = []
+    if len(expected.tables) != len(actual.tables):
+        diffs.append(f"tables: {len(expected.tables)} -> {len(actual.tables)}")
+    for index, (left, right) in enumerate(zip(expected.tables, actual.tables), start=1):
+        diffs.extend(f"table {index}: {diff}" for diff in diff_tables(left, right))
+    return diffs
+
+
+def diff_tables(expected: Table, actual: Table) -> list[str]:
+    """Describe the structural differences between two tables."""
+
+    diffs: list[str] = []
+    if expected.page != actual.page:
+        diffs.append(f"pages {expected.page} -> {actual.page}")
+    if (expected.n_rows, expected.n_cols) != (actual.n_rows, actual.n_cols):
+        diffs.append(
+            f"shape {expected.n_rows}x{expected.n_cols} -> {actual.n_rows}x{actual.n_cols}"
+        )
+    left = {(cell.row, cell.col): (cell.text, cell.rowspan, cell.colspan) for cell in expected.cells}
+    right = {(cell.row, cell.col): (cell.text, cell.rowspan, cell.colspan) for cell in actual.cells}
+    changed = sum(1 for key in left.keys() & right.keys() if left[key] != right[key])
+    missing = len(left.keys() - right.keys())
+    added = len(right.keys() - left.keys())
+    if changed or missing or added:
+        diffs.append(f"cells changed={changed} removed={missing} added={added}")
+    return diffs
+
+
+def _parsed(source: PDFSource, pages: Sequence[int] | None) -> ParsedDocument:
+    normalized = as_source(source)
+    if isinstance(normalized, ParsedDocument):
+        return normalized.borrow()
+    if is_parsed_artifact(normalized):
+        return ParsedDocument.open(normalized)
+    buffer = io.BytesIO()
+    parse(normalized, buffer, pages=pages)
+    return ParsedDocument.open(buffer.getvalue())
+
+
+def _timed_extract(
+    doc: ParsedDocument, config: SweepConfig, pages: Sequence[int] | None
+) -> tuple[DocResult, float]:
+    start = time.perf_counter()
+    result = extract(
+        doc,
+        pages=pages,
+        detector=config.detector,
+        stitch_aggressiveness=config.stitch_aggressiveness,
+        epsilon=config.epsilon,
+    )
+    return result, time.perf_counter() - start
+
+
+def _source_label(source: PDFSource, index: int) -> str:
+    if isinstance(source, (str, os.PathLike)):
+        return str(source)
+    return f"<source {index + 1}>"
+
+
+__all__ = [
+    "SweepConfig",
+    "SweepRun",
+    "SweepReport",
+    "config_matrix",
+    "sweep",
+    "diff_results",
+    "diff_tables",
+]
@@ -0,0 +1,377 @@
+"""Compact binary encoding of extraction results.
+
+:func:`encode_result` stores a :class:`~tabbolt.models.DocResult` column-wise:
+the cells of every table share one ``float64`` bbox array, one ``int32``
+array of ``row, col, rowspan, colspan``, one ``conf`` array and a single
+UTF-8 text blob with per-cell code point offsets. Table attributes, stats
+and warnings go into the JSON header. The layout is the parse artifact one
+(``MAGIC``, ``uint64`` header length, JSON header, 64-byte aligned arrays),
+so the payload can be sent over a pipe, placed in shared memory or mapped
+from disk and read without copying the arrays. :func:`load_result` maps a
+saved result and, with ``lazy=True``, decodes each table only when it is
+accessed.
+
+Decoding validates every model by default. Pass ``trusted=True`` for data
+this process or a sibling worker produced to build the models without
+validation.
+"""
+from __future__ import annotations
+
+import gc
+import io
+import mmap
+import os
+import warnings
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import Any, BinaryIO, Iterator, Sequence, TypeVar, overload
+
+import numpy as np
+from pydantic import BaseModel
+
+from .artifact import _array_view, _read_header, _write_arrays
+from .models import Cell, DocResult, Table
+
+MAGIC = b"TBR1"
+VERSION = 1
+_new = object.__new__
+_set = object.__setattr__
+_Model = TypeVar("_Model", bound=BaseModel)
+_TABLE_FIELDS = ("page", "n_rows", "n_cols", "title", "conf", "meta", "units", "page_size")
+
+
+def encode_result(result: DocResult) -> bytes:
+    """Encode ``result`` into the binary wire format."""
+
+    out = io.BytesIO()
+    save_result(result, out)
+    return out.getvalue()
+
+
+def save_result(result: DocResult, out: str | os.PathLike[str] | BinaryIO) -> None:
+    """Write the encoded ``result`` to a path or binary file object."""
+
+    arrays, tables = _pack_tables(result.tables)
+    meta = {"version": VERSION, "tables": tables, "stats": result.stats, "warnings": result.warnings}
+    _write_arrays(out, arrays, meta, magic=MAGIC)
+
+
+def load_result(
+    path: str | os.PathLike[str], *, lazy: bool = False, trusted: bool = False
+) -> DocResult | LazyDocResult:
+    """Read a result written by :func:`save_result`.
+
+    The file is memory mapped. With ``lazy=True`` a :class:`LazyDocResult`
+    is returned that decodes each table on first access; otherwise every
+    table is decoded up front and the mapping closed again.
+    """
+
+    lazy_result = LazyDocResult.open(path, trusted=trusted)
+    if lazy:
+        return lazy_result
+    with lazy_result:
+        return lazy_result.materialize()
+
+
+def decode_result(data: bytes | bytearray | memoryview, *, trusted: bool = False) -> DocResult:
+    """Decode a payload written by :func:`encode_result`.
+
+    The arrays are read in place from ``data``; the returned models hold no
+    reference to it.
+    """
+
+    return LazyDocResult(ResultReader(memoryview(data)), trusted=trusted).materialize()
+
+
+def share_result(result: DocResult) -> str:
+    """Copy the encoded ``result`` into a new shared memory block and return its name.
+
+    The block outlives this call; the receiving process frees it with
+    :func:`collect_result`.
+    """
+
+    payload = encode_result(result)
+    block = shared_memory.SharedMemory(create=True, size=max(len(payload), 1))
+    try:
+        block.buf[: len(payload)] = payload
+        return block.name
+    finally:
+        block.close()
+
+
+def collect_result(name: str, *, trusted: bool = False, unlink: bool = True) -> DocResult:
+    """Decode the result stored by :func:`share_result` under ``name``.
+
+    The block is unlinked afterwards unless ``unlink`` is false.
+    """
+
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        buffer = block.buf
+        try:
+            return decode_result(buffer, trusted=trusted)
+        finally:
+            buffer.release()
+    finally:
+        block.close()
+        if unlink:
+            block.unlink()
+
+
+class LazyDocResult:
+    """A stored result whose tables are decoded on access.
+
+    ``tables`` is a read-only sequence; each :class:`~tabbolt.models.Table`
+    is built the first time it is indexed or iterated and then cached.
+    ``stats`` and ``warnings`` are read eagerly. Call :meth:`close` (or use
+    the result as a context manager) to release the mapping.
+    """
+
+    def __init__(
+        self, reader: ResultReader, *, trusted: bool = False, mapping: mmap.mmap | None = None
+    ) -> None:
+        self._reader = reader
+        self._mapping = mapping
+        self.trusted = trusted
+        self.stats = reader.stats
+        self.warnings = reader.warnings
+        self.tables = LazyTables(reader, trusted)
+
+    @classmethod
+    def open(cls, path: str | os.PathLike[str], *, trusted: bool = False) -> LazyDocResult:
+        with open(path, "rb") as handle:
+            mapping = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        buffer = memoryview(mapping)
+        try:
+            reader = ResultReader(buffer)
+        except Exception:
+            buffer.release()
+            mapping.close()
+            raise
+        return cls(reader, trusted=trusted, mapping=mapping)
+
+    def materialize(self) -> DocResult:
+        """Decode the remaining tables and return a regular :class:`DocResult`."""
+
+        with _gc_paused():
+            values = {"tables": list(self.tables), "stats": self.stats, "warnings": self.warnings}
+            if self.trusted:
+                return _construct(DocResult, values)
+            return DocResult.model_validate(values)
+
+    def as_matrices(self, *, fill: str | Any = "") -> list[list[list[Any]]]:
+        return [table.as_matrix(fill=fill) for table in self.tables]
+
+    def close(self) -> None:
+        if self._mapping is not None:
+            mapping, self._mapping = self._mapping, None
+            try:
+                self._reader.release()
+                mapping.close()
+            except BufferError:
+                warnings.warn(
+                    "Result arrays are still referenced; the file stays mapped until they "
+                    "are released",
+                    ResourceWarning,
+                    stacklevel=2,
+                )
+
+    def __enter__(self) -> LazyDocResult:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+class LazyTables(Sequence[Table]):
+    """Read-only sequence of tables decoded on first access."""
+
+    def __init__(self, reader: ResultReader, trusted: bool) -> None:
+        self._reader = reader
+        self._trusted = trusted
+        self._cache: list[Table | None] = [None] * len(reader)
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    @overload
+    def __getitem__(self, index: int) -> Table: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Table]: ...
+
+    def __getitem__(self, index: int | slice) -> Table | list[Table]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        table = self._cache[index]
+        if table is None:
+            table = self._cache[index] = self._reader.table(index, trusted=self._trusted)
+        return table
+
+    def __iter__(self) -> Iterator[Table]:
+        for index in range(len(self)):
+            yield self[index]
+
+
+class ResultReader:
+    """Random access to the tables of an encoded result.
+
+    Each :meth:`table` call decodes only that table's cells and text.
+    """
+
+    def __init__(self, buffer: memoryview) -> None:
+        header, data_offset = _read_header(buffer, MAGIC, "Not a tabbolt result payload")
+        if header.get("version") != VERSION:
+            raise ValueError(f"Unsupported result payload version: {header.get('version')}")
+        self.stats: dict[str, Any] = header["stats"]
+        self.warnings: list[str] = header["warnings"]
+        self._tables: list[dict[str, Any]] = header["tables"]
+        self._buffer = buffer
+        self._arrays = {
+            name: _array_view(buffer, spec, data_offset) for name, spec in header["arrays"].items()
+        }
+
+    def release(self) -> None:
+        """Drop the array views so the underlying buffer can be closed."""
+
+        self._arrays = {}
+        self._buffer.release()
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def table(self, index: int, *, trusted: bool = False) -> Table:
+        with _gc_paused():
+            return self._table(index, trusted)
+
+    def _table(self, index: int, trusted: bool) -> Table:
+        entry = self._tables[index]
+        start, stop = entry["cells"]
+        arrays = self._arrays
+        text = arrays["text_blob"][entry["bytes"][0] : entry["bytes"][1]].tobytes().decode("utf-8")
+        bounds = (arrays["text_offsets"][start : stop + 1] - entry["chars"]).tolist()
+        bboxes = arrays["cell_bbox"][start:stop].tolist()
+        grid = arrays["cell_grid"][start:stop].tolist()
+        confs = arrays["cell_conf"][start:stop].tolist()
+        fields = {name: entry[name] for name in _TABLE_FIELDS}
+        if fields["page_size"] is not None:
+            fields["page_size"] = tuple(fields["page_size"])
+        if not trusted:
+            cells = [
+                {
+                    "text": text[a:b],
+                    "bbox": bbox,
+                    "row": row,
+                    "col": col,
+                    "rowspan": rowspan,
+                    "colspan": colspan,
+                    "conf": conf,
+                }
+                for a, b, bbox, (row, col, rowspan, colspan), conf in zip(
+                    bounds, bounds[1:], bboxes, grid, confs
+                )
+            ]
+            return Table.model_validate({**fields, "cells": cells})
+        cells = [
+            _construct(
+                Cell,
+                {
+                    "text": text[a:b],
+                    "bbox": tuple(bbox),
+                    "row": row,
+                    "col": col,
+                    "rowspan": rowspan,
+                    "colspan": colspan,
+                    "conf": conf,
+                },
+            )
+            for a, b, bbox, (row, col, rowspan, colspan), conf in zip(
+                bounds, bounds[1:], bboxes, grid, confs
+            )
+        ]
+        fields["cells"] = cells
+        # serialization follows ``__dict__`` order, so keep the declared field order
+        return _construct(Table, {name: fields[name] for name in Table.model_fields})
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Hold off the cyclic GC while building many models.
+
+    Every few hundred allocations would otherwise trigger a collection that
+    walks all the cells built so far; decoding creates no cycles to collect.
+    """
+
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _construct(cls: type[_Model], values: dict[str, Any]) -> _Model:
+    """Build a model from a complete field dict without validation.
+
+    Does what ``model_construct`` does for models without defaults to fill,
+    extras or private attributes, at a third of its cost per instance.
+    """
+
+    model = _new(cls)
+    _set(model, "__dict__", values)
+    _set(model, "__pydantic_fields_set__", set(values))
+    _set(model, "__pydantic_extra__", None)
+    _set(model, "__pydantic_private__", None)
+    return model
+
+
+def _pack_tables(tables: list[Table]) -> tuple[dict[str, np.ndarray], list[dict[str, Any]]]:
+    cells = [cell for table in tables for cell in table.cells]
+    texts = [cell.text for cell in cells]
+    lengths = np.fromiter((len(text) for text in texts), dtype=np.int64, count=len(texts))
+    offsets = np.zeros(len(texts) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+
+    entries: list[dict[str, Any]] = []
+    chunks: list[bytes] = []
+    start = byte_start = 0
+    for table in tables:
+        stop = start + len(table.cells)
+        chunk = "".join(texts[start:stop]).encode("utf-8")
+        chunks.append(chunk)
+        entry = {name: getattr(table, name) for name in _TABLE_FIELDS}
+        entry.update(
+            cells=[start, stop],
+            bytes=[byte_start, byte_start + len(chunk)],
+            chars=int(offsets[start]),
+        )
+        entries.append(entry)
+        start, byte_start = stop, byte_start + len(chunk)
+
+    arrays = {
+        "cell_bbox": np.array([cell.bbox for cell in cells], dtype=np.float64).reshape(-1, 4),
+        "cell_grid": np.array(
+            [(cell.row, cell.col, cell.rowspan, cell.colspan) for cell in cells], dtype=np.int32
+        ).reshape(-1, 4),
+        "cell_conf": np.fromiter((cell.conf for cell in cells), dtype=np.float64, count=len(cells)),
+        "text_offsets": offsets,
+        "text_blob": np.frombuffer(b"".join(chunks), dtype=np.uint8),
+    }
+    return arrays, entries
+
+
+__all__ = [
+    "MAGIC",
+    "LazyDocResult",
+    "LazyTables",
+    "ResultReader",
+    "collect_result",
+    "decode_result",
+    "encode_result",
+    "load_result",
+    "save_result",
+    "share_result",
+]
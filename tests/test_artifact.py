@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import io
+
+import pdfplumber
+import pytest
+
+from tabbolt import extract, parse
+from tabbolt.artifact import ParsedDocument
+from tabbolt.debug import render_overlay
+
+from .utils_pdf import build_table, write_pdf
+
+
+def test_artifact_extract_matches_pdf(tmp_path):
+    data = [["Item", "Qty"], ["Apples", "3"], ["Pears", "5"]]
+    pdf_path = write_pdf(tmp_path / "artifact.pdf", [build_table(data), build_table(data)])
+    tbz_path = tmp_path / "artifact.tbz"
+    parse(pdf_path, tbz_path)
+
+    expected = extract(pdf_path).to_json()
+    assert extract(tbz_path).to_json() == expected
+    assert extract(tbz_path.read_bytes()).to_json() == expected
+    with ParsedDocument.open(tbz_path) as doc:
+        assert extract(doc).to_json() == expected
+        assert extract(doc, pages=[2]).to_json() == extract(pdf_path, pages=[2]).to_json()
+        result = extract(doc)
+        overlay = render_overlay(result.tables[0], epsilon=0.0, detector="plumber", parsed=doc)
+        assert "rgba(0, 0, 0, 0.25)" in overlay
+
+
+def test_artifact_round_trips_page_content(tmp_path):
+    pdf_path = write_pdf(tmp_path / "content.pdf", [build_table([["A", "B"], ["1", "2"]])])
+    buffer = io.BytesIO()
+    parse(pdf_path, buffer)
+
+    doc = ParsedDocument.open(buffer.getvalue())
+    page = doc.pages[0]
+    with pdfplumber.open(pdf_path) as pdf:
+        original = pdf.pages[0]
+        assert [c["text"] for c in page.chars] == [c["text"] for c in original.chars]
+        assert [w["text"] for w in page.extract_words()] == [
+            w["text"] for w in original.extract_words(extra_attrs=["size"], x_tolerance=3, y_tolerance=3)
+        ]
+        assert len(page.lines) == len(original.lines)
+        assert (page.width, page.height) == (original.width, original.height)
+        assert [c["doctop"] for c in page.chars] == pytest.approx([c["doctop"] for c in original.chars])
+    with pytest.raises(AttributeError, match="within_bbox.*open the PDF"):
+        page.within_bbox((0, 0, 10, 10))
+
+
+def test_mapping_closes_with_last_view(tmp_path):
+    pdf_path = write_pdf(tmp_path / "views.pdf", [build_table([["A", "B"], ["1", "2"]])])
+    tbz_path = tmp_path / "views.tbz"
+    parse(pdf_path, tbz_path)
+
+    doc = ParsedDocument.open(tbz_path)
+    mapping = doc._holders._mapping
+    view = doc.borrow()
+    doc.close()
+    assert not mapping.closed
+    assert [c["text"] for c in view.pages[0].chars]
+    view.close()
+    assert mapping.closed
+
+    doc = ParsedDocument.open(tbz_path)
+    boxes = doc.pages[0].char_boxes
+    with pytest.warns(ResourceWarning, match="still referenced"):
+        doc.close()
+    assert boxes.shape[1] == 5
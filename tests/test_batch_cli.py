@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from tabbolt.cli import _extract_document, _ExtractSettings, main
+from tabbolt.export.writer import TableWriter
+from tabbolt.manifest import JobManifest
+
+from .utils_pdf import build_table, write_pdf
+
+
+def test_directory_input_resumes_from_manifest(tmp_path):
+    docs = tmp_path / "docs"
+    (docs / "sub").mkdir(parents=True)
+    data = [["Item", "Qty"], ["Apples", "3"]]
+    write_pdf(docs / "a.pdf", [build_table(data)])
+    write_pdf(docs / "sub" / "b.pdf", [build_table(data)])
+    out = tmp_path / "out"
+    manifest = tmp_path / "job.jsonl"
+    args = ["extract", str(docs), "--out", str(out), "--to", "csv", "--manifest", str(manifest)]
+
+    first = CliRunner().invoke(main, args)
+    assert first.exit_code == 0, first.output
+    entries = [json.loads(line) for line in manifest.read_text().splitlines()]
+    assert {entry["status"] for entry in entries} == {"ok"}
+    assert len(entries) == 2 and all(len(entry["sha256"]) == 64 for entry in entries)
+    assert any(path.name.startswith("sub__b_table_") for path in out.iterdir())
+
+    second = CliRunner().invoke(main, args)
+    assert second.exit_code == 0, second.output
+    assert "skipped (manifest)" in second.output
+    assert len(manifest.read_text().splitlines()) == 2
+
+    write_pdf(docs / "a.pdf", [build_table(data + [["Pears", "5"]])])
+    third = CliRunner().invoke(main, [*args, "--workers", "2"])
+    assert third.exit_code == 0, third.output
+    assert len(manifest.read_text().splitlines()) == 3
+
+
+def test_same_named_inputs_keep_separate_outputs(tmp_path):
+    data = [["Item", "Qty"], ["Apples", "3"]]
+    for folder in ("a", "c"):
+        (tmp_path / folder).mkdir()
+        write_pdf(tmp_path / folder / "x.pdf", [build_table(data)])
+    out = tmp_path / "out"
+
+    result = CliRunner().invoke(
+        main, ["extract", str(tmp_path / "a" / "x.pdf"), str(tmp_path / "c" / "x.pdf"), "--out", str(out), "--to", "csv"]
+    )
+
+    assert result.exit_code == 0, result.output
+    names = sorted(path.name for path in out.iterdir())
+    assert any(name.startswith("a__x_table_") for name in names)
+    assert any(name.startswith("c__x_table_") for name in names)
+
+
+def test_directory_reads_pdf_and_its_artifact_once(tmp_path):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    write_pdf(docs / "x.pdf", [build_table([["Item", "Qty"], ["Apples", "3"]])])
+    assert CliRunner().invoke(main, ["parse", str(docs / "x.pdf")]).exit_code == 0
+    manifest = tmp_path / "job.jsonl"
+
+    result = CliRunner().invoke(
+        main, ["extract", str(docs), "--out", str(tmp_path / "out"), "--manifest", str(manifest)]
+    )
+
+    assert result.exit_code == 0, result.output
+    (entry,) = [json.loads(line) for line in manifest.read_text().splitlines()]
+    assert entry["path"].endswith("x.tbz")
+
+
+def test_overlay_jobs_outlive_the_artifact(tmp_path):
+    pdf_path = write_pdf(tmp_path / "x.pdf", [build_table([["Item", "Qty"], ["Apples", "3"]])] * 3)
+    assert CliRunner().invoke(main, ["parse", str(pdf_path)]).exit_code == 0
+    settings = _ExtractSettings(
+        pages=None,
+        detector="plumber",
+        export_format="csv",
+        out=tmp_path / "out",
+        fill_policy="empty",
+        stitch_aggressiveness="low",
+        stitch_mode="sequential",
+        stitch_lookback=1,
+        prescreen=None,
+        grid_mode="auto",
+        template_cache=None,
+        inline_styles=False,
+        debug_overlays=True,
+        writer_threads=1,
+    )
+    immediate: list = []
+    _extract_document(tmp_path / "x.tbz", "x", settings, lambda render: immediate.extend(render()))
+    queued: list = []
+    outcome = _extract_document(tmp_path / "x.tbz", "x", settings, queued.append)
+
+    # a writer still busy with earlier documents runs the jobs after the artifact is closed
+    deferred = [item for render in queued for item in render()]
+    assert outcome.tables == len(queued) > 1
+    assert deferred == immediate
+    assert all("rgba(0, 0, 0, 0.25)" in text for name, text in deferred if name.endswith("_overlay.html"))
+
+
+def test_resume_keeps_bundle_and_reruns_other_outputs(tmp_path):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    data = [["Item", "Qty"], ["Apples", "3"]]
+    for name in ("a", "b"):
+        write_pdf(docs / f"{name}.pdf", [build_table(data)])
+    bundle = tmp_path / "all.ndjson"
+    manifest = tmp_path / "job.jsonl"
+    args = ["extract", str(docs), "--to", "csv", "--into", str(bundle), "--manifest", str(manifest)]
+
+    assert CliRunner().invoke(main, args).exit_code == 0
+    lines = bundle.read_text().splitlines()
+    assert lines and not len(lines) % 2
+
+    write_pdf(docs / "c.pdf", [build_table(data)])
+    second = CliRunner().invoke(main, args)
+    assert second.exit_code == 0, second.output
+    assert bundle.read_text().splitlines()[: len(lines)] == lines
+    assert len(bundle.read_text().splitlines()) == len(lines) * 3 // 2
+
+    out = tmp_path / "md"
+    third = CliRunner().invoke(
+        main, ["extract", str(docs), "--to", "md", "--out", str(out), "--manifest", str(manifest)]
+    )
+    assert third.exit_code == 0, third.output
+    assert len(list(out.glob("*.md"))) == len(lines) * 3 // 2
+
+
+def test_manifest_waits_for_written_output(tmp_path):
+    job = JobManifest(tmp_path / "job.jsonl")
+    source = tmp_path / "x.pdf"
+    source.write_bytes(b"%PDF")
+
+    def broken():
+        raise OSError("disk full")
+
+    with pytest.raises(OSError):
+        with TableWriter(tmp_path / "out", threads=1) as writer:
+            writer.submit(broken)
+            writer.after(lambda: job.record(source, "abc", status="ok", seconds=0.0))
+            writer.close()
+    assert not job.is_done(source, "abc")
+    assert not (tmp_path / "job.jsonl").exists()
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from shapely.geometry import box
+
+from tabbolt.geometry import (
+    bbox_envelope,
+    intersection_over_union,
+    iou_matrix,
+    merge_boxes,
+    overlap_mask,
+)
+
+
+def test_envelope_and_merge_boxes():
+    boxes = [(10.0, 20.0, 30.0, 40.0), (5.0, 25.0, 15.0, 50.0), (40.0, 0.0, 41.0, 1.0)]
+    assert bbox_envelope(boxes) == (5.0, 0.0, 41.0, 50.0)
+    assert merge_boxes(np.array(boxes)) == (5.0, 0.0, 41.0, 50.0)
+    with pytest.raises(ValueError):
+        bbox_envelope([])
+
+
+def test_iou_matches_shapely():
+    rng = np.random.default_rng(7)
+    corners = rng.uniform(0, 100, size=(40, 4))
+    boxes = np.column_stack(
+        [
+            np.minimum(corners[:, 0], corners[:, 2]),
+            np.minimum(corners[:, 1], corners[:, 3]),
+            np.maximum(corners[:, 0], corners[:, 2]),
+            np.maximum(corners[:, 1], corners[:, 3]),
+        ]
+    )
+    matrix = iou_matrix(boxes[:20], boxes[20:])
+    assert matrix.shape == (20, 20)
+    for i in range(20):
+        for j in range(20):
+            a, b = box(*boxes[i]), box(*boxes[20 + j])
+            expected = a.intersection(b).area / a.union(b).area
+            assert matrix[i, j] == pytest.approx(expected)
+    assert intersection_over_union((0, 0, 1, 1), (2, 2, 3, 3)) == 0.0
+    assert intersection_over_union((0, 0, 0, 0), (0, 0, 0, 0)) == 0.0
+
+
+def test_overlap_mask_counts_touching_boxes():
+    mask = overlap_mask([(0, 0, 1, 1), (5, 5, 6, 6)], [(1, 1, 2, 2), (7, 7, 8, 8)])
+    assert mask.tolist() == [[True, False], [False, False]]
+    assert overlap_mask([], [(0, 0, 1, 1)]).shape == (0, 1)
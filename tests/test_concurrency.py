@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tabbolt import extract
+from tabbolt.detect import PlumberDetector
+from tabbolt.plugins import entrypoints
+from tabbolt.plugins.entrypoints import get_detector
+
+from .utils_pdf import build_table, write_multipage, write_pdf
+
+
+class StatefulDetector:
+    """Keeps the current source on ``self``, so sharing it across threads breaks."""
+
+    name = "stateful"
+    version = "1.0"
+    reentrant = False
+    created = 0
+
+    def __init__(self):
+        type(self).created += 1
+        self._inner = PlumberDetector()
+        self._source = None
+
+    def detect(self, source, pages=None):
+        self._source = source
+        time.sleep(0.005)
+        assert self._source is source, "detector shared between threads"
+        return self._inner.detect(self._source, pages)
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    StatefulDetector.created = 0
+    monkeypatch.setattr(entrypoints, "_CACHE", {})
+    monkeypatch.setattr(
+        entrypoints, "_FACTORIES", {"plumber": PlumberDetector, "stateful": StatefulDetector}
+    )
+
+
+def _run_threads(func, count=8):
+    barrier = threading.Barrier(count)
+
+    def call():
+        barrier.wait()
+        return func()
+
+    with ThreadPoolExecutor(count) as pool:
+        return [future.result() for future in [pool.submit(call) for _ in range(count)]]
+
+
+def test_concurrent_lookup_shares_one_instance(registry):
+    detectors = _run_threads(lambda: get_detector("plumber"))
+
+    assert len({id(detector) for detector in detectors}) == 1
+
+
+def test_non_reentrant_detector_gets_one_instance_per_thread(registry):
+    pairs = _run_threads(lambda: (get_detector("stateful"), get_detector("stateful")))
+
+    assert all(first is second for first, second in pairs)
+    assert len({id(first) for first, _ in pairs}) == len(pairs)
+
+
+def test_concurrent_extract_matches_serial(tmp_path, registry):
+    sources = [
+        write_pdf(tmp_path / "a.pdf", [build_table([["Name", "Score"], ["Ada", "9"], ["Bob", "7"]])]),
+        write_pdf(
+            tmp_path / "b.pdf",
+            [build_table([["Merged", "", "Solo"], ["A1", "B1", "C1"]], spans=[(0, 0, 0, 1)])],
+        ),
+        write_multipage(
+            tmp_path / "c.pdf",
+            build_table([["Item", "Qty"], ["x", "1"]], grid=False),
+            build_table([["Item", "Qty"], ["y", "2"]], grid=False),
+        ),
+    ]
+    jobs = [(source, detector) for source in sources for detector in ("plumber", "stateful")] * 4
+
+    def run(job):
+        source, detector = job
+        return [table.model_dump() for table in extract(source, detector=detector).tables]
+
+    serial = {job: run(job) for job in set(jobs)}
+    with ThreadPoolExecutor(8) as pool:
+        concurrent = list(pool.map(run, jobs))
+
+    assert concurrent == [serial[job] for job in jobs]
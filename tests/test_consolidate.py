@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from tabbolt import extract
+from tabbolt.detect import DetectedRegion, PlumberDetector, consolidate_regions
+
+from .utils_pdf import build_table, write_pdf
+
+
+def _region(bbox, conf, page=1, lines=()):
+    return DetectedRegion(page=page, bbox=bbox, conf=conf, lines=list(lines), detector_version="t")
+
+
+class DoubleProposalDetector:
+    """Proposes every table twice: a tight box and a padded, less confident one."""
+
+    name = "double"
+    version = "1.0"
+
+    def detect(self, source, pages=None):
+        regions = PlumberDetector().detect(source, pages)
+        padded = [
+            r.model_copy(update={"bbox": (r.bbox[0] - 6, r.bbox[1] - 6, r.bbox[2] + 6, r.bbox[3] + 6), "conf": 0.5})
+            for r in regions
+        ]
+        return padded + regions
+
+
+def test_suppress_keeps_most_confident_proposal():
+    regions = [
+        _region((0, 0, 100, 50), 0.6),
+        _region((2, 1, 101, 52), 0.9),
+        _region((300, 0, 400, 50), 0.4),
+    ]
+    kept = consolidate_regions(regions, mode="suppress")
+
+    assert [r.conf for r in kept] == [0.9, 0.4]
+
+
+def test_merge_fuses_contained_proposal():
+    outer = _region((0, 0, 200, 100), 0.5, lines=[(0, 0, 200, 0)])
+    inner = _region((10, 10, 100, 50), 0.9, lines=[(10, 50, 100, 50)])
+    (fused,) = consolidate_regions([outer, inner])
+
+    assert fused.conf == 0.9
+    x0, y0, x1, y1 = fused.bbox
+    assert x0 <= 10 and y0 <= 10 and x1 >= 100 and y1 >= 50
+    assert sorted(fused.lines) == [(0, 0, 200, 0), (10, 50, 100, 50)]
+
+
+def test_pages_and_neighbours_stay_apart():
+    regions = [
+        _region((0, 0, 100, 50), 0.8, page=1),
+        _region((0, 0, 100, 50), 0.8, page=2),
+        _region((95, 0, 200, 50), 0.8, page=1),
+    ]
+
+    assert consolidate_regions(regions) == regions
+
+
+def test_overlapping_proposals_emit_one_table(tmp_path):
+    data = [["Name", "Score"], ["Ada", "9"]]
+    pdf_path = write_pdf(tmp_path / "table.pdf", [build_table(data, grid=False)])
+
+    single = extract(pdf_path)
+    double = extract(pdf_path, detector=DoubleProposalDetector())
+
+    assert double.stats["regions_merged"] == single.stats["regions"]
+    assert [t.as_matrix() for t in double.tables] == [t.as_matrix() for t in single.tables]
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import pdfplumber
+
+from tabbolt import extract
+from tabbolt.api import _WORD_OPTIONS, _overlaps, _region_words, _word_bbox
+from tabbolt.detect import DetectedRegion, PlumberDetector
+
+from reportlab.lib.pagesizes import letter
+from reportlab.pdfgen import canvas
+
+from .utils_pdf import build_table, write_with_prose
+
+
+class LowerHalfDetector:
+    """Keeps only plumber regions in the lower part of the page."""
+
+    name = "lower-half"
+    version = "1.0"
+
+    def __init__(self, extra=None):
+        self.extra = extra or []
+
+    def detect(self, source, pages=None):
+        regions = [r for r in PlumberDetector().detect(source, pages) if r.bbox[1] > 600]
+        return regions + [r.model_copy(update={"bbox": bbox}) for r in regions[:1] for bbox in self.extra]
+
+
+def test_cropped_words_match_full_page(tmp_path):
+    data = [["Code", "Amount"], ["A-1", "10.00"], ["B-2", "20.00"]]
+    pdf_path = write_with_prose(tmp_path / "prose.pdf", build_table(data))
+    for detector in (LowerHalfDetector(), LowerHalfDetector(extra=[(100.0, 40.0, 160.0, 52.0)])):
+        cropped = extract(pdf_path, detector=detector, crop_words=True)
+        full = extract(pdf_path, detector=detector, crop_words=False)
+        assert cropped.tables
+        assert cropped.to_json() == full.to_json()
+        tight = extract(pdf_path, detector=detector, crop_words=True, crop_padding=0.5)
+        assert tight.to_json() == full.to_json()
+
+
+def _side_notes(path, table):
+    """Draw ``table`` with a note on the same lines just right of it."""
+
+    width, height = letter
+    c = canvas.Canvas(str(path), pagesize=letter)
+    table.wrapOn(c, width, height)
+    _, table_height = table.wrap(width, height)
+    table.drawOn(c, 60, height - 100 - table_height)
+    c.setFont("Helvetica", 9)
+    for idx in range(8):
+        c.drawString(330, height - 112 - idx * 18 + idx % 3, f"note {idx} beside the table")
+    c.showPage()
+    c.save()
+    return path
+
+
+def test_cropped_words_match_full_page_at_any_padding(tmp_path):
+    data = [["Code", "Amount", "Note"]] + [[f"A-{i}", f"{i}.00", f"n{i}"] for i in range(8)]
+    sources = [
+        write_with_prose(tmp_path / "prose.pdf", build_table(data, grid=False)),
+        _side_notes(tmp_path / "notes.pdf", build_table(data, grid=False)),
+    ]
+    for pdf_path in sources:
+        full = extract(pdf_path)
+        assert full.tables
+        assert full.to_json() == extract(pdf_path, crop_words=False).to_json()
+        for padding in (0.0, 0.5, 3.0, 8.0, 24.0, 100.0):
+            cropped = extract(pdf_path, crop_words=True, crop_padding=padding)
+            assert cropped.to_json() == full.to_json(), padding
+
+
+def test_text_outside_crop_that_joins_lines_forces_full_page(tmp_path):
+    pdf_path = tmp_path / "chain.pdf"
+    c = canvas.Canvas(str(pdf_path), pagesize=letter)
+    c.setFont("Helvetica", 6)
+    c.drawString(100, 700, "alpha beta")
+    c.drawString(100, 695, "gamma delta")
+    # sits between the two lines, so pdfplumber clusters all three as one line
+    c.drawString(400, 697.5, "note")
+    c.save()
+    top = letter[1] - 710
+    region = DetectedRegion(page=1, bbox=(95.0, top, 160.0, top + 20.0), detector_version="test")
+
+    with pdfplumber.open(pdf_path) as pdf:
+        page = pdf.pages[0]
+        full = page.extract_words(**_WORD_OPTIONS)
+        for padding in (0.0, 2.0, 24.0):
+            words = _region_words(page, [region], padding)
+            assert [w for w in words if _overlaps(_word_bbox(w), region.bbox)] == [
+                w for w in full if _overlaps(_word_bbox(w), region.bbox)
+            ]
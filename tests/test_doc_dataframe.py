@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from tabbolt.export import doc_to_dataframe
+from tabbolt.models import Cell, DocResult, Table
+
+from .utils_tables import make_table
+
+
+def test_doc_to_dataframe_long_format():
+    merged = Table(
+        page=[3, 4],
+        cells=[
+            Cell(text="Total", bbox=(0, 0, 20, 10), row=0, col=0, colspan=2),
+            Cell(text="1", bbox=(0, 10, 10, 20), row=1, col=0),
+            Cell(text="2", bbox=(10, 10, 20, 20), row=1, col=1),
+        ],
+        n_rows=2,
+        n_cols=2,
+    )
+    result = DocResult(tables=[make_table(1, ["A", "B", "C"], 1), merged])
+
+    df = doc_to_dataframe(result)
+    assert len(df) == 9
+    assert df["table_id"].tolist() == [0] * 6 + [1] * 3
+    assert df.loc[6, ["page", "row", "col", "colspan", "x1", "text"]].tolist() == [3, 0, 0, 2, 20.0, "Total"]
+
+    categorical = doc_to_dataframe(result, categorical_text=True)
+    assert isinstance(categorical["text"].dtype, pd.CategoricalDtype)
+
+    wide = doc_to_dataframe(result, tidy=False)
+    assert wide.shape == (4, 6)
+    assert wide.iloc[2, 3:5].tolist() == ["Total", "Total"]
+    assert pd.isna(wide.iloc[2, 5])
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from tabbolt import extract, extract_partial, merge_partial_results
+from tabbolt.detect import PlumberDetector, furniture_masks
+
+from .utils_pdf import build_table, write_pdf, write_report_pages
+
+
+def _chars(text, x, top, size=9.0):
+    return [
+        {"text": ch, "x0": x + i * 5.0, "x1": x + i * 5.0 + 4.0, "top": top, "bottom": top + size, "size": size}
+        for i, ch in enumerate(text)
+    ]
+
+
+def test_repeated_margin_lines_are_flagged():
+    pages = [
+        (_chars("Annual Report", 40, 20) + _chars(f"body {n}", 40, 300) + _chars(f"Page {n + 1}", 290, 770), 792.0)
+        for n in range(5)
+    ]
+    masks = furniture_masks(pages)
+
+    header, body, footer = slice(0, 13), slice(13, 19), slice(19, None)
+    assert all(mask[header].all() and mask[footer].all() for mask in masks)
+    assert not any(mask[body].any() for mask in masks)
+
+
+def test_short_documents_keep_everything():
+    pages = [(_chars("Annual Report", 40, 20), 792.0)] * 2
+
+    assert not any(mask.any() for mask in furniture_masks(pages))
+
+
+def test_detector_drops_running_header_and_page_numbers(tmp_path):
+    data = [["Item", "Qty"], ["pen", "2"]]
+    pdf_path = write_report_pages(tmp_path / "report.pdf", build_table(data))
+
+    def texts(strip):
+        result = extract(pdf_path, detector=PlumberDetector(strip_furniture=strip))
+        return " ".join(cell.text for table in result.tables for cell in table.cells), result
+
+    kept, with_furniture = texts(False)
+    stripped, without_furniture = texts(True)
+    assert "Quarterly" in kept and "Page" in kept
+    assert "Quarterly" not in stripped and "Page" not in stripped
+    assert "pen" in stripped
+    assert without_furniture.stats["regions"] < with_furniture.stats["regions"]
+
+
+def test_repeated_table_header_rows_are_kept(tmp_path):
+    data = [["Name", "Qty", "Price"]] + [[f"item{i}", str(i), f"{i}.00"] for i in range(130)]
+
+    for grid in (True, False):
+        pdf_path = write_pdf(tmp_path / f"long_{grid}.pdf", [build_table(data, grid=grid)])
+        result = extract(pdf_path, detector=PlumberDetector(strip_furniture=True))
+        pages = {page for table in result.tables for page in table.page}
+        headers = [cell for table in result.tables for cell in table.cells if cell.text == "Name"]
+
+        assert len(pages) >= 3
+        assert len(headers) == len(pages)
+
+
+def test_shards_strip_the_same_furniture_as_a_full_run(tmp_path):
+    data = [["Item", "Qty"], ["pen", "2"], ["ink", "5"]]
+    pdf_path = write_report_pages(tmp_path / "report.pdf", build_table(data))
+    detector = PlumberDetector(strip_furniture=True)
+
+    full = extract(pdf_path, detector=detector)
+    shards = [extract_partial(pdf_path, pages=[page], detector=detector) for page in range(1, 5)]
+    merged = merge_partial_results(shards)
+
+    assert [t.model_dump() for t in merged.tables] == [t.model_dump() for t in full.tables]
+    texts = " ".join(cell.text for table in merged.tables for cell in table.cells)
+    assert "Quarterly" not in texts and "Page" not in texts
+    single = extract(pdf_path, pages=[2], detector=detector)
+    assert [t.model_dump() for t in single.tables] == [
+        t.model_dump() for t in full.tables if t.page == [2]
+    ]
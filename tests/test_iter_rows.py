@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import tracemalloc
+
+from tabbolt.export import iter_dataframes, table_to_csv, table_to_dataframe
+from tabbolt.models import Cell, Table
+
+
+def _ledger(n_rows: int) -> Table:
+    cells = []
+    for r in range(n_rows):
+        if r % 4 == 0:
+            cells.append(Cell(text=f"group{r}", bbox=(0, r, 10, r + 4), row=r, col=0, rowspan=4))
+        cells.append(Cell(text=f"r{r}", bbox=(10, r, 20, r + 1), row=r, col=1, colspan=2))
+    return Table(cells=cells, n_rows=n_rows, n_cols=3)
+
+
+def test_iter_rows_handles_spans_lazily():
+    table = _ledger(8)
+    rows = list(table.iter_rows(fill="repeat"))
+
+    assert rows == table.as_matrix(fill="repeat")
+    assert rows[3] == ["group0", "r3", "r3"]
+    assert list(table.iter_rows(fill="sentinel"))[3] == [None, "r3", None]
+    assert [cell.text if cell else None for cell in next(table.iter_cell_rows())] == [
+        "group0",
+        "r0",
+        None,
+    ]
+
+
+def test_iter_rows_memory_is_bounded():
+    table = _ledger(20_000)
+    tracemalloc.start()
+    for _ in table.iter_rows(fill="repeat"):
+        pass
+    _, streamed = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    table.as_matrix(fill="repeat")
+    _, materialized = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert streamed * 20 < materialized
+
+
+def test_chunked_exports_match():
+    table = _ledger(10)
+    frames = list(iter_dataframes(table, chunk_size=3))
+
+    assert [len(frame) for frame in frames] == [3, 3, 3, 1]
+    assert table_to_dataframe(table).values.tolist() == table.as_matrix(fill="repeat")
+    assert table_to_csv(table).splitlines()[5] == "group4,r5,r5"
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from tabbolt.resolve import apply_merges, build_grid
+
+
+def _word(text, x0, top, x1, bottom):
+    return {"text": text, "x0": x0, "top": top, "x1": x1, "bottom": bottom}
+
+
+def _ruled_grid(spans=None):
+    """Rects for a 3x3 grid of 60x20 cells; ``spans`` maps a top-left slot to (rowspan, colspan)."""
+
+    spans = spans or {}
+    covered = {
+        (r, c)
+        for (row, col), (rowspan, colspan) in spans.items()
+        for r in range(row, row + rowspan)
+        for c in range(col, col + colspan)
+    }
+    rects = []
+    for r in range(3):
+        for c in range(3):
+            if (r, c) in covered and (r, c) not in spans:
+                continue
+            rowspan, colspan = spans.get((r, c), (1, 1))
+            rects.append((c * 60.0, r * 20.0, (c + colspan) * 60.0, (r + rowspan) * 20.0))
+    return rects
+
+
+def test_lattice_takes_spans_from_rules():
+    rects = _ruled_grid({(0, 0): (1, 2), (1, 2): (2, 1)})
+    words = [
+        _word("Wide", 40.0, 5.0, 80.0, 15.0),
+        _word("Top", 125.0, 5.0, 155.0, 15.0),
+        _word("a", 20.0, 25.0, 30.0, 35.0),
+        _word("b", 80.0, 25.0, 90.0, 35.0),
+        _word("Tall", 130.0, 35.0, 150.0, 45.0),
+    ]
+    grid, candidates = build_grid(words, (0.0, 0.0, 180.0, 60.0), rects, 1.0)
+    cells = {(cell.row, cell.col): cell for cell in apply_merges(grid, candidates)}
+
+    assert grid.row_edges == [0.0, 20.0, 40.0, 60.0]
+    assert grid.col_edges == [0.0, 60.0, 120.0, 180.0]
+    assert (cells[(0, 0)].text, cells[(0, 0)].colspan) == ("Wide", 2)
+    assert (cells[(1, 2)].text, cells[(1, 2)].rowspan) == ("Tall", 2)
+    assert cells[(2, 1)].text == "" and cells[(2, 1)].bbox == (60.0, 40.0, 120.0, 60.0)
+    assert len(cells) == 7
+
+
+def test_multiline_cell_text_reads_by_line():
+    rects = _ruled_grid()
+    words = [
+        _word("two", 20.0, 11.0, 35.0, 18.0),
+        _word("line", 30.0, 2.0, 45.0, 9.0),
+        _word("one", 5.0, 2.0, 20.0, 9.0),
+    ]
+    grid, candidates = build_grid(words, (0.0, 0.0, 180.0, 60.0), rects, 1.0)
+
+    assert grid.spans is not None
+    assert [c.text for c in candidates] == ["one line two"]
+
+
+def test_unruled_region_falls_back_to_word_snapping():
+    words = [_word("a", 0.0, 0.0, 10.0, 10.0), _word("b", 50.0, 0.0, 60.0, 10.0)]
+    underline = [(0.0, 12.0, 60.0, 12.5)]
+    grid, _ = build_grid(words, (0.0, 0.0, 60.0, 12.5), underline, 1.0, mode="auto")
+
+    assert grid.spans is None
+    assert grid.n_cols == 2
+
+
+def test_words_mode_ignores_lattice():
+    grid, _ = build_grid([], (0.0, 0.0, 180.0, 60.0), _ruled_grid(), 1.0, mode="words")
+
+    assert grid.spans is None
+
+
+def _price_list():
+    rows = [("Name", "Qty", "Price"), ("Apple", "1", "2.00"), ("Pear", "3", "4.50")]
+    return [
+        _word(text, c * 60.0 + 10.0, r * 20.0 + 5.0, c * 60.0 + 40.0, r * 20.0 + 15.0)
+        for r, row in enumerate(rows)
+        for c, text in enumerate(row)
+    ]
+
+
+def test_box_and_header_rule_do_not_hide_columns():
+    frame = [(0.0, 0.0, 180.0, 60.0), (0.0, 20.0, 180.0, 20.0)]
+    grid, candidates = build_grid(_price_list(), (0.0, 0.0, 180.0, 60.0), frame, 1.0)
+    cells = apply_merges(grid, candidates)
+
+    assert grid.spans is None
+    assert (grid.n_rows, grid.n_cols) == (3, 3)
+    assert [c.text for c in sorted(cells, key=lambda c: (c.row, c.col))][3:6] == ["Apple", "1", "2.00"]
+
+    forced, _ = build_grid(_price_list(), (0.0, 0.0, 180.0, 60.0), frame, 1.0, mode="lattice")
+    assert forced.spans is not None and forced.n_cols == 1
+
+
+def test_column_rules_without_row_rules_keep_rows():
+    rules = [(0.0, 0.0, 180.0, 60.0), (0.0, 20.0, 180.0, 20.0), (60.0, 0.0, 60.0, 60.0), (120.0, 0.0, 120.0, 60.0)]
+    grid, _ = build_grid(_price_list(), (0.0, 0.0, 180.0, 60.0), rules, 1.0)
+
+    assert grid.spans is None
+    assert grid.n_rows == 3
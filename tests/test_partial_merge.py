@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from tabbolt import PartialResult, merge_partial_results
+from tabbolt.models import Table
+from tabbolt.resolve import split_open_head, stitch_tables
+
+from .utils_tables import make_table
+
+
+def _document() -> list[Table]:
+    ledger = ["Item", "Qty", "Price"]
+    return [
+        make_table(1, ledger, 2),
+        make_table(2, ledger, 2),
+        make_table(3, ledger, 2, x1=304.0),
+        make_table(3, ["Summary", "Total"], 1),
+        make_table(4, ledger, 2, x1=296.0),
+        make_table(5, ledger, 3),
+        make_table(6, ["Notes", "Ref"], 1),
+    ]
+
+
+def test_merged_shards_match_single_run():
+    expected = [t.model_dump() for t in stitch_tables(_document(), aggressiveness="med")]
+    for boundary in range(1, 7):
+        tables = _document()
+        shards = [
+            [t for t in tables if t.page[0] <= boundary],
+            [t for t in tables if t.page[0] > boundary],
+        ]
+        partials = []
+        for shard in reversed(shards):
+            head, closed = split_open_head(shard, aggressiveness="med")
+            part = PartialResult(pages=sorted({t.page[0] for t in shard}), head=head, tables=closed)
+            partials.append(PartialResult.model_validate_json(part.to_json()))
+        merged = merge_partial_results(partials)
+        assert [t.model_dump() for t in merged.tables] == expected
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import pdfplumber
+from reportlab.lib.pagesizes import letter
+from reportlab.pdfgen import canvas
+
+from tabbolt import extract
+from tabbolt.detect import screen_page
+
+from .utils_pdf import build_table, write_prose_pages, write_with_prose
+
+
+def test_prescreen_skips_prose_pages(tmp_path):
+    data = [["Code", "Amount", "Note"], ["A-1", "10.00", "x"], ["B-2", "20.00", "y"]]
+    for grid in (True, False):
+        pdf_path = write_prose_pages(tmp_path / f"prose_{grid}.pdf", build_table(data, grid=grid))
+        full = extract(pdf_path)
+        screened = extract(pdf_path, prescreen=0.2)
+        assert screened.stats["pages_screened"] == 3
+        assert screened.stats["pages_skipped"] == 2
+        expected = [t.to_json() for t in full.tables if t.page == [3]]
+        assert [t.to_json() for t in screened.tables] == expected
+        assert "pages_skipped" not in full.stats
+
+
+def test_screen_reads_content_streams_without_parsing_pages(tmp_path):
+    data = [["Item", "Qty", "Price"]] + [[f"item {i}", str(i), f"{i * 1.5:.2f}"] for i in range(20)]
+    pdf_path = write_prose_pages(tmp_path / "prose.pdf", build_table(data, grid=True))
+    with pdfplumber.open(pdf_path) as pdf:
+        screens = [screen_page(page, index) for index, page in enumerate(pdf.pages, 1)]
+        assert not any(hasattr(page, "_objects") for page in pdf.pages)
+        assert [screen.n_rules for screen in screens] == [
+            len(page.lines) + len(page.rects) for page in pdf.pages
+        ]
+    assert [screen.score for screen in screens] == [0.0, 0.0, 1.0]
+
+
+def test_screen_scores_unruled_table_among_prose(tmp_path):
+    data = [["Item", "Qty", "Price"]] + [[f"item {i}", str(i), f"{i * 1.5:.2f}"] for i in range(20)]
+    pdf_path = write_with_prose(tmp_path / "mixed.pdf", build_table(data, grid=False), lines=20)
+    with pdfplumber.open(pdf_path) as pdf:
+        screen = screen_page(pdf.pages[0], 1)
+    assert screen.n_rules == 0
+    assert screen.score >= 0.2
+
+
+def test_screen_ignores_curves_and_diagonal_strokes(tmp_path):
+    pdf_path = tmp_path / "chart.pdf"
+    c = canvas.Canvas(str(pdf_path), pagesize=letter)
+    c.drawString(72, 740, "Quarterly revenue grew steadily over the year.")
+    chart = c.beginPath()
+    chart.moveTo(100, 400)
+    for step, height in enumerate((430, 415, 480, 460, 520, 505, 560), 1):
+        chart.lineTo(100 + step * 40, height)
+    c.drawPath(chart, stroke=1, fill=0)
+    c.circle(300, 250, 60, stroke=1, fill=0)
+    c.bezier(100, 100, 200, 200, 300, 50, 400, 150)
+    c.showPage()
+    c.save()
+
+    with pdfplumber.open(pdf_path) as pdf:
+        screen = screen_page(pdf.pages[0], 1)
+    assert screen.n_rules == 0
+    assert screen.score == 0.0
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import pickle
+
+import numpy as np
+
+from tabbolt.detect import DetectedRegion
+
+
+def _region(**geometry):
+    return DetectedRegion(page=1, bbox=(0.0, 0.0, 50.0, 20.0), detector_version="1", **geometry)
+
+
+def test_lists_are_packed_and_unpacked_on_demand():
+    region = _region(lines=[(0.0, 10.0, 50.0, 10.0)], boxes=[(1.0, 2.0, 3.0, 4.0), (5.0, 2.0, 7.0, 4.0)])
+
+    assert region.line_array.dtype == np.float64 and region.line_array.shape == (1, 4)
+    assert region.box_array.dtype == np.float32 and region.box_array.shape == (2, 4)
+    assert region.lines == [(0.0, 10.0, 50.0, 10.0)]
+    assert region.boxes[1] == (5.0, 2.0, 7.0, 4.0)
+    assert _region().lines == [] and _region().box_array.shape == (0, 4)
+
+
+def test_arrays_are_taken_without_tuples():
+    boxes = np.arange(40, dtype=np.float32).reshape(10, 4)
+    region = _region(boxes=boxes)
+
+    assert np.shares_memory(region.box_array, boxes)
+
+
+def test_copy_dump_and_pickle_keep_geometry():
+    region = _region(lines=[(0.0, 10.0, 50.0, 10.0)])
+    moved = region.model_copy(update={"lines": [(0.0, 0.0, 0.0, 20.0)], "bbox": (0.0, 0.0, 60.0, 20.0)})
+
+    assert moved.lines == [(0.0, 0.0, 0.0, 20.0)] and region.lines == [(0.0, 10.0, 50.0, 10.0)]
+    assert pickle.loads(pickle.dumps(moved)) == moved
+    dumped = moved.model_dump()
+    assert dumped["lines"] == [(0.0, 0.0, 0.0, 20.0)] and "line_array" not in dumped
+    assert DetectedRegion.model_validate(dumped) == moved
+
+
+def test_lines_and_boxes_keep_their_field_names():
+    region = _region(lines=[(0.0, 10.0, 50.0, 10.0)], boxes=[(1.0, 2.0, 3.0, 4.0)])
+    dumped = region.model_dump()
+
+    assert set(dumped) == {"page", "bbox", "lines", "boxes", "conf", "detector_version"}
+    assert DetectedRegion.model_validate(dumped) == region
+    assert DetectedRegion.model_validate_json(region.model_dump_json()) == region
+
+    region.lines = [(0.0, 0.0, 0.0, 20.0)]
+    assert region.line_array.dtype == np.float64 and region.lines == [(0.0, 0.0, 0.0, 20.0)]
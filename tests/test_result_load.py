@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import pytest
+
+from tabbolt.models import Cell, DocResult, Table
+from tabbolt.wire import LazyDocResult
+
+
+def _result(n_tables: int = 3) -> DocResult:
+    tables = [
+        Table(
+            page=[index + 1],
+            cells=[
+                Cell(text=f"{index}:{r}{c}", bbox=(c * 10.0, r * 10.0, c * 10.0 + 9, r * 10.0 + 9), row=r, col=c)
+                for r in range(4)
+                for c in range(3)
+            ],
+            n_rows=4,
+            n_cols=3,
+        )
+        for index in range(n_tables)
+    ]
+    return DocResult(tables=tables, stats={"tables": n_tables}, warnings=[])
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_save_and_load(tmp_path, trusted):
+    result = _result()
+    result.save(tmp_path / "result.tbr")
+
+    loaded = DocResult.load(tmp_path / "result.tbr", trusted=trusted)
+
+    assert isinstance(loaded, DocResult)
+    assert loaded == result
+
+
+def test_lazy_load_decodes_tables_on_access(tmp_path):
+    result = _result()
+    result.save(tmp_path / "result.tbr")
+
+    with DocResult.load(tmp_path / "result.tbr", lazy=True) as lazy:
+        assert isinstance(lazy, LazyDocResult)
+        assert len(lazy.tables) == 3
+        assert lazy.stats == {"tables": 3}
+        assert lazy.tables._cache == [None, None, None]
+
+        assert lazy.tables[-1] == result.tables[2]
+        assert lazy.tables[-1] is lazy.tables[2]
+        assert lazy.tables._cache[:2] == [None, None]
+
+        assert lazy.materialize() == result
+
+
+def test_close_warns_while_the_mapping_is_exported(tmp_path):
+    _result().save(tmp_path / "result.tbr")
+
+    lazy = DocResult.load(tmp_path / "result.tbr", lazy=True)
+    exported = memoryview(lazy._mapping)
+    with pytest.warns(ResourceWarning, match="still referenced"):
+        lazy.close()
+    exported.release()
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / "result.tbr"
+    path.write_text(_result().to_json())
+
+    with pytest.raises(ValueError):
+        DocResult.load(path)
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from math import pi
+
+from tabbolt.geometry import infer_rotation, rotation_from_chars
+
+
+def test_infer_rotation_buckets():
+    assert infer_rotation([]) == 0.0
+    assert infer_rotation([88.0, 91.0, 0.0]) == pi / 2
+    assert infer_rotation([359.5, 0.5, 270.0]) == 0.0
+    assert infer_rotation([45.0]) == 0.0
+    assert infer_rotation([-90.0, 270.0, 180.0]) == 270 * pi / 180
+
+
+def test_infer_rotation_early_exit_keeps_majority():
+    angles = [90.0] * 3000 + [0.0] * 1000
+    assert infer_rotation(angles, batch_size=64) == pi / 2
+    assert infer_rotation(angles, batch_size=64, dominance=0.9) == pi / 2
+
+
+def test_rotation_from_sampled_chars():
+    chars = [{"angle": 180.0}] * 5000 + [{"angle": 0.0}] * 100
+    rot = rotation_from_chars(chars, 612.0, 792.0, sample_size=256, dominance=0.95)
+    assert rot.angle == pi
+    assert rotation_from_chars([{"size": 10.0}], 612.0, 792.0, sample_size=8).angle == 0.0
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from tabbolt.resolve import consolidate_rules
+
+
+def test_dashed_segments_merge_into_one_rule():
+    dashes = [(x * 2.0, 100.0, x * 2.0 + 1.5, 100.2) for x in range(200)]
+    dashes += [(x * 2.0, 100.3, x * 2.0 + 1.5, 100.5) for x in range(0, 200, 7)]
+
+    assert consolidate_rules(dashes, 1.0) == [(0.0, 100.0, 399.5, 100.5)]
+
+
+def test_cell_rects_collapse_to_grid_lines():
+    rects = [
+        (c * 50.0, r * 20.0, (c + 1) * 50.0, (r + 1) * 20.0) for r in range(10) for c in range(10)
+    ]
+    rules = consolidate_rules(rects, 1.0)
+
+    vertical = sorted(rule for rule in rules if rule[0] == rule[2])
+    horizontal = sorted(rule for rule in rules if rule[1] == rule[3])
+    assert len(rules) == 22 and len(rects) * 4 / len(rules) > 10
+    assert vertical[3] == (150.0, 0.0, 150.0, 200.0)
+    assert horizontal[-1] == (0.0, 200.0, 500.0, 200.0)
+
+
+def test_distant_segments_stay_separate():
+    segments = [(0.0, 10.0, 50.0, 10.0), (60.0, 10.0, 90.0, 10.0), (0.0, 30.0, 50.0, 30.0)]
+
+    assert sorted(consolidate_rules(segments, 2.0)) == sorted(segments)
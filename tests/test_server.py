@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from tabbolt import extract
+from tabbolt.server import ExtractionServer, LatencyHistogram, extract_remote
+
+from .utils_pdf import build_table, write_pdf
+
+
+def test_server_round_trip_and_metrics(tmp_path):
+    data = [["Item", "Qty"], ["Apples", "3"], ["Pears", "5"]]
+    pdf_path = write_pdf(tmp_path / "served.pdf", [build_table(data), build_table(data)])
+    server = ExtractionServer(port=0, workers=1)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        remote = extract_remote(pdf_path, server.url, pages=[1], stitch_aggressiveness="low")
+        assert remote.to_json() == extract(pdf_path, pages=[1], stitch_aggressiveness="low").to_json()
+
+        with urllib.request.urlopen(f"{server.url}/metrics") as response:
+            metrics = json.loads(response.read())
+        assert metrics["completed"] == 1
+        assert metrics["queue_depth"] == 0 and metrics["in_flight"] == 0
+        assert metrics["latency_seconds"]["count"] == 1
+    finally:
+        server.shutdown()
+
+
+def test_server_replaces_a_broken_pool(tmp_path):
+    pdf_path = write_pdf(tmp_path / "served.pdf", [build_table([["A", "B"], ["1", "2"]])])
+    server = ExtractionServer(port=0, workers=1)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        with pytest.raises(Exception):
+            server._pool.submit(os._exit, 1).result()
+        with pytest.raises(RuntimeError, match="500"):
+            extract_remote(pdf_path, server.url)
+
+        assert extract_remote(pdf_path, server.url).tables
+        assert server.metrics.snapshot()["pool_restarts"] == 1
+    finally:
+        server.shutdown()
+
+
+def test_server_rejects_oversized_bodies():
+    server = ExtractionServer(port=0, workers=1, max_body=16)
+    thread = threading.Thread(target=server._httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        request = urllib.request.Request(f"{server.url}/extract", data=b"x" * 64, method="POST")
+        with pytest.raises(urllib.error.HTTPError) as excinfo:
+            urllib.request.urlopen(request)
+        assert excinfo.value.code == 413
+        assert server.metrics.snapshot()["completed"] == 0
+    finally:
+        server.shutdown()
+
+
+def test_latency_histogram_is_cumulative():
+    histogram = LatencyHistogram((0.1, 1.0))
+    for seconds in (0.05, 0.5, 0.7, 3.0):
+        histogram.observe(seconds)
+
+    assert histogram.snapshot()["buckets"] == {"0.1": 1, "1.0": 3, "+Inf": 4}
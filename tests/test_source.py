@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import io
+import mmap
+
+from tabbolt import extract
+
+from .utils_pdf import build_table, write_pdf
+
+
+def test_in_memory_sources_match_path(tmp_path):
+    data = [["A", "B"], ["1", "2"]]
+    pdf_path = write_pdf(tmp_path / "source.pdf", [build_table(data)])
+    expected = extract(pdf_path).to_json()
+    payload = pdf_path.read_bytes()
+
+    assert extract(payload).to_json() == expected
+    assert extract(memoryview(payload)).to_json() == expected
+    assert extract(io.BytesIO(payload)).to_json() == expected
+    with open(pdf_path, "rb") as handle:
+        assert extract(handle).to_json() == expected
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            assert extract(mapped).to_json() == expected
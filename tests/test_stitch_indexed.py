@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import pytest
+
+from tabbolt.resolve import stitch_tables
+
+from .utils_tables import make_table
+
+
+def test_indexed_stitching_follows_interleaved_tables():
+    left, right = ["Item", "Qty"], ["Code", "Rate"]
+    tables = [
+        make_table(1, left, 2, x0=0.0, x1=250.0),
+        make_table(1, left, 2, x0=300.0, x1=550.0),
+        make_table(2, left, 2, x0=0.0, x1=250.0),
+        make_table(2, ["Summary"], 1),
+        make_table(2, left, 2, x0=300.0, x1=550.0),
+        make_table(3, right, 1),
+        make_table(4, left, 2, x0=0.0, x1=250.0),
+    ]
+    sequential = stitch_tables([t.model_copy(deep=True) for t in tables])
+    stitched = stitch_tables(tables, mode="indexed", lookback=1)
+    assert len(stitched) < len(sequential)
+    assert [t.page for t in stitched] == [[1, 2], [1, 2], [2], [3], [4]]
+    assert stitched[0].cells[0].bbox[0] == 0.0
+    assert stitched[1].cells[0].bbox[0] == 300.0
+    assert stitched[0].n_rows == stitched[1].n_rows == 5
+
+    wider = stitch_tables([t.model_copy(deep=True) for t in tables], mode="indexed", lookback=2)
+    assert [t.page for t in wider] == [[1, 2, 4], [1, 2], [2], [3]]
+
+
+def test_unknown_stitch_mode():
+    with pytest.raises(ValueError):
+        stitch_tables([make_table(1, ["A"], 1)], mode="fuzzy")
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from tabbolt.resolve import stitch_tables
+
+from .utils_tables import make_table
+
+
+def test_long_run_stitches_into_one_table():
+    pages = 120
+    tables = [make_table(page, ["Item", "Qty", "Price"], 5) for page in range(1, pages + 1)]
+    stitched = stitch_tables(tables, aggressiveness="low")
+    assert len(stitched) == 1
+    table = stitched[0]
+    assert table.page == list(range(1, pages + 1))
+    assert table.n_rows == 1 + pages * 5
+    assert len(table.cells) == table.n_rows * 3
+    assert [cell.row for cell in table.cells] == sorted(cell.row for cell in table.cells)
+    matrix = table.as_matrix()
+    assert matrix[1][0] == "p1r0c0"
+    assert matrix[-1][-1] == f"p{pages}r4c2"
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import io
+
+from tabbolt.export import (
+    iter_html,
+    table_to_html,
+    table_to_markdown,
+    tables_to_html,
+    write_markdown,
+    write_tables_html,
+)
+from tabbolt.models import Cell, Table
+
+
+def _table(n_rows: int) -> Table:
+    cells = [Cell(text="Total", bbox=(0, 0, 20, 1), row=0, col=0, colspan=2)]
+    cells += [
+        Cell(text=f"<{r}|{c}>", bbox=(c * 10, r, c * 10 + 10, r + 1), row=r, col=c)
+        for r in range(1, n_rows)
+        for c in range(2)
+    ]
+    return Table(cells=cells, n_rows=n_rows, n_cols=2)
+
+
+def test_streaming_html_matches_string_exporters():
+    table = _table(600)
+    chunks = list(iter_html(table, inline_styles=False))
+
+    assert len(chunks) > 2
+    assert "".join(chunks) == table_to_html(table, inline_styles=False)
+    assert '<td colspan="2" style="padding:4px;border:1px solid #999;">Total</td>' in table_to_html(table)
+    assert "&lt;1|0&gt;" in chunks[1]
+
+    sink = io.StringIO()
+    write_tables_html((_table(n) for n in (3, 4)), sink)
+    assert sink.getvalue() == tables_to_html([_table(3), _table(4)])
+
+
+def test_streaming_markdown_matches_string_exporter():
+    table = _table(600)
+    sink = io.StringIO()
+    write_markdown(table, sink)
+
+    assert sink.getvalue() == table_to_markdown(table)
+    assert sink.getvalue().splitlines()[1] == "| --- | --- |"
+    assert "\\|" in sink.getvalue().splitlines()[2]
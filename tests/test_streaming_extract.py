@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import json
+import zipfile
+
+from tabbolt import extract, iter_extract
+from tabbolt.export.writer import TableWriter
+from tabbolt.resolve import iter_stitched, stitch_tables
+
+from .utils_pdf import build_table, write_pdf
+from .utils_tables import make_table
+
+
+def test_iter_extract_matches_extract(tmp_path):
+    data = [["Item", "Qty"], ["Apples", "3"], ["Pears", "5"]]
+    pdf_path = write_pdf(tmp_path / "stream.pdf", [build_table(data), build_table(data)])
+    expected = extract(pdf_path)
+
+    stream = iter_extract(pdf_path)
+    tables = list(stream)
+
+    assert [table.to_json() for table in tables] == [table.to_json() for table in expected.tables]
+    assert stream.stats == expected.stats
+
+
+def test_iter_stitched_yields_closed_tables():
+    tables = [make_table(page, ["A", "B"], 2) for page in (1, 2)] + [make_table(3, ["C"], 1)]
+    stitched = iter_stitched(tables)
+
+    first = next(stitched)
+    assert first.page == [1, 2]
+    assert [first, *stitched] == stitch_tables(tables)
+
+
+def test_table_writer_bundles_in_order(tmp_path):
+    jobs = [lambda i=i: [(f"t{i}.csv", f"row{i}\n")] for i in range(20)]
+
+    with TableWriter(tmp_path / "dir", threads=3) as writer:
+        for job in jobs:
+            writer.submit(job)
+    assert (tmp_path / "dir" / "t7.csv").read_text() == "row7\n"
+
+    with TableWriter(tmp_path, into=tmp_path / "all.zip", threads=3) as writer:
+        for job in jobs:
+            writer.submit(job)
+    assert zipfile.ZipFile(tmp_path / "all.zip").namelist() == [f"t{i}.csv" for i in range(20)]
+
+    with TableWriter(tmp_path, into=tmp_path / "all.ndjson", threads=3) as writer:
+        for job in jobs:
+            writer.submit(job)
+    lines = (tmp_path / "all.ndjson").read_text().splitlines()
+    assert json.loads(lines[5]) == {"name": "t5.csv", "content": "row5\n"}
+    assert writer.files_written == 20
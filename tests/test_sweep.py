@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from tabbolt import DocResult, extract
+from tabbolt.artifact import ParsedPage
+from tabbolt.sweep import config_matrix, diff_results, sweep
+
+from .utils_pdf import build_table, write_multipage, write_pdf
+from .utils_tables import make_table
+
+
+def test_sweep_matches_extract_and_reports_diffs(tmp_path):
+    data = [["Item", "Qty"], ["Apples", "3"], ["Pears", "5"]]
+    pdf_path = write_pdf(tmp_path / "sweep.pdf", [build_table(data), build_table(data)])
+    configs = config_matrix(stitch_levels=["med", "low"], epsilons=[None, 50.0])
+
+    report = sweep([pdf_path, pdf_path.read_bytes()], configs, workers=4)
+
+    assert len(report.runs) == 2 * len(configs)
+    assert len(report.parse_seconds) == 2
+    for run in report.runs:
+        config = run.config
+        expected = extract(
+            pdf_path, stitch_aggressiveness=config.stitch_aggressiveness, epsilon=config.epsilon
+        )
+        assert run.result.to_json() == expected.to_json()
+        assert run.seconds >= 0
+    baseline = report.for_config(configs[0])
+    assert all(not run.diffs for run in baseline)
+    coarse = [run for run in report.runs if run.config.epsilon == 50.0]
+    assert all(table.meta["epsilon"] == 50.0 for run in coarse for table in run.result.tables)
+
+
+def test_diff_results_reports_structure():
+    baseline = DocResult(tables=[make_table(1, ["A", "B"], 1)])
+    changed = DocResult(tables=[make_table(1, ["A", "C"], 2), make_table(2, ["C"], 0)])
+
+    assert diff_results(baseline, baseline) == []
+    assert diff_results(baseline, changed) == [
+        "tables: 1 -> 2",
+        "table 1: shape 2x2 -> 3x2",
+        "table 1: cells changed=1 removed=0 added=2",
+    ]
+
+
+def test_runs_share_page_dicts(tmp_path, monkeypatch):
+    pdf_path = write_multipage(
+        tmp_path / "two.pdf", build_table([["A", "B"], ["1", "2"]]), build_table([["A", "B"], ["3", "4"]])
+    )
+    builds = []
+    original = ParsedPage._text_objects
+
+    def counted(self, *args):
+        builds.append(args[-1])
+        return original(self, *args)
+
+    monkeypatch.setattr(ParsedPage, "_text_objects", counted)
+    sweep([pdf_path], config_matrix(stitch_levels=["low", "med", "high"], epsilons=[None, 2.5]))
+
+    # chars and words of each of the two pages, once for all six runs
+    assert sorted(builds) == ["char", "char", "word", "word"]
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import pickle
+
+from tabbolt import extract
+from tabbolt.resolve import TemplateCache, apply_merges, build_grid
+
+from .utils_pdf import build_table, write_pdf
+
+BBOX = (0.0, 0.0, 240.0, 100.0)
+
+
+def _words(header, body):
+    rows = [header, *body]
+    return [
+        {"text": text, "x0": c * 60.0 + 10, "x1": c * 60.0 + 40, "top": r * 20.0 + 5, "bottom": r * 20.0 + 15}
+        for r, row in enumerate(rows)
+        for c, text in enumerate(row)
+    ]
+
+
+def _texts(cells):
+    return sorted((cell.row, cell.col, cell.rowspan, cell.colspan, cell.text) for cell in cells)
+
+
+def test_matching_layout_reuses_template():
+    cache = TemplateCache()
+    header = ["Item", "Qty", "Price", "Total"]
+    first = _words(header, [["pen", "2", "1.50", "3.00"], ["ink", "1", "4.00", "4.00"]])
+    second = _words(header, [["pad", "5", "2.00", "10.00"], ["cap", "3", "0.50", "1.50"]])
+
+    *_, hit = cache.resolve(first, BBOX, [], 1.0)
+    grid, cells, hit_again = cache.resolve(second, BBOX, [], 1.0)
+
+    fresh_grid, candidates = build_grid(second, BBOX, [], 1.0)
+    assert (hit, hit_again) == (False, True)
+    assert grid.row_edges == fresh_grid.row_edges and grid.col_edges == fresh_grid.col_edges
+    assert _texts(cells) == _texts(apply_merges(fresh_grid, candidates))
+    assert cache.stats == {"hits": 1, "misses": 1, "stores": 1, "evictions": 0, "size": 1}
+
+
+def test_hit_infers_merges_from_the_new_words():
+    cache = TemplateCache()
+    header = ["Item", "Qty", "Price", "Total"]
+    cache.resolve(_words(header, [["pen", "2", "1.50", "3.00"], ["ink", "1", "4.00", "4.00"]]), BBOX, [], 1.0)
+    second = _words(header, [["pad", "5", "2.00", "10.00"], ["", "", "", "1.50"]])
+    # one wide word across columns 0-2, centred on column 1
+    second[-4].update(text="Subtotal carried forward", x0=10.0, x1=160.0)
+    second = [word for word in second if word["text"]]
+
+    grid, cells, hit = cache.resolve(second, BBOX, [], 1.0)
+
+    fresh_grid, candidates = build_grid(second, BBOX, [], 1.0)
+    expected = _texts(apply_merges(fresh_grid, candidates))
+    assert hit
+    assert (2, 0, 1, 3, "Subtotal carried forward") in expected
+    assert _texts(cells) == expected
+
+
+def test_different_header_or_rows_miss():
+    cache = TemplateCache()
+    body = [["a", "b", "c", "d"]]
+    cache.resolve(_words(["W", "X", "Y", "Z"], body), BBOX, [], 1.0)
+
+    *_, other_header = cache.resolve(_words(["W", "X", "Y", "Q"], body), BBOX, [], 1.0)
+    *_, more_rows = cache.resolve(_words(["W", "X", "Y", "Z"], body * 2), BBOX, [], 1.0)
+
+    assert not other_header and not more_rows
+    assert cache.stats["misses"] == 3
+
+
+def test_lru_evicts_oldest_template():
+    cache = TemplateCache(capacity=2)
+    body = [["1", "2", "3", "4"]]
+    for name in ("A", "B", "C"):
+        cache.resolve(_words([name, "x", "y", "z"], body), BBOX, [], 1.0)
+
+    *_, hit = cache.resolve(_words(["A", "x", "y", "z"], body), BBOX, [], 1.0)
+
+    assert not hit
+    assert cache.stats["evictions"] == 2 and cache.stats["size"] == 2
+
+
+def test_disk_store_is_shared(tmp_path):
+    path = tmp_path / "templates.sqlite"
+    words = _words(["Item", "Qty", "Price", "Total"], [["pen", "2", "1.50", "3.00"]])
+    writer = TemplateCache(path)
+    writer.resolve(words, BBOX, [], 1.0)
+    writer.close()
+
+    # a pickled cache is what worker processes receive
+    reader = pickle.loads(pickle.dumps(TemplateCache(path)))
+    *_, hit = reader.resolve(words, BBOX, [], 1.0)
+
+    assert hit and reader.stats["size"] == 1
+
+
+def test_extract_reports_template_hits(tmp_path):
+    data = [["Header 1", "Header 2"], ["R1C1", "R1C2"]]
+    pdf_path = write_pdf(tmp_path / "table.pdf", [build_table(data)])
+    cache = TemplateCache()
+
+    first = extract(pdf_path, templates=cache)
+    second = extract(pdf_path, templates=cache)
+
+    assert first.stats["template_hits"] == 0
+    assert second.stats["template_hits"] == second.stats["regions"]
+    assert [t.as_matrix() for t in second.tables] == [t.as_matrix() for t in first.tables]
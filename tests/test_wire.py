@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import pickle
+
+import pytest
+
+from tabbolt import extract
+from tabbolt.models import Cell, DocResult, Table
+from tabbolt.wire import MAGIC, collect_result, share_result
+
+from .utils_pdf import build_table, write_pdf
+
+
+def _result() -> DocResult:
+    cells = [
+        Cell(text="Name", bbox=(0.5, 1.0, 50.0, 12.0), row=0, col=0),
+        Cell(text="Größe ✓", bbox=(50.0, 1.0, 99.25, 12.0), row=0, col=1, conf=0.75),
+        Cell(text="", bbox=(0.5, 12.0, 99.25, 24.0), row=1, col=0, colspan=2),
+    ]
+    tables = [
+        Table(
+            page=[1, 2],
+            cells=cells,
+            n_rows=2,
+            n_cols=2,
+            title="Sizes",
+            meta={"epsilon": 2.5},
+            page_size=(612.0, 792.0),
+        ),
+        Table(page=[3], cells=[], n_rows=0, n_cols=0),
+    ]
+    return DocResult(tables=tables, stats={"tables": 2}, warnings=["check"])
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_bytes_round_trip(trusted):
+    result = _result()
+
+    decoded = DocResult.from_bytes(result.to_bytes(), trusted=trusted)
+
+    assert decoded == result
+    assert decoded.to_json() == result.to_json()
+    assert decoded.tables[0].cells[1].bbox == (50.0, 1.0, 99.25, 12.0)
+
+
+def test_untrusted_payload_is_validated():
+    payload = bytearray(_result().to_bytes())
+    payload[:4] = b"XXXX"
+
+    with pytest.raises(ValueError):
+        DocResult.from_bytes(payload)
+
+
+def test_pickle_and_shared_memory(tmp_path):
+    pdf_path = write_pdf(tmp_path / "table.pdf", [build_table([["A", "B"], ["1", "2"]])])
+    result = extract(pdf_path)
+
+    # pickles stay plain pydantic; only explicit from_bytes may skip validation
+    assert MAGIC not in pickle.dumps(result)
+    assert pickle.loads(pickle.dumps(result)) == result
+    assert collect_result(share_result(result)) == result
@@ -52,4 +52,61 @@ def write_rotated(path: Path, table: Table, *, page_size=letter) -> Path:
     return path
 
 
-__all__ = ["build_table", "write_pdf", "write_multipage", "write_rotated"]
+def write_with_prose(path: Path, table: Table, *, lines: int = 40, page_size=letter) -> Path:
+    """Draw ``table`` below ``lines`` of running prose on a single page."""
+
+    width, height = page_size
+    c = canvas.Canvas(str(path), pagesize=page_size)
+    c.setFont("Helvetica", 9)
+    for idx in range(lines):
+        c.drawString(40, height - 40 - idx * 11, f"Line {idx} of running prose that fills the page " * 2)
+    table.wrapOn(c, width, height)
+    table.drawOn(c, 200, 60)
+    c.showPage()
+    c.save()
+    return path
+
+
+def write_prose_pages(path: Path, table: Table, *, prose_pages: int = 2, page_size=letter) -> Path:
+    """Write ``prose_pages`` pages of running prose followed by a page with ``table``."""
+
+    width, height = page_size
+    c = canvas.Canvas(str(path), pagesize=page_size)
+    for page in range(prose_pages):
+        c.setFont("Helvetica", 9)
+        for idx in range(50):
+            words = " ".join(f"word{(page * 7 + idx * 3 + k) % 11}" for k in range(14))
+            c.drawString(40, height - 40 - idx * 11, words)
+        c.showPage()
+    table.wrapOn(c, width, height)
+    table.drawOn(c, 60, height - 200)
+    c.showPage()
+    c.save()
+    return path
+
+
+def write_report_pages(path: Path, table: Table, *, pages: int = 4, page_size=letter) -> Path:
+    """Write ``pages`` pages, each with ``table``, a running header and a page number."""
+
+    width, height = page_size
+    c = canvas.Canvas(str(path), pagesize=page_size)
+    for page in range(pages):
+        c.setFont("Helvetica", 9)
+        c.drawString(40, height - 30, "Quarterly Report - Internal")
+        c.drawCentredString(width / 2, 20, f"Page {page + 1} of {pages}")
+        table.wrapOn(c, width, height)
+        table.drawOn(c, 60, height - 300)
+        c.showPage()
+    c.save()
+    return path
+
+
+__all__ = [
+    "build_table",
+    "write_pdf",
+    "write_multipage",
+    "write_rotated",
+    "write_with_prose",
+    "write_prose_pages",
+    "write_report_pages",
+]
@@ -0,0 +1,27 @@
+"""Utilities for building synthetic tables without a PDF."""
+from __future__ import annotations
+
+from typing import Sequence
+
+from tabbolt.models import Cell, Table
+
+
+def make_table(
+    page: int, header: Sequence[str], rows: int, x1: float = 300.0, *, x0: float = 0.0
+) -> Table:
+    texts = [list(header)] + [[f"p{page}r{r}c{c}" for c in range(len(header))] for r in range(rows)]
+    step = (x1 - x0) / len(header)
+    cells = [
+        Cell(
+            text=text,
+            bbox=(x0 + c * step, r * 10.0, x0 + (c + 1) * step, (r + 1) * 10.0),
+            row=r,
+            col=c,
+        )
+        for r, row in enumerate(texts)
+        for c, text in enumerate(row)
+    ]
+    return Table(page=[page], cells=cells, n_rows=len(texts), n_cols=len(header))
+
+
+__all__ = ["make_table"]